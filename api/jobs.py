@@ -0,0 +1,201 @@
+"""
+비동기 백테스트 작업 — 프로세스 풀에 제출하고 작업 ID 로 상태·결과를 조회합니다.
+
+시뮬레이션은 Flask 요청 스레드가 아닌 별도 프로세스(BACKTEST_WORKERS 개, 낮은
+스케줄링 우선순위)에서 실행되어 대화형 API 응답을 막지 않습니다. 작업 ID 는 작업
+명세의 해시이므로 같은 명세를 다시 제출하면 진행 중이거나 완료된 같은 작업을
+돌려받습니다 (실패했거나 BACKTEST_RESULT_TTL 이 지난 작업만 다시 실행).
+단계별 진행률은 Manager 공유 dict 로 워커에서 부모로 전달됩니다.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from api.serializers import backtest_to_dict
+from backtest.engine import run
+from config import BACKTEST_MAX_JOBS, BACKTEST_RESULT_TTL, BACKTEST_WORKERS
+from data.fetcher import get_provider
+from data.providers import DataProvider
+from indicators.engine import DEFAULT_PARAMS
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+QUEUED, RUNNING, DONE, FAILED = "queued", "running", "done", "failed"
+
+
+class JobsUnavailable(RuntimeError):
+    """작업을 받을 수 없음 (대기·실행 작업이 가득 찼거나 풀이 죽어 다시 만드는 중)"""
+
+
+@dataclass
+class Job:
+    id: str
+    spec: dict
+    status: str = QUEUED
+    submitted_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+    result: Optional[dict] = None
+    error: Optional[str] = None
+    crashed: bool = False           # 입력·데이터 문제가 아니라 워커 프로세스가 죽어 실패함
+    future: Optional[Future] = field(default=None, repr=False)
+
+    def to_dict(self, progress: Optional[tuple[str, float]] = None) -> dict:
+        stage, fraction = progress or ((None, 1.0) if self.status == DONE else (None, 0.0))
+        return {
+            "job_id": self.id,
+            "spec": self.spec,
+            "status": self.status,
+            "stage": stage,
+            "progress": fraction,
+            "submitted_at": self.submitted_at,
+            "finished_at": self.finished_at,
+            "elapsed": round((self.finished_at or time.time()) - self.submitted_at, 3),
+            "error": self.error,
+        }
+
+
+def job_id(spec: dict) -> str:
+    """작업 명세(+ 지표 파라미터)의 해시 — 같은 명세는 같은 ID."""
+    source = json.dumps(spec, sort_keys=True) + repr(DEFAULT_PARAMS)
+    return hashlib.sha1(source.encode("utf-8")).hexdigest()[:16]
+
+
+def _init_worker() -> None:
+    # 대화형 요청을 처리하는 Flask 프로세스보다 낮은 우선순위로 실행합니다.
+    if hasattr(os, "nice"):
+        os.nice(10)
+
+
+def _run_job(job_id: str, spec: dict, provider: DataProvider, progress: Any) -> dict:
+    def report(stage: str, fraction: float) -> None:
+        progress[job_id] = (stage, fraction)
+
+    result = run(
+        spec["ticker"], spec["start"], spec["end"],
+        initial_capital=spec["initial_capital"], provider=provider, progress=report,
+    )
+    report("done", 1.0)
+    return backtest_to_dict(result)
+
+
+class JobManager:
+    """백테스트 작업 큐 (스레드 안전). 풀과 Manager 는 첫 제출 때 만듭니다."""
+
+    def __init__(
+        self,
+        workers: int = BACKTEST_WORKERS,
+        max_jobs: int = BACKTEST_MAX_JOBS,
+        result_ttl: float = BACKTEST_RESULT_TTL,
+    ) -> None:
+        self.workers = workers
+        self.max_jobs = max_jobs
+        self.result_ttl = result_ttl
+        self._jobs: dict[str, Job] = {}
+        self._lock = threading.Lock()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._manager: Optional[Any] = None
+        self._progress: Optional[Any] = None
+
+    def _ensure_pool(self) -> None:
+        if self._pool is None:
+            self._manager = multiprocessing.Manager()
+            self._progress = self._manager.dict()
+            self._pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker)
+
+    def submit(self, spec: dict) -> tuple[Job, bool]:
+        """작업을 제출합니다. 반환: (작업, 새로 제출했는지 여부)."""
+        key = job_id(spec)
+        with self._lock:
+            self._prune()
+            job = self._jobs.get(key)
+            if job is not None and job.status != FAILED:
+                return job, False
+            if sum(j.finished_at is None for j in self._jobs.values()) >= self.max_jobs:
+                raise JobsUnavailable(f"대기·실행 중인 작업이 {self.max_jobs}개로 가득 찼습니다")
+            self._ensure_pool()
+            job = Job(id=key, spec=spec)
+            try:
+                job.future = self._pool.submit(_run_job, key, spec, get_provider(), self._progress)
+            except BrokenProcessPool:
+                # 워커가 비정상 종료하면 풀은 더 이상 작업을 받지 않으므로 버리고 새로 만듭니다.
+                logger.error("백테스트 프로세스 풀 손상 - 다시 만듭니다")
+                self._reset_pool()
+                self._ensure_pool()
+                raise JobsUnavailable("백테스트 작업 풀을 다시 시작했습니다. 잠시 후 다시 제출하세요")
+            self._jobs[key] = job
+        job.future.add_done_callback(lambda f, job=job: self._finish(job, f))
+        logger.info("백테스트 작업 제출: %s %s", key, spec)
+        return job, True
+
+    def _finish(self, job: Job, future: Future) -> None:
+        with self._lock:
+            job.finished_at = time.time()
+            try:
+                job.result = future.result()
+                job.status = DONE
+            except Exception as exc:
+                job.error = str(exc) or type(exc).__name__
+                job.status = FAILED
+                job.crashed = isinstance(exc, BrokenProcessPool)
+                logger.error("백테스트 작업 실패: %s - %s", job.id, job.error)
+            if self._progress is not None:
+                self._progress.pop(job.id, None)
+
+    def get(self, key: str) -> Optional[Job]:
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is not None and job.status == QUEUED and job.future is not None and job.future.running():
+                job.status = RUNNING
+            return job
+
+    def status(self, key: str) -> Optional[dict]:
+        """작업 상태와 진행률. 없는 작업이면 None."""
+        job = self.get(key)
+        if job is None:
+            return None
+        progress = None
+        if job.status in (QUEUED, RUNNING) and self._progress is not None:
+            progress = self._progress.get(key)
+            if progress is not None and job.status == QUEUED:
+                job.status = RUNNING
+        return job.to_dict(progress)
+
+    def _prune(self) -> None:
+        """
+        만료된 완료 작업을 지우고, 그래도 많으면 오래된 완료 작업부터 지웁니다.
+
+        대기·실행 중인 작업은 지우지 않으며, 그 수가 max_jobs 에 이르면 submit 이 거절합니다.
+        """
+        now = time.time()
+        finished = [j for j in self._jobs.values() if j.finished_at is not None]
+        for j in finished:
+            if now - j.finished_at > self.result_ttl:
+                del self._jobs[j.id]
+        excess = len(self._jobs) - self.max_jobs + 1
+        if excess > 0:
+            for j in sorted((j for j in finished if j.id in self._jobs), key=lambda j: j.finished_at)[:excess]:
+                del self._jobs[j.id]
+
+    def _reset_pool(self) -> None:
+        pool, manager = self._pool, self._manager
+        self._pool = self._manager = self._progress = None
+        if pool is not None:
+            pool.shutdown(wait=False)
+        if manager is not None:
+            manager.shutdown()
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._manager.shutdown()
+            self._pool = self._manager = self._progress = None
@@ -0,0 +1,133 @@
+"""
+분석 결과 캐시 — 인코딩된 응답 본문(과 ETag·gzip 본문), 지표가 계산된 프레임을
+프로세스 메모리에 보관합니다.
+
+항목은 (종목, 기간, 형식, 지표 파라미터) 키로 저장되고, 만료 시각은 종목의
+거래소 정규장 여부에 따라 정합니다 (장중에는 짧게, 장 마감 후에는 다음 개장까지).
+용량은 항목 수가 아니라 본문 바이트 합계로 제한하며, 넘치면 가장 오래 쓰지 않은
+항목부터 내보냅니다 (LRU).
+"""
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Hashable, Optional
+
+import pandas as pd
+
+from config import RESULT_CACHE_MAX_BYTES, RESULT_CACHE_TTL_CLOSED, RESULT_CACHE_TTL_OPEN
+from utils.market import seconds_until_open
+
+
+def session_ttl(ticker: str, now: Optional[datetime] = None) -> float:
+    """장중이면 RESULT_CACHE_TTL_OPEN, 장 마감 후에는 다음 개장까지 (최대 RESULT_CACHE_TTL_CLOSED)."""
+    until_open = seconds_until_open(ticker, now)
+    if until_open <= 0:
+        return float(RESULT_CACHE_TTL_OPEN)
+    return float(min(until_open, RESULT_CACHE_TTL_CLOSED))
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """인코딩된 분석 응답. gzipped 는 본문이 작아 압축하지 않았으면 None."""
+
+    body: bytes
+    etag: str
+    gzipped: Optional[bytes] = None
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.body) + len(self.gzipped or b"")
+
+
+@dataclass(frozen=True)
+class CachedAnalysis:
+    """지표가 계산된 전체 프레임과 신호. 증분(since) 응답을 재계산 없이 잘라 만듭니다."""
+
+    frame: pd.DataFrame
+    signals: list = field(default_factory=list)
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.frame.memory_usage(index=True).sum()) + 256 * len(self.signals)
+
+
+class ResultCache:
+    """바이트 예산 기반 LRU + TTL 캐시 (스레드 안전)."""
+
+    def __init__(self, max_bytes: int = RESULT_CACHE_MAX_BYTES) -> None:
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, tuple[Any, float, int]] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """유효한 값을 반환하고 최근 사용으로 표시합니다. 없거나 만료되면 None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] <= time.monotonic():
+                self._remove(key)
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def __contains__(self, key: Hashable) -> bool:
+        """만료되지 않은 항목이 있는지 — 카운터와 LRU 순서는 바꾸지 않습니다."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and entry[1] > time.monotonic()
+
+    def put(self, key: Hashable, value: Any, ttl: float, size: Optional[int] = None) -> None:
+        """
+        값을 저장합니다. 예산을 넘으면 LRU 항목부터 내보냅니다.
+
+        size 를 생략하면 len(value) (bytes 본문의 길이)를 크기로 사용합니다.
+        """
+        size = len(value) if size is None else size
+        if size > self.max_bytes or ttl <= 0:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, time.monotonic() + ttl, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        """적중/실패/축출 카운터와 현재 사용량."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+    def _remove(self, key: Hashable) -> None:
+        _, _, size = self._entries.pop(key)
+        self._bytes -= size
@@ -1,19 +1,55 @@
 from __future__ import annotations
 
+import hashlib
+import itertools
 import math
 import os
+import re
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import date
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional, TypeVar
 
 import pandas as pd
-from flask import Blueprint, Response, jsonify, request
-
-from data.fetcher import DataFetchError, fetch_ohlcv
+from flask import Blueprint, Response, current_app, g, jsonify, request, send_file
+
+from api.jobs import DONE, FAILED, JobManager, JobsUnavailable
+from api.result_cache import CachedAnalysis, CachedResponse, ResultCache, session_ttl
+from api.serializers import (
+    body_response,
+    encode_batch,
+    encode_json,
+    frame_to_payload,
+    gzip_body,
+    json_response,
+    signals_to_list,
+    sse_event,
+)
+from config import (
+    BATCH_MAX_TICKERS,
+    BATCH_WORKERS,
+    DEFAULT_CAPITAL,
+    PROFILE_API,
+    PROFILE_DIR,
+    RESULT_CACHE_ENABLED,
+    SCAN_MAX_WATCHERS,
+    SCAN_POLL_INTERVAL,
+    SCAN_WORKERS,
+    SSE_KEEPALIVE,
+    load_watchlist,
+)
+from data.fetcher import DataFetchError, fetch_multiple, fetch_ohlcv
 from data.processor import InsufficientDataError, clean, validate
-from indicators.bollinger import add_bollinger
-from indicators.macd import add_macd
-from indicators.moving_average import add_ma
-from indicators.rsi import add_rsi
-from signals.generator import generate
+from indicators.engine import DEFAULT_PARAMS
+from signals.generator import generate_with_indicators
 from utils.logger import get_logger
+from utils import profiling
+from utils.metrics import REGISTRY, current_ticker, span
+from utils.profiling import ProfilerBusy, profile_session
+from utils.singleflight import SingleFlight
 
 logger = get_logger(__name__)
 api_bp = Blueprint("api", __name__)
@@ -22,99 +58,25 @@ _BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 _WATCHLIST_FILE = os.path.join(_BASE_DIR, "watchlist.txt")
 
 _VALID_PERIODS = {"1mo", "3mo", "6mo", "1y"}
+_VALID_FORMATS = {"rows", "columns", "latest"}
+_PROFILE_NAME = re.compile(r"[0-9A-Za-z._-]+")
 
+T = TypeVar("T")
 
-# ─── helpers ────────────────────────────────────────────────────────────────
+_result_cache: Optional[ResultCache] = ResultCache() if RESULT_CACHE_ENABLED else None
+_analyze_flights = SingleFlight()
+_jobs = JobManager()
 
-def _safe_float(val: object) -> float | None:
-    """numpy / pandas 숫자 → Python float. NaN 은 None 으로 반환합니다."""
-    if val is None:
-        return None
-    try:
-        f = float(val)
-        return None if math.isnan(f) else round(f, 4)
-    except (TypeError, ValueError):
-        return None
+# watch 스트림은 연결마다 스레드를 붙잡고 주기적으로 전체를 재스캔하므로 동시 연결 수를 제한합니다.
+_watchers = 0
+_watchers_lock = threading.Lock()
 
 
-def _df_to_ohlcv(df: pd.DataFrame) -> list[dict]:
-    records = []
-    for ts, row in df.iterrows():
-        volume = row.get("Volume")
-        records.append({
-            "date": ts.strftime("%Y-%m-%d"),
-            "open": _safe_float(row.get("Open")),
-            "high": _safe_float(row.get("High")),
-            "low": _safe_float(row.get("Low")),
-            "close": _safe_float(row.get("Close")),
-            "volume": int(volume) if volume is not None and pd.notna(volume) else None,
-        })
-    return records
-
-
-def _df_to_indicators(df: pd.DataFrame) -> dict:
-    ma_list, rsi_list, macd_list, bb_list = [], [], [], []
-
-    for ts, row in df.iterrows():
-        date_str = ts.strftime("%Y-%m-%d")
-
-        ma_list.append({
-            "date": date_str,
-            "ma5": _safe_float(row.get("MA5")),
-            "ma20": _safe_float(row.get("MA20")),
-            "ma60": _safe_float(row.get("MA60")),
-        })
-
-        rsi_list.append({
-            "date": date_str,
-            "value": _safe_float(row.get("RSI")),
-        })
-
-        macd_val = _safe_float(row.get("MACD"))
-        sig_val = _safe_float(row.get("MACD_signal"))
-        hist = round(macd_val - sig_val, 4) if (macd_val is not None and sig_val is not None) else None
-        macd_list.append({
-            "date": date_str,
-            "macd": macd_val,
-            "signal": sig_val,
-            "histogram": hist,
-        })
-
-        bb_list.append({
-            "date": date_str,
-            "upper": _safe_float(row.get("BB_upper")),
-            "mid": _safe_float(row.get("BB_mid")),
-            "lower": _safe_float(row.get("BB_lower")),
-        })
-
-    return {"ma": ma_list, "rsi": rsi_list, "macd": macd_list, "bollinger": bb_list}
-
-
-def _signals_to_list(signals: list) -> list[dict]:
-    result = []
-    for s in signals:
-        date_str = s.date.strftime("%Y-%m-%d") if hasattr(s.date, "strftime") else str(s.date)
-        result.append({
-            "date": date_str,
-            "type": s.signal.value,
-            "reason": s.reason,
-            "price": round(float(s.price), 4),
-            "stop_loss": round(float(s.stop_loss), 4) if s.stop_loss is not None else None,
-            "target": round(float(s.target), 4) if s.target is not None else None,
-        })
-    return result
-
-
-def _read_watchlist() -> list[str]:
-    tickers: list[str] = []
-    if not os.path.exists(_WATCHLIST_FILE):
-        return tickers
-    with open(_WATCHLIST_FILE, encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if line and not line.startswith("#"):
-                tickers.append(line)
-    return tickers
+# ─── helpers ────────────────────────────────────────────────────────────────
+
+def read_watchlist() -> list[str]:
+    """API 가 쓰는 watchlist.txt (프로젝트 루트) 의 종목 목록 — 예열 스케줄러도 사용합니다."""
+    return load_watchlist(_WATCHLIST_FILE)
 
 
 def _write_watchlist(tickers: list[str]) -> None:
@@ -124,55 +86,577 @@ def _write_watchlist(tickers: list[str]) -> None:
             f.write(f"{t}\n")
 
 
+def _etag(ticker: str, period: str, fmt: str, df: pd.DataFrame) -> str:
+    """
+    분석 응답의 ETag — 종목·기간·형식·지표 파라미터와 마지막 봉으로 결정됩니다.
+
+    장중에는 날짜가 같아도 마지막 봉 값이 바뀌므로 그 OHLCV 도 함께 반영합니다.
+    """
+    last = df.iloc[-1]
+    source = "|".join([
+        ticker, period, fmt, repr(DEFAULT_PARAMS), df.index[-1].strftime("%Y-%m-%d"),
+        *(repr(float(last[c])) for c in ["Open", "High", "Low", "Close", "Volume"]),
+    ])
+    return hashlib.sha1(source.encode("utf-8")).hexdigest()[:20]
+
+
+def _latest_signal(signals: list) -> Optional[dict]:
+    return signals_to_list(signals[-1:])[0] if signals else None
+
+
+def _memoize(key: tuple, ticker: str, build: Callable[[], T], force: bool = False) -> T:
+    """
+    결과 캐시를 먼저 보고, 없으면 같은 키의 동시 요청과 build() 한 번을 공유합니다.
+
+    force=True 이면 캐시를 보지 않고 다시 계산해 덮어씁니다 (캐시 예열). 이미 진행 중인
+    일반 계산은 갱신 전 데이터를 읽었을 수 있으므로 합류하지 않고 별도 키로 계산합니다.
+    프로파일링 중인 요청도 실제 계산이 잡히도록 캐시를 보지 않습니다.
+    """
+    force = force or profiling.is_active()
+    cached = _result_cache.get(key) if _result_cache is not None and not force else None
+    if cached is not None:
+        return cached
+
+    def compute() -> T:
+        value = build()
+        if _result_cache is not None:
+            _result_cache.put(key, value, session_ttl(ticker), size=value.nbytes)
+        return value
+
+    return _analyze_flights.do(("force", key) if force else key, compute)
+
+
+def _analysis(
+    ticker: str, period: str, df: Optional[pd.DataFrame] = None, refresh: bool = False
+) -> CachedAnalysis:
+    """
+    수집 → 지표/신호 계산 결과를 (종목, 기간) 단위로 캐시해 반환합니다.
+
+    응답 형식(rows/columns/latest/since)이 달라도 지표 계산은 이 한 번을 공유합니다.
+    df 를 주면 수집을 건너뜁니다 (일괄 분석에서 미리 모아 둔 데이터).
+    refresh=True 이면 결과 캐시와 OHLCV 캐시를 모두 건너뛰고 새로 수집·계산합니다.
+    """
+    def build() -> CachedAnalysis:
+        data = fetch_ohlcv(ticker, period, refresh=refresh) if df is None else df
+        with current_ticker(ticker):
+            data = clean(data)
+        validate(data)
+        # 지표는 한 번만 계산해 차트와 신호가 같은 프레임을 공유합니다.
+        frame, signals = generate_with_indicators(data, ticker)
+        return CachedAnalysis(frame=frame, signals=signals)
+
+    return _memoize(("frame", ticker, period, DEFAULT_PARAMS), ticker, build, force=refresh)
+
+
+def _analyze_response(
+    ticker: str, period: str, fmt: str, df: Optional[pd.DataFrame] = None
+) -> CachedResponse:
+    """
+    지표/신호를 직렬화·압축한 응답을 반환합니다.
+
+    fmt 가 "latest" 이면 차트 데이터 없이 마지막 종가와 최근 신호만 담습니다.
+    """
+    analysis = _analysis(ticker, period, df)
+    frame, signals = analysis.frame, analysis.signals
+
+    result = {
+        "ticker": ticker,
+        "period": period,
+        "format": fmt,
+        "last_updated": frame.index[-1].strftime("%Y-%m-%d"),
+    }
+    with span("serialize", ticker):
+        if fmt == "latest":
+            result["last_close"] = round(float(frame["Close"].iloc[-1]), 4)
+            result["signal"] = _latest_signal(signals)
+        else:
+            result.update(frame_to_payload(frame, columnar=fmt == "columns"))
+            result["signals"] = signals_to_list(signals)
+        body = encode_json(result)
+        gzipped = gzip_body(body)
+    return CachedResponse(body=body, etag=_etag(ticker, period, fmt, frame), gzipped=gzipped)
+
+
+def _cached_analyze(
+    ticker: str, period: str, fmt: str, df: Optional[pd.DataFrame] = None
+) -> CachedResponse:
+    """형식별 인코딩 응답을 캐시에서 찾거나 만들어 반환합니다."""
+    return _memoize(
+        (ticker, period, fmt, DEFAULT_PARAMS), ticker,
+        lambda: _analyze_response(ticker, period, fmt, df),
+    )
+
+
+def refresh_ticker(ticker: str, period: str, formats: Iterable[str] = ("rows",)) -> None:
+    """
+    종목의 분석 프레임과 형식별 응답을 새로 계산해 결과 캐시에 채웁니다 (캐시 예열용).
+
+    실패 시 예외를 그대로 올립니다. 기존 캐시 항목은 성공한 경우에만 교체됩니다.
+    """
+    _analysis(ticker, period, refresh=True)
+    for fmt in formats:
+        _memoize(
+            (ticker, period, fmt, DEFAULT_PARAMS), ticker,
+            lambda: _analyze_response(ticker, period, fmt), force=True,
+        )
+
+
+def _delta_response(ticker: str, period: str, fmt: str, since: pd.Timestamp) -> CachedResponse:
+    """
+    캐시된 분석 프레임에서 since 이후 봉·지표·신호만 잘라 응답을 만듭니다.
+
+    지표는 전체 기간으로 계산된 값을 그대로 쓰므로 전체 응답의 같은 날짜 값과 같고,
+    직렬화는 잘라낸 구간에 대해서만 수행합니다.
+    """
+    analysis = _analysis(ticker, period)
+    frame = analysis.frame
+    tail = frame.iloc[frame.index.searchsorted(since, side="right"):]
+    with span("serialize", ticker):
+        result = {
+            "ticker": ticker,
+            "period": period,
+            "format": fmt,
+            "since": since.strftime("%Y-%m-%d"),
+            "last_updated": frame.index[-1].strftime("%Y-%m-%d"),
+            **frame_to_payload(tail, columnar=fmt == "columns"),
+            "signals": signals_to_list([s for s in analysis.signals if pd.Timestamp(s.date) > since]),
+        }
+        body = encode_json(result)
+        gzipped = gzip_body(body)
+    etag = _etag(ticker, period, f"{fmt}|since={since.date()}", frame)
+    return CachedResponse(body=body, etag=etag, gzipped=gzipped)
+
+
+def _analyze_one(
+    ticker: str, period: str, fmt: str, df: Optional[pd.DataFrame] = None
+) -> tuple[Optional[CachedResponse], Optional[str]]:
+    """일괄/스트림용 — (응답, None) 또는 (None, 실패 사유). 예외를 밖으로 내지 않습니다."""
+    try:
+        return _cached_analyze(ticker, period, fmt, df), None
+    except (DataFetchError, InsufficientDataError) as exc:
+        return None, str(exc)
+    except Exception as exc:
+        logger.error("Unexpected error for %s: %s", ticker, exc)
+        return None, "Internal server error"
+
+
+def _scan(tickers: list[str], period: str) -> Iterator[tuple[str, Optional[CachedResponse], Optional[str]]]:
+    """
+    종목을 스레드 풀에서 분석하며 끝나는 순서대로 (종목, latest 응답, 실패 사유)를 내보냅니다.
+
+    동시에 제출하는 작업은 SCAN_WORKERS * 2 개로 제한해, 종목 수와 관계없이 대기 중인
+    결과가 쌓이지 않습니다. 소비자가 중단하면 남은 종목은 제출하지 않습니다.
+    """
+    remaining = iter(tickers)
+    workers = max(1, min(SCAN_WORKERS, len(tickers)))
+    in_flight: dict[Future, str] = {}
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        def submit(ticker: str) -> None:
+            in_flight[pool.submit(_analyze_one, ticker, period, "latest")] = ticker
+
+        for ticker in itertools.islice(remaining, workers * 2):
+            submit(ticker)
+        while in_flight:
+            done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                ticker = in_flight.pop(future)
+                cached, error = future.result()
+                yield ticker, cached, error
+                following = next(remaining, None)
+                if following is not None:
+                    submit(following)
+
+
+def _acquire_watcher() -> bool:
+    global _watchers
+    with _watchers_lock:
+        if _watchers >= SCAN_MAX_WATCHERS:
+            return False
+        _watchers += 1
+        return True
+
+
+def _release_watcher() -> None:
+    global _watchers
+    with _watchers_lock:
+        _watchers -= 1
+
+
+def _signal_key(ticker: str, period: str) -> Optional[tuple]:
+    """종목의 최근 신호를 비교용 (날짜, 종류) 로 반환합니다 (캐시된 분석 사용)."""
+    try:
+        signals = _analysis(ticker, period).signals
+    except Exception:
+        return None
+    return (str(signals[-1].date), signals[-1].signal.value) if signals else None
+
+
+def _send(cached: CachedResponse) -> Response:
+    """If-None-Match 가 일치하면 304, 클라이언트가 gzip 을 받으면 압축 본문을 보냅니다."""
+    if request.if_none_match.contains_weak(cached.etag):
+        response = Response(status=304)
+    elif cached.gzipped is not None and request.accept_encodings["gzip"]:
+        response = body_response(cached.gzipped)
+        response.headers["Content-Encoding"] = "gzip"
+    else:
+        response = body_response(cached.body)
+    # 압축 여부와 무관하게 같은 내용이므로 약한(weak) ETag 를 사용합니다.
+    response.set_etag(cached.etag, weak=True)
+    response.headers["Cache-Control"] = "no-cache"
+    response.vary.add("Accept-Encoding")
+    return response
+
+
+# ─── profiling ──────────────────────────────────────────────────────────────
+
+def _profile_enabled() -> bool:
+    return bool(current_app.config.get("PROFILE_API", PROFILE_API))
+
+
+def _profile_dir() -> str:
+    return current_app.config.get("PROFILE_DIR", PROFILE_DIR)
+
+
+@api_bp.before_request
+def _start_profile() -> None:
+    """?profile=1 또는 X-Profile: 1 요청을 프로파일링합니다 (PROFILE_API 가 켜진 경우만)."""
+    flag = request.args.get("profile") or request.headers.get("X-Profile")
+    if flag in (None, "", "0") or not _profile_enabled():
+        return
+    stack = ExitStack()
+    try:
+        g.profile = stack.enter_context(
+            profile_session(f"api-{request.endpoint}", out_dir=_profile_dir(), wait=False)
+        )
+    except ProfilerBusy:
+        g.profile = None
+        return
+    g.profile_stack = stack
+
+
+@api_bp.after_request
+def _finish_profile(response: Response) -> Response:
+    if "profile" not in g:
+        return response
+    stack = g.pop("profile_stack", None)
+    if stack is None:
+        response.headers["X-Profile"] = "busy"
+        return response
+    # 스트리밍 응답은 본문 생성 전에 끝나므로 뷰 함수 실행까지만 잡힙니다.
+    stack.close()
+    report = g.profile.report
+    response.headers["X-Profile"] = report.name
+    response.headers["X-Profile-Time"] = f"{report.wall:.4f}"
+    logger.info("프로파일 저장: %s", report.summary_path)
+    return response
+
+
+@api_bp.teardown_request
+def _abort_profile(exc: Optional[BaseException]) -> None:
+    # 뷰에서 처리되지 않은 예외가 나면 after_request 를 거치지 않으므로 여기서 닫습니다.
+    stack = g.pop("profile_stack", None)
+    if stack is not None:
+        stack.close()
+
+
 # ─── routes ─────────────────────────────────────────────────────────────────
 
 @api_bp.route("/analyze")
 def analyze() -> Response:
-    """GET /api/analyze?ticker=AAPL&period=1y"""
+    """
+    GET /api/analyze?ticker=AAPL&period=1y&format=rows|columns|latest[&since=YYYY-MM-DD]
+
+    since 를 주면 그 날짜 이후의 봉·지표·신호만 반환합니다 (증분 갱신용).
+    ETag / If-None-Match (304) 와 Accept-Encoding: gzip 을 지원합니다.
+    """
     ticker = request.args.get("ticker", "").strip().upper()
     period = request.args.get("period", "1y")
+    fmt = request.args.get("format", "rows")
 
     if not ticker:
         return jsonify({"error": "ticker is required"}), 400
 
     if period not in _VALID_PERIODS:
         period = "1y"
+    if fmt not in _VALID_FORMATS:
+        fmt = "rows"
+
+    since = request.args.get("since")
+    if since:
+        # 시간대가 붙은 값은 시간대 없는 일봉 인덱스와 비교할 수 없으므로 날짜만 받습니다.
+        try:
+            since_ts = pd.Timestamp(date.fromisoformat(since))
+        except ValueError:
+            return jsonify({"error": "since must be YYYY-MM-DD"}), 400
+        if fmt == "latest":
+            fmt = "rows"
 
     try:
-        df = fetch_ohlcv(ticker, period)
-        df = clean(df)
-        validate(df)
-
-        chart_df = add_ma(df)
-        chart_df = add_rsi(chart_df)
-        chart_df = add_macd(chart_df)
-        chart_df = add_bollinger(chart_df)
-
-        signals = generate(df, ticker)
-
-        result = {
-            "ticker": ticker,
-            "period": period,
-            "last_updated": df.index[-1].strftime("%Y-%m-%d"),
-            "ohlcv": _df_to_ohlcv(chart_df),
-            "indicators": _df_to_indicators(chart_df),
-            "signals": _signals_to_list(signals),
-        }
-        return jsonify(result)
+        if since:
+            return _send(_delta_response(ticker, period, fmt, since_ts))
+        return _send(_cached_analyze(ticker, period, fmt))
 
     except DataFetchError as exc:
         return jsonify({"error": str(exc)}), 404
     except InsufficientDataError as exc:
         return jsonify({"error": str(exc)}), 400
     except Exception as exc:
-        logger.error(f"Unexpected error for {ticker}: {exc}")
+        logger.error("Unexpected error for %s: %s", ticker, exc)
         return jsonify({"error": "Internal server error"}), 500
 
 
+@api_bp.route("/analyze/batch", methods=["POST"])
+def analyze_batch() -> Response:
+    """
+    POST /api/analyze/batch  body: {"tickers": [...], "period": "1y",
+                                    "format": "rows|columns", "latest_only": false}
+
+    캐시에 없는 종목은 한 번에 모아 수집한 뒤 스레드 풀에서 병렬로 계산하고,
+    종목별 결과(results)와 실패 사유(errors)를 한 응답으로 반환합니다.
+    latest_only 이면 종목마다 마지막 종가와 최근 신호만 담습니다.
+    """
+    body = request.get_json(silent=True)
+    if not isinstance(body, dict):
+        return jsonify({"error": "body must be a JSON object"}), 400
+    raw = body.get("tickers")
+    if not isinstance(raw, list) or not raw:
+        return jsonify({"error": "tickers must be a non-empty list"}), 400
+    tickers = list(dict.fromkeys(str(t).strip().upper() for t in raw if str(t).strip()))
+    if len(tickers) > BATCH_MAX_TICKERS:
+        return jsonify({"error": f"최대 {BATCH_MAX_TICKERS}개 종목까지 요청할 수 있습니다"}), 400
+
+    # 문자열이 아닌 값(리스트 등)은 집합 조회에서 TypeError 가 나므로 기본값으로 둡니다.
+    period = body.get("period", "1y")
+    if not isinstance(period, str) or period not in _VALID_PERIODS:
+        period = "1y"
+    fmt = "latest" if body.get("latest_only") else body.get("format", "rows")
+    if not isinstance(fmt, str) or fmt not in _VALID_FORMATS:
+        fmt = "rows"
+
+    # 응답 본문도 분석 결과(frame)도 캐시에 없는 종목만 공급자 일괄 수집으로 한 번에 모읍니다.
+    missing = [
+        t for t in tickers
+        if _result_cache is None or not (
+            (t, period, fmt, DEFAULT_PARAMS) in _result_cache
+            or ("frame", t, period, DEFAULT_PARAMS) in _result_cache
+        )
+    ]
+    fetch_errors: dict[str, DataFetchError] = {}
+    frames = fetch_multiple(missing, period=period, bulk=True, errors=fetch_errors) if missing else {}
+
+    def run(ticker: str) -> tuple[Optional[CachedResponse], Optional[str]]:
+        if ticker in fetch_errors:
+            return None, str(fetch_errors[ticker])
+        return _analyze_one(ticker, period, fmt, frames.get(ticker))
+
+    results: dict[str, bytes] = {}
+    errors: dict[str, str] = {}
+    with ThreadPoolExecutor(max_workers=max(1, min(BATCH_WORKERS, len(tickers)))) as pool:
+        for ticker, (cached, error) in zip(tickers, pool.map(run, tickers)):
+            if cached is not None:
+                results[ticker] = cached.body
+            else:
+                errors[ticker] = error
+
+    payload = encode_batch({"period": period, "format": fmt, "errors": errors}, results)
+    zipped = gzip_body(payload) if request.accept_encodings["gzip"] else None
+    if zipped is None:
+        return body_response(payload)
+    response = body_response(zipped)
+    response.headers["Content-Encoding"] = "gzip"
+    response.vary.add("Accept-Encoding")
+    return response
+
+
+@api_bp.route("/scan/stream")
+def scan_stream() -> Response:
+    """
+    GET /api/scan/stream?tickers=AAPL,MSFT&period=1y&watch=1  (text/event-stream)
+
+    tickers 를 생략하면 watchlist 전체를 스캔합니다. 이벤트:
+      start  {"total", "period"}            — 즉시
+      result 종목별 latest 응답               — 분석이 끝나는 순서대로
+      error  {"ticker", "error"}
+      done   {"total", "errors", "elapsed"}
+      signal 종목별 latest 응답               — watch=1: 재스캔에서 최근 신호가 바뀐 종목
+    watch=1 이면 SCAN_POLL_INTERVAL 초마다 다시 스캔하며 연결을 유지합니다.
+    watch 연결이 이미 SCAN_MAX_WATCHERS 개면 503 을 반환합니다.
+    """
+    raw = request.args.get("tickers", "")
+    tickers = [t.strip().upper() for t in raw.split(",") if t.strip()] if raw else read_watchlist()
+    tickers = list(dict.fromkeys(tickers))
+    period = request.args.get("period", "1y")
+    if period not in _VALID_PERIODS:
+        period = "1y"
+    watch = request.args.get("watch", "0") not in ("", "0", "false")
+    if watch and not _acquire_watcher():
+        return jsonify({"error": "watch 연결이 너무 많습니다. 잠시 후 다시 시도하세요"}), 503
+
+    def events() -> Iterator[bytes]:
+        started = time.monotonic()
+        yield sse_event("start", encode_json({"total": len(tickers), "period": period}))
+
+        last_signal: dict[str, Optional[tuple]] = {}
+        errors = 0
+        for ticker, cached, error in _scan(tickers, period):
+            if cached is None:
+                errors += 1
+                yield sse_event("error", encode_json({"ticker": ticker, "error": error}))
+                continue
+            last_signal[ticker] = _signal_key(ticker, period)
+            yield sse_event("result", cached.body)
+        yield sse_event("done", encode_json({
+            "total": len(tickers), "errors": errors,
+            "elapsed": round(time.monotonic() - started, 3),
+        }))
+
+        while watch:
+            # 대기 중에도 연결 유지용 주석을 보내, 끊긴 클라이언트를 빨리 감지합니다.
+            deadline = time.monotonic() + SCAN_POLL_INTERVAL
+            while time.monotonic() < deadline:
+                time.sleep(min(SSE_KEEPALIVE, max(deadline - time.monotonic(), 0)))
+                yield b": keep-alive\n\n"
+            for ticker, cached, _ in _scan(tickers, period):
+                if cached is None:
+                    continue
+                key = _signal_key(ticker, period)
+                if key is not None and key != last_signal.get(ticker):
+                    last_signal[ticker] = key
+                    yield sse_event("signal", cached.body)
+
+    response = Response(events(), mimetype="text/event-stream")
+    response.headers["Cache-Control"] = "no-cache"
+    response.headers["X-Accel-Buffering"] = "no"   # 프록시 버퍼링 방지
+    if watch:
+        # 제너레이터가 시작되기 전에 끊겨도 슬롯이 반환되도록 응답 종료 시점에 풉니다.
+        response.call_on_close(_release_watcher)
+    return response
+
+
+@api_bp.route("/warm/status")
+def warm_status() -> Response:
+    """GET /api/warm/status — 캐시 예열 스케줄러 상태와 마지막 실행 소요 시간"""
+    warmer = current_app.extensions.get("cache_warmer")
+    if warmer is None:
+        return jsonify({"enabled": False})
+    return jsonify({"enabled": True, **warmer.status()})
+
+
+@api_bp.route("/backtest", methods=["POST"])
+def submit_backtest() -> Response:
+    """
+    POST /api/backtest  body: {"ticker": "AAPL", "start": "2024-01-01", "end": "2024-12-31",
+                               "initial_capital": 1000000}
+
+    작업을 프로세스 풀에 넣고 바로 202 와 작업 ID 를 반환합니다. 같은 명세의 작업이
+    이미 있으면 새로 실행하지 않고 그 작업을 돌려줍니다.
+    """
+    body = request.get_json(silent=True)
+    if not isinstance(body, dict):
+        return jsonify({"error": "body must be a JSON object"}), 400
+    ticker = str(body.get("ticker", "")).strip().upper()
+    if not ticker:
+        return jsonify({"error": "ticker is required"}), 400
+    try:
+        start = date.fromisoformat(str(body.get("start", "")))
+        end = date.fromisoformat(str(body.get("end", "")))
+        initial_capital = float(body.get("initial_capital", DEFAULT_CAPITAL))
+    except (TypeError, ValueError):
+        return jsonify({"error": "start/end must be YYYY-MM-DD, initial_capital a number"}), 400
+    if start > end or not math.isfinite(initial_capital) or initial_capital <= 0:
+        return jsonify({"error": "start must not be after end, initial_capital must be a positive number"}), 400
+
+    spec = {
+        "ticker": ticker,
+        "start": start.isoformat(),
+        "end": end.isoformat(),
+        "initial_capital": initial_capital,
+    }
+    try:
+        job, created = _jobs.submit(spec)
+    except JobsUnavailable as exc:
+        return jsonify({"error": str(exc)}), 503
+    status = _jobs.status(job.id)
+    return jsonify({
+        **status,
+        "deduplicated": not created,
+        "status_url": f"/api/backtest/{job.id}",
+        "result_url": f"/api/backtest/{job.id}/result",
+    }), 202
+
+
+@api_bp.route("/backtest/<job_id>", methods=["GET"])
+def backtest_status(job_id: str) -> Response:
+    """GET /api/backtest/<job_id> — 상태(queued/running/done/failed)와 진행률"""
+    status = _jobs.status(job_id)
+    if status is None:
+        return jsonify({"error": f"unknown job {job_id}"}), 404
+    return jsonify(status)
+
+
+@api_bp.route("/backtest/<job_id>/result", methods=["GET"])
+def backtest_result(job_id: str) -> Response:
+    """
+    GET /api/backtest/<job_id>/result — 완료 시 BacktestResult, 진행 중이면 202
+
+    입력·데이터 문제로 실패한 작업은 200 과 {"status": "failed", "error"} 를,
+    워커 프로세스가 죽어 실패한 작업은 503 을 반환합니다 (다시 제출하면 새로 실행).
+    """
+    job = _jobs.get(job_id)
+    if job is None:
+        return jsonify({"error": f"unknown job {job_id}"}), 404
+    if job.status == FAILED:
+        failed = jsonify({"job_id": job_id, "status": job.status, "error": job.error})
+        return (failed, 503) if job.crashed else failed
+    if job.status != DONE:
+        return jsonify(_jobs.status(job_id)), 202
+    return json_response({"job_id": job_id, "status": job.status, "result": job.result})
+
+
+@api_bp.route("/cache/stats")
+def cache_stats() -> Response:
+    """GET /api/cache/stats — 분석 결과 캐시 적중/실패/축출 및 요청 병합 카운터"""
+    if _result_cache is None:
+        return jsonify({"enabled": False})
+    return jsonify({"enabled": True, **_result_cache.stats(), "coalesced": _analyze_flights.coalesced})
+
+
+@api_bp.route("/metrics")
+def metrics() -> Response:
+    """GET /api/metrics — 단계·종목별 소요 시간 히스토그램 (Prometheus 텍스트 형식)"""
+    text = REGISTRY.render_prometheus()
+    if _result_cache is not None:
+        stats = _result_cache.stats()
+        text += "".join(
+            f"# TYPE stock_result_cache_{name} {kind}\nstock_result_cache_{name} {stats[key]}\n"
+            for name, key, kind in (
+                ("hits_total", "hits", "counter"),
+                ("misses_total", "misses", "counter"),
+                ("evictions_total", "evictions", "counter"),
+                ("bytes", "bytes", "gauge"),
+            )
+        )
+    return Response(text, content_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+@api_bp.route("/profile/<name>")
+def profile_report(name: str) -> Response:
+    """GET /api/profile/<name>[?format=prof] — 프로파일 요약 텍스트 또는 .prof 파일"""
+    if not _profile_enabled():
+        return jsonify({"error": "profiling is disabled"}), 404
+    suffix = ".prof" if request.args.get("format") == "prof" else ".txt"
+    path = Path(_profile_dir()).resolve() / f"{name}{suffix}"
+    if not _PROFILE_NAME.fullmatch(name) or not path.is_file():
+        return jsonify({"error": f"unknown profile {name}"}), 404
+    if suffix == ".prof":
+        return send_file(path, mimetype="application/octet-stream", as_attachment=True)
+    return Response(path.read_text(encoding="utf-8"), content_type="text/plain; charset=utf-8")
+
+
 @api_bp.route("/watchlist", methods=["GET"])
 def get_watchlist() -> Response:
     """GET /api/watchlist"""
-    return jsonify({"tickers": _read_watchlist()})
+    return jsonify({"tickers": read_watchlist()})
 
 
 @api_bp.route("/watchlist", methods=["POST"])
@@ -184,7 +668,7 @@ def add_watchlist() -> Response:
     if not ticker:
         return jsonify({"error": "ticker is required"}), 400
 
-    tickers = _read_watchlist()
+    tickers = read_watchlist()
     if ticker in tickers:
         return jsonify({"error": f"{ticker} already in watchlist"}), 400
 
@@ -197,7 +681,7 @@ def add_watchlist() -> Response:
 def remove_watchlist(ticker: str) -> Response:
     """DELETE /api/watchlist/<ticker>"""
     ticker = ticker.upper()
-    tickers = _read_watchlist()
+    tickers = read_watchlist()
 
     if ticker not in tickers:
         return jsonify({"error": f"{ticker} not in watchlist"}), 404
@@ -0,0 +1,189 @@
+"""
+분석 결과 JSON 직렬화 — DataFrame 을 열 단위 배열 연산으로 변환합니다.
+
+날짜 포맷·반올림(파이썬 round 와 같은 값)·NaN → null 치환을 컬럼 전체에 한 번씩만 수행하고,
+행 형식([{date, open, ...}, ...])과 열 형식({dates: [...], open: [...]})을
+같은 열 데이터에서 만듭니다. orjson 이 설치되어 있으면 인코딩에 사용합니다.
+인코딩된 본문은 한 번만 gzip 압축해 캐시와 함께 재사용합니다.
+"""
+from __future__ import annotations
+
+import gzip
+import json
+from typing import Any, Optional
+
+import numpy as np
+import pandas as pd
+from flask import Response
+
+from backtest.engine import BacktestResult
+from config import GZIP_LEVEL, GZIP_MIN_BYTES
+
+try:
+    import orjson
+    _USE_ORJSON = True
+except ImportError:
+    _USE_ORJSON = False
+
+DECIMALS = 4
+
+# (응답 필드, DataFrame 컬럼)
+OHLCV_FIELDS: list[tuple[str, str]] = [
+    ("open", "Open"), ("high", "High"), ("low", "Low"), ("close", "Close"),
+]
+INDICATOR_FIELDS: dict[str, list[tuple[str, str]]] = {
+    "ma": [("ma5", "MA5"), ("ma20", "MA20"), ("ma60", "MA60")],
+    "rsi": [("value", "RSI")],
+    "macd": [("macd", "MACD"), ("signal", "MACD_signal")],
+    "bollinger": [("upper", "BB_upper"), ("mid", "BB_mid"), ("lower", "BB_lower")],
+}
+
+
+def round_half(values: np.ndarray, decimals: int = DECIMALS) -> np.ndarray:
+    """
+    파이썬 round(v, decimals) 와 같은 값을 내는 배열 반올림.
+
+    np.round 는 v * 10**decimals 를 거치며 생긴 오차로 372.06975 같은 경계값을
+    반대쪽으로 올립니다. 경계(.5)에 가까운 원소만 골라 round() 로 다시 계산합니다.
+    """
+    scale = 10.0 ** decimals
+    scaled = values * scale
+    out = np.rint(scaled) / scale
+    with np.errstate(invalid="ignore"):
+        frac = np.abs(scaled - np.floor(scaled) - 0.5)
+        near = frac < 1e-6 + np.abs(scaled) * 1e-15
+    for i in np.flatnonzero(near):
+        out[i] = round(float(values[i]), decimals)
+    return out
+
+
+def _rounded(df: pd.DataFrame, column: str) -> np.ndarray:
+    """컬럼을 소수점 DECIMALS 자리 float 배열로 반환합니다. 컬럼이 없으면 전부 NaN."""
+    if column not in df.columns:
+        return np.full(len(df), np.nan)
+    return round_half(df[column].to_numpy(dtype=float, na_value=np.nan))
+
+
+def _to_list(values: np.ndarray) -> list:
+    """NaN 을 None 으로 바꾼 파이썬 리스트 (마스크 한 번으로 치환)."""
+    mask = np.isnan(values)
+    if not mask.any():
+        return values.tolist()
+    out = values.astype(object)
+    out[mask] = None
+    return out.tolist()
+
+
+def _volume(df: pd.DataFrame) -> list:
+    if "Volume" not in df.columns:
+        return [None] * len(df)
+    values = df["Volume"].to_numpy(dtype=float, na_value=np.nan)
+    mask = np.isnan(values)
+    out = np.where(mask, 0, values).astype(np.int64).astype(object)
+    out[mask] = None
+    return out.tolist()
+
+
+def _indicator_columns(df: pd.DataFrame) -> dict[str, dict[str, list]]:
+    columns: dict[str, dict[str, list]] = {}
+    for group, fields in INDICATOR_FIELDS.items():
+        arrays = {name: _rounded(df, col) for name, col in fields}
+        if group == "macd":
+            arrays["histogram"] = round_half(arrays["macd"] - arrays["signal"])
+        columns[group] = {name: _to_list(values) for name, values in arrays.items()}
+    return columns
+
+
+def signals_to_list(signals: list) -> list[dict]:
+    """Signal 목록을 응답용 dict 목록으로 변환합니다."""
+    result = []
+    for s in signals:
+        date_str = s.date.strftime("%Y-%m-%d") if hasattr(s.date, "strftime") else str(s.date)
+        result.append({
+            "date": date_str,
+            "type": s.signal.value,
+            "reason": s.reason,
+            "price": round(float(s.price), 4),
+            "stop_loss": round(float(s.stop_loss), 4) if s.stop_loss is not None else None,
+            "target": round(float(s.target), 4) if s.target is not None else None,
+        })
+    return result
+
+
+def backtest_to_dict(result: BacktestResult) -> dict:
+    """BacktestResult 를 JSON 으로 보낼 수 있는 dict 로 변환합니다."""
+    return {
+        "ticker": result.ticker,
+        "start_date": result.start_date.isoformat(),
+        "end_date": result.end_date.isoformat(),
+        "total_return": result.total_return,
+        "trade_count": result.trade_count,
+        "win_rate": result.win_rate,
+        "stop_loss_hits": result.stop_loss_hits,
+        "target_hits": result.target_hits,
+        "max_drawdown": result.max_drawdown,
+        "signals": signals_to_list(result.signals),
+    }
+
+
+def _rows(dates: list[str], columns: dict[str, list]) -> list[dict]:
+    keys = ["date", *columns]
+    return [dict(zip(keys, row)) for row in zip(dates, *columns.values())]
+
+
+def frame_to_payload(df: pd.DataFrame, columnar: bool = False) -> dict:
+    """
+    지표가 계산된 DataFrame 을 {"ohlcv", "indicators"} 응답 조각으로 변환합니다.
+
+    columnar=True 이면 날짜를 "dates" 한 번만 싣고 필드별 배열을 반환합니다.
+    """
+    dates = df.index.strftime("%Y-%m-%d").tolist()
+    ohlcv = {name: _to_list(_rounded(df, col)) for name, col in OHLCV_FIELDS}
+    ohlcv["volume"] = _volume(df)
+    indicators = _indicator_columns(df)
+
+    if columnar:
+        return {"dates": dates, "ohlcv": ohlcv, "indicators": indicators}
+    return {
+        "ohlcv": _rows(dates, ohlcv),
+        "indicators": {group: _rows(dates, cols) for group, cols in indicators.items()},
+    }
+
+
+def encode_json(payload: Any) -> bytes:
+    """payload 를 UTF-8 JSON 바이트로 인코딩합니다 (orjson 이 있으면 사용)."""
+    if _USE_ORJSON:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def encode_batch(envelope: dict, results: dict[str, bytes]) -> bytes:
+    """
+    이미 인코딩된 종목별 본문을 다시 파싱하지 않고 {"results": {...}, **envelope} 로 잇습니다.
+    """
+    items = b",".join(encode_json(ticker) + b":" + body for ticker, body in results.items())
+    rest = encode_json(envelope)
+    tail = b"," + rest[1:] if len(rest) > 2 else b"}"
+    return b'{"results":{' + items + b"}" + tail
+
+
+def sse_event(event: str, data: bytes) -> bytes:
+    """Server-Sent Events 한 건. data 는 한 줄짜리 JSON (encode_json 결과)이어야 합니다."""
+    return b"event: " + event.encode("ascii") + b"\ndata: " + data + b"\n\n"
+
+
+def json_response(payload: dict, status: int = 200) -> Response:
+    """payload 를 JSON 응답으로 만듭니다."""
+    return body_response(encode_json(payload), status)
+
+
+def body_response(body: bytes, status: int = 200) -> Response:
+    """이미 인코딩된 JSON 본문으로 응답을 만듭니다."""
+    return Response(body, status=status, mimetype="application/json")
+
+
+def gzip_body(body: bytes) -> Optional[bytes]:
+    """GZIP_MIN_BYTES 이상인 본문을 압축합니다. 작은 본문은 None (압축 안 함)."""
+    if len(body) < GZIP_MIN_BYTES:
+        return None
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
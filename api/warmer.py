@@ -0,0 +1,141 @@
+"""
+캐시 예열 스케줄러 — watchlist 종목의 데이터·지표·신호를 주기적으로 미리 계산합니다.
+
+백그라운드 데몬 스레드가 WARM_INTERVAL 초(±10% 지터)마다 watchlist 를 읽어
+최대 WARM_WORKERS 개 스레드로 종목별 refresh_ticker 를 실행합니다. 종목마다
+0~WARM_JITTER 초 무작위 지연 후 시작해 공급자 호출이 한순간에 몰리지 않게 합니다.
+마지막 실행의 소요 시간·종목별 시간·실패는 status() 로 확인할 수 있습니다.
+"""
+from __future__ import annotations
+
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Callable, Optional
+
+from api.routes import read_watchlist, refresh_ticker
+from config import (
+    WARM_FORMATS,
+    WARM_INTERVAL,
+    WARM_JITTER,
+    WARM_PERIODS,
+    WARM_WORKERS,
+)
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
+
+
+class CacheWarmer:
+    """watchlist 캐시 예열 스케줄러."""
+
+    def __init__(
+        self,
+        load_tickers: Callable[[], list[str]] = read_watchlist,
+        interval: float = WARM_INTERVAL,
+        workers: int = WARM_WORKERS,
+        jitter: float = WARM_JITTER,
+        periods: tuple[str, ...] = tuple(WARM_PERIODS),
+        formats: tuple[str, ...] = tuple(WARM_FORMATS),
+    ) -> None:
+        self.load_tickers = load_tickers
+        self.interval = interval
+        self.workers = workers
+        self.jitter = jitter
+        self.periods = periods
+        self.formats = formats
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._last_run: Optional[dict] = None
+        self._next_run_at: Optional[float] = None
+        self.runs = 0
+
+    # ─── 실행 ──────────────────────────────────────────────────────────────
+
+    def _warm_one(self, ticker: str) -> tuple[float, Optional[str]]:
+        if self.jitter > 0 and self._stop.wait(random.uniform(0, self.jitter)):
+            return 0.0, "중단됨"
+        started = time.perf_counter()
+        try:
+            for period in self.periods:
+                refresh_ticker(ticker, period, self.formats)
+            return time.perf_counter() - started, None
+        except Exception as exc:
+            return time.perf_counter() - started, str(exc)
+
+    def run_once(self) -> dict:
+        """watchlist 전체를 한 번 예열하고 실행 기록을 반환합니다."""
+        tickers = list(dict.fromkeys(t.upper() for t in self.load_tickers()))
+        started_at = _now_iso()
+        started = time.perf_counter()
+        timings: dict[str, float] = {}
+        errors: dict[str, str] = {}
+        if tickers:
+            with ThreadPoolExecutor(max_workers=max(1, min(self.workers, len(tickers)))) as pool:
+                for ticker, (elapsed, error) in zip(tickers, pool.map(self._warm_one, tickers)):
+                    timings[ticker] = round(elapsed, 3)
+                    if error is not None:
+                        errors[ticker] = error
+
+        record = {
+            "started_at": started_at,
+            "duration": round(time.perf_counter() - started, 3),
+            "tickers": len(tickers),
+            "errors": errors,
+            "timings": timings,
+        }
+        with self._lock:
+            self._last_run = record
+            self.runs += 1
+        logger.info("캐시 예열: %d/%d개 종목, %.2f초", len(tickers) - len(errors), len(tickers), record["duration"])
+        return record
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+            except Exception as exc:
+                logger.error("캐시 예열 실패 - %s", exc)
+            delay = self.interval * random.uniform(0.9, 1.1)
+            with self._lock:
+                self._next_run_at = time.time() + delay
+            self._stop.wait(delay)
+
+    # ─── 수명 주기 ─────────────────────────────────────────────────────────
+
+    def start(self) -> None:
+        """데몬 스레드로 스케줄을 시작합니다 (첫 실행은 즉시)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="cache-warmer", daemon=True)
+        self._thread.start()
+        logger.info("캐시 예열 스케줄러 시작: %.0f초 주기, 동시 %d개", self.interval, self.workers)
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def status(self) -> dict:
+        """실행 여부, 마지막 실행 기록, 다음 실행 예정 시각."""
+        with self._lock:
+            next_run = self._next_run_at
+            return {
+                "running": self._thread is not None and self._thread.is_alive(),
+                "interval": self.interval,
+                "workers": self.workers,
+                "runs": self.runs,
+                "last_run": self._last_run,
+                "next_run_at": (
+                    datetime.fromtimestamp(next_run, timezone.utc).isoformat(timespec="seconds")
+                    if next_run is not None else None
+                ),
+            }
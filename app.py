@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 import sys
+from typing import Optional, Union
 
 # 기존 stock-automation 모듈(config, data, indicators, signals, utils)을
 # import 할 수 있도록 프로젝트 루트를 sys.path 에 추가합니다.
@@ -11,13 +12,51 @@ from flask import Flask, render_template  # noqa: E402 (path must be set first)
 from flask_cors import CORS  # noqa: E402
 
 from api.routes import api_bp  # noqa: E402
+from api.warmer import CacheWarmer  # noqa: E402
+from config import PROFILE_API, WARM_ENABLED  # noqa: E402
+from data.fetcher import get_provider, set_provider  # noqa: E402
+from data.providers import FileProvider  # noqa: E402
+from data.replay import RecordingProvider, ReplayProvider, parse_latency  # noqa: E402
 
 
-def create_app() -> Flask:
+def env_flag(name: str) -> Optional[bool]:
+    """환경변수 켜짐/꺼짐 ("0" 또는 빈 값이면 꺼짐). 없으면 None — config 기본값을 따릅니다."""
+    value = os.environ.get(name)
+    return None if value is None else value not in ("", "0")
+
+
+def create_app(
+    data_dir: Optional[str] = None,
+    warm: Optional[bool] = None,
+    record_dir: Optional[str] = None,
+    replay_dir: Optional[str] = None,
+    replay_latency: Union[float, str, None] = None,
+    profile_api: Optional[bool] = None,
+) -> Flask:
+    """
+    Flask 앱을 생성합니다. data_dir 지정 시 로컬 파일 데이터로 동작합니다.
+
+    warm 이 참이면 (생략 시 WARM_ENABLED) watchlist 캐시 예열 스케줄러를 시작합니다.
+    replay_dir 를 주면 녹화 아카이브로만 응답하고, record_dir 를 주면 수집 응답을 녹화합니다.
+    profile_api 가 참이면 (생략 시 PROFILE_API) ?profile=1 요청을 프로파일링합니다.
+    """
+    if replay_dir:
+        set_provider(ReplayProvider(replay_dir, latency=replay_latency))
+    elif data_dir:
+        set_provider(FileProvider(data_dir))
+    if record_dir:
+        set_provider(RecordingProvider(get_provider(), record_dir))
+
     app = Flask(__name__)
-    CORS(app)
+    app.config["PROFILE_API"] = PROFILE_API if profile_api is None else profile_api
+    CORS(app, expose_headers=["X-Profile", "X-Profile-Time"])
     app.register_blueprint(api_bp, url_prefix="/api")
 
+    if WARM_ENABLED if warm is None else warm:
+        warmer = CacheWarmer()
+        warmer.start()
+        app.extensions["cache_warmer"] = warmer
+
     @app.route("/")
     def index():
         return render_template("index.html")
@@ -26,5 +65,14 @@ def create_app() -> Flask:
 
 
 if __name__ == "__main__":
-    app = create_app()
+    # 디버그 리로더는 감시용 부모 프로세스에서도 이 블록을 실행하므로,
+    # 예열 스케줄러는 실제 서버를 띄우는 자식 프로세스에서만 시작합니다.
+    app = create_app(
+        os.environ.get("STOCK_DATA_DIR"),
+        warm=env_flag("STOCK_CACHE_WARM") if os.environ.get("WERKZEUG_RUN_MAIN") == "true" else False,
+        record_dir=os.environ.get("STOCK_RECORD_DIR"),
+        replay_dir=os.environ.get("STOCK_REPLAY_DIR"),
+        replay_latency=parse_latency(os.environ.get("STOCK_REPLAY_LATENCY")),
+        profile_api=env_flag("STOCK_PROFILE_API"),
+    )
     app.run(debug=True, port=5000)
@@ -1,16 +1,21 @@
 from __future__ import annotations
 
+import logging
+import math
 from dataclasses import dataclass, field
 from datetime import date
-from typing import Optional
+from typing import Callable, Optional
 
+import numpy as np
 import pandas as pd
 
 from config import DEFAULT_CAPITAL
 from data.fetcher import fetch_ohlcv
+from data.providers import DataProvider
 from data.processor import clean, validate
 from signals.generator import Signal, SignalType, generate
 from utils.logger import get_logger
+from utils.metrics import current_ticker, span
 
 logger = get_logger(__name__)
 
@@ -29,134 +34,181 @@ class BacktestResult:
     signals: list[Signal] = field(default_factory=list)
 
 
-def _calc_max_drawdown(equity_curve: list[float]) -> float:
+def _calc_max_drawdown(equity_curve) -> float:
     """자본 곡선에서 최대 낙폭(MDD)을 계산합니다."""
-    if not equity_curve:
+    equity = np.asarray(equity_curve, dtype=float)
+    if equity.size == 0:
         return 0.0
-    peak = equity_curve[0]
-    max_dd = 0.0
-    for val in equity_curve:
-        if val > peak:
-            peak = val
-        dd = (peak - val) / peak * 100
-        if dd > max_dd:
-            max_dd = dd
-    return round(max_dd, 2)
+    peak = np.maximum.accumulate(equity)
+    max_dd = float(((peak - equity) / peak * 100).max())
+    return round(max(max_dd, 0.0), 2)
 
 
-def run(
-    ticker: str,
-    start: str,
-    end: str,
-    initial_capital: float = DEFAULT_CAPITAL,
-) -> BacktestResult:
+def _align_signals(index: pd.Index, signals: list[Signal]) -> tuple[np.ndarray, ...]:
     """
-    지정 기간 동안 신호 기반 매매 시뮬레이션을 실행합니다.
+    Signal 목록을 봉 단위 배열로 펼칩니다.
 
-    진입: BUY 신호 발생 시
-    청산 우선순위:
-      1. 당일 Low ≤ stop_loss  → 손절 (stop_loss 가격에 청산)
-      2. 당일 High ≥ target    → 목표가 달성 (target 가격에 청산)
-      3. SELL 신호 발생         → 신호 가격에 청산
+    반환: (신호 코드 +1 BUY / -1 SELL / 0 없음, 가격, 손절가, 목표가) — 없는 값은 NaN.
+    같은 날짜 신호가 여러 개면 마지막 신호를 사용합니다.
     """
-    df = fetch_ohlcv(ticker, period="2y")
-    df = clean(df)
-    validate(df)
+    n = len(index)
+    code = np.zeros(n, dtype=np.int8)
+    price = np.full(n, np.nan)
+    stop = np.full(n, np.nan)
+    target = np.full(n, np.nan)
+    if not signals:
+        return code, price, stop, target
 
-    df = df.loc[start:end]
-    if df.empty:
-        logger.warning(f"{ticker}: 지정 기간 내 데이터 없음")
-        return BacktestResult(
-            ticker=ticker,
-            start_date=date.fromisoformat(start),
-            end_date=date.fromisoformat(end),
-            total_return=0.0,
-            trade_count=0,
-            win_rate=0.0,
-        )
+    days = pd.DatetimeIndex(index).normalize()
+    sig_days = pd.DatetimeIndex([pd.Timestamp(s.date) for s in signals])
+    if days.is_unique:
+        positions = days.get_indexer(sig_days)
+    else:
+        first = {d: i for i, d in reversed(list(enumerate(days)))}
+        positions = np.array([first.get(d, -1) for d in sig_days])
+
+    for pos, s in zip(positions, signals):
+        if pos < 0:
+            continue
+        code[pos] = 1 if s.signal == SignalType.BUY else -1 if s.signal == SignalType.SELL else 0
+        price[pos] = s.price
+        stop[pos] = s.stop_loss if s.stop_loss is not None else np.nan
+        target[pos] = s.target if s.target is not None else np.nan
+    return code, price, stop, target
 
-    signals = generate(df, ticker)
-    # 날짜 → Signal 매핑 (빠른 조회)
-    sig_map: dict[date, Signal] = {s.date: s for s in signals}
 
+def _simulate(
+    low: list[float],
+    high: list[float],
+    close: list[float],
+    sig_code: list[int],
+    sig_price: list[float],
+    sig_stop: list[float],
+    sig_target: list[float],
+    initial_capital: float,
+    dates: Optional[pd.Index] = None,
+) -> tuple[float, float, float, int, int, int, int, list[float], list[float]]:
+    """
+    경로 의존 청산 규칙을 봉 단위로 처리하는 커널.
+
+    입력은 파이썬 리스트(스칼라 접근이 가장 빠름), 손절/목표가 없음은 NaN 입니다.
+    dates 를 주면 DEBUG 로그에 체결일을 남깁니다.
+    반환: (capital, position, entry_price, wins, trades, stop_hits, target_hits,
+           봉별 capital, 봉별 position) — 자본 곡선은 호출 측에서 배열 연산으로 만듭니다.
+    """
     capital = initial_capital
     position = 0.0
     entry_price = 0.0
-    stop_loss: Optional[float] = None
-    target: Optional[float] = None
-
-    wins = 0
-    trades = 0
-    stop_loss_hits = 0
-    target_hits = 0
-    equity_curve: list[float] = []
-
-    for idx, row in df.iterrows():
-        row_date = idx.date() if hasattr(idx, "date") else idx
-        low  = float(row["Low"])
-        high = float(row["High"])
-        close = float(row["Close"])
-        current_value = capital + position * close
-        equity_curve.append(current_value)
+    stop_loss = math.nan
+    target = math.nan
+    wins = trades = stop_loss_hits = target_hits = 0
+
+    n = len(close)
+    capital_at = [0.0] * n
+    position_at = [0.0] * n
+
+    for i in range(n):
+        capital_at[i] = capital
+        position_at[i] = position
 
         # 포지션 보유 중: 손절/목표가 먼저 체크
-        if position > 0 and stop_loss is not None:
+        if position > 0 and stop_loss == stop_loss:
             # 1. 손절 체크 (당일 저가가 손절가 이하)
-            if low <= stop_loss:
-                exit_price = stop_loss
-                capital = position * exit_price
-                logger.debug(f"[손절] {row_date} @ {exit_price:,.0f}")
+            if low[i] <= stop_loss:
+                capital = position * stop_loss
+                if dates is not None:
+                    logger.debug("[손절] %s @ %s", dates[i].date(), f"{stop_loss:,.0f}")
                 position = 0.0
                 stop_loss_hits += 1
                 trades += 1
-                # 손절 → 진입가 대비 손실
-                stop_loss = None
-                target = None
+                stop_loss = target = math.nan
                 continue
 
             # 2. 목표가 체크 (당일 고가가 목표가 이상)
-            if target is not None and high >= target:
-                exit_price = target
-                capital = position * exit_price
-                logger.debug(f"[목표가] {row_date} @ {exit_price:,.0f}")
+            if high[i] >= target:
+                capital = position * target
+                if dates is not None:
+                    logger.debug("[목표가] %s @ %s", dates[i].date(), f"{target:,.0f}")
                 wins += 1
                 position = 0.0
                 target_hits += 1
                 trades += 1
-                stop_loss = None
-                target = None
+                stop_loss = target = math.nan
                 continue
 
         # 신호 처리
-        sig = sig_map.get(row_date)
-        if sig is None:
+        code = sig_code[i]
+        if code == 0:
             continue
 
-        if sig.signal == SignalType.BUY and position == 0:
-            position = capital / sig.price
-            entry_price = sig.price
-            stop_loss = sig.stop_loss
-            target = sig.target
+        if code == 1 and position == 0:
+            price = sig_price[i]
+            position = capital / price
+            entry_price = price
+            stop_loss = sig_stop[i]
+            target = sig_target[i]
             capital = 0.0
-            logger.debug(
-                f"[진입] {row_date} BUY @ {sig.price:,.0f} "
-                f"손절: {stop_loss:,.0f} 목표: {target:,.0f}"
-            )
+            if dates is not None:
+                logger.debug("[진입] %s BUY @ %s 손절: %s 목표: %s",
+                             dates[i].date(), f"{price:,.0f}", f"{stop_loss:,.0f}", f"{target:,.0f}")
 
-        elif sig.signal == SignalType.SELL and position > 0:
-            exit_price = sig.price
+        elif code == -1 and position > 0:
+            exit_price = sig_price[i]
             capital = position * exit_price
             if exit_price > entry_price:
                 wins += 1
             trades += 1
             position = 0.0
-            stop_loss = None
-            target = None
-            logger.debug(f"[청산] {row_date} SELL @ {exit_price:,.0f}")
+            stop_loss = target = math.nan
+            if dates is not None:
+                logger.debug("[청산] %s SELL @ %s", dates[i].date(), f"{exit_price:,.0f}")
+
+    return (capital, position, entry_price, wins, trades, stop_loss_hits, target_hits,
+            capital_at, position_at)
+
+
+def simulate(
+    df: pd.DataFrame,
+    signals: list[Signal],
+    ticker: str,
+    initial_capital: float = DEFAULT_CAPITAL,
+) -> BacktestResult:
+    """
+    이미 준비된 OHLCV 와 신호로 매매 시뮬레이션을 실행합니다 (데이터 수집 없음).
+
+    진입: BUY 신호 발생 시
+    청산 우선순위:
+      1. 당일 Low ≤ stop_loss  → 손절 (stop_loss 가격에 청산)
+      2. 당일 High ≥ target    → 목표가 달성 (target 가격에 청산)
+      3. SELL 신호 발생         → 신호 가격에 청산
+    """
+    with span("simulate", ticker):
+        return _simulate_frame(df, signals, ticker, initial_capital)
+
+
+def _simulate_frame(
+    df: pd.DataFrame, signals: list[Signal], ticker: str, initial_capital: float
+) -> BacktestResult:
+    close_arr = df["Close"].to_numpy(dtype=float)
+    code, price, stop, target = _align_signals(df.index, signals)
+
+    (capital, position, entry_price, wins, trades, stop_loss_hits, target_hits,
+     capital_at, position_at) = _simulate(
+        df["Low"].to_numpy(dtype=float).tolist(),
+        df["High"].to_numpy(dtype=float).tolist(),
+        close_arr.tolist(),
+        code.tolist(),
+        price.tolist(),
+        stop.tolist(),
+        target.tolist(),
+        initial_capital,
+        dates=df.index if logger.isEnabledFor(logging.DEBUG) else None,
+    )
+    equity_curve = np.asarray(capital_at) + np.asarray(position_at) * close_arr
 
     # 미청산 포지션 마지막 종가로 정산
     if position > 0:
-        final_price = float(df["Close"].iloc[-1])
+        final_price = float(close_arr[-1])
         capital = position * final_price
         if final_price > entry_price:
             wins += 1
@@ -176,3 +228,51 @@ def run(
         max_drawdown=_calc_max_drawdown(equity_curve),
         signals=signals,
     )
+
+
+def load_frame(
+    ticker: str,
+    start: str,
+    end: str,
+    provider: Optional[DataProvider] = None,
+) -> pd.DataFrame:
+    """최근 2년 데이터를 수집·검증한 뒤 [start, end] 구간을 반환합니다."""
+    df = fetch_ohlcv(ticker, period="2y", provider=provider)
+    with current_ticker(ticker):
+        df = clean(df)
+    validate(df)
+    return df.loc[start:end]
+
+
+def run(
+    ticker: str,
+    start: str,
+    end: str,
+    initial_capital: float = DEFAULT_CAPITAL,
+    provider: Optional[DataProvider] = None,
+    progress: Optional[Callable[[str, float], None]] = None,
+) -> BacktestResult:
+    """
+    지정 기간 동안 신호 기반 매매 시뮬레이션을 실행합니다.
+
+    데이터 수집 → 전처리 → 기간 필터 → 신호 생성 후 simulate() 로 위임합니다.
+    progress 를 주면 단계마다 (단계 이름, 진행률 0~1) 로 호출합니다.
+    """
+    report = progress or (lambda stage, fraction: None)
+    report("fetch", 0.0)
+    df = load_frame(ticker, start, end, provider)
+    if df.empty:
+        logger.warning("%s: 지정 기간 내 데이터 없음", ticker)
+        return BacktestResult(
+            ticker=ticker,
+            start_date=date.fromisoformat(start),
+            end_date=date.fromisoformat(end),
+            total_return=0.0,
+            trade_count=0,
+            win_rate=0.0,
+        )
+
+    report("signals", 0.4)
+    signals = generate(df, ticker)
+    report("simulate", 0.8)
+    return simulate(df, signals, ticker, initial_capital)
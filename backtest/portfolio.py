@@ -0,0 +1,212 @@
+"""
+포트폴리오 백테스팅 — 여러 종목을 하나의 자본 풀로 동시에 시뮬레이션합니다.
+
+종목별 OHLCV 와 신호를 날짜 기준 패널(봉 × 종목 2차원 배열)로 정렬한 뒤,
+봉마다 전 종목의 손절/목표가/SELL 청산과 BUY 진입을 배열 연산으로 처리합니다.
+청산 규칙은 단일 종목 엔진(backtest.engine.simulate)과 같습니다.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from backtest.engine import _align_signals, _calc_max_drawdown
+from config import DEFAULT_CAPITAL
+from data.fetcher import fetch_multiple
+from data.processor import InsufficientDataError, clean, validate
+from data.providers import DataProvider
+from signals.generator import Signal, generate
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_POSITIONS: int = 10
+
+
+@dataclass
+class TickerAttribution:
+    ticker: str
+    pnl: float = 0.0             # 실현 손익 (통화 단위)
+    contribution: float = 0.0    # 초기 자본 대비 기여 수익률 (%)
+    trade_count: int = 0
+    wins: int = 0
+    stop_loss_hits: int = 0
+    target_hits: int = 0
+
+
+@dataclass
+class PortfolioResult:
+    start_date: date
+    end_date: date
+    initial_capital: float
+    final_equity: float
+    total_return: float
+    trade_count: int
+    win_rate: float
+    max_drawdown: float = 0.0
+    equity_curve: pd.Series = field(default_factory=lambda: pd.Series(dtype=float))
+    attribution: dict[str, TickerAttribution] = field(default_factory=dict)
+
+
+def _panel(frames: dict[str, pd.DataFrame], column: str, index: pd.DatetimeIndex) -> np.ndarray:
+    """종목별 컬럼을 (봉, 종목) 배열로 정렬합니다. 봉이 없는 날은 NaN."""
+    return np.column_stack([
+        frames[t][column].reindex(index).to_numpy(dtype=float) for t in frames
+    ])
+
+
+def simulate_portfolio(
+    frames: dict[str, pd.DataFrame],
+    signals: dict[str, list[Signal]],
+    initial_capital: float = DEFAULT_CAPITAL,
+    max_positions: int = DEFAULT_MAX_POSITIONS,
+) -> PortfolioResult:
+    """
+    공유 자본으로 여러 종목을 동시에 시뮬레이션합니다.
+
+    - 동시 보유 종목은 최대 max_positions 개
+    - 신규 진입 금액: 직전 평가금액 / max_positions (남은 현금 한도 내, 같은 봉의
+      진입 후보가 현금보다 많으면 균등 분할). 후보가 빈 슬롯보다 많으면 종목 순서대로
+    - 손절/목표가로 청산된 종목은 같은 봉에 재진입하지 않음 (단일 엔진과 동일)
+    - 미청산 포지션은 마지막 종가로 정산
+    """
+    tickers = list(frames)
+    index = pd.DatetimeIndex(sorted(set().union(*(frames[t].index for t in tickers))))
+    n, k = len(index), len(tickers)
+
+    low = _panel(frames, "Low", index)
+    high = _panel(frames, "High", index)
+    close = _panel(frames, "Close", index)
+    valuation = pd.DataFrame(close).ffill().fillna(0.0).to_numpy()
+
+    aligned = [_align_signals(index, signals.get(t, [])) for t in tickers]
+    sig_code = np.column_stack([a[0] for a in aligned])
+    sig_price = np.column_stack([a[1] for a in aligned])
+    sig_stop = np.column_stack([a[2] for a in aligned])
+    sig_target = np.column_stack([a[3] for a in aligned])
+
+    cash = initial_capital
+    shares = np.zeros(k)
+    entry = np.zeros(k)
+    stop = np.full(k, np.nan)
+    target = np.full(k, np.nan)
+
+    pnl = np.zeros(k)
+    trades = np.zeros(k, dtype=int)
+    wins = np.zeros(k, dtype=int)
+    stop_hits = np.zeros(k, dtype=int)
+    target_hits = np.zeros(k, dtype=int)
+    equity = np.empty(n)
+
+    def _close_out(mask: np.ndarray, price: np.ndarray, won: np.ndarray) -> float:
+        """mask 종목을 price 에 청산하고 현금 유입액을 반환합니다 (price 는 변경 전에 읽음)."""
+        proceeds = shares[mask] * price[mask]
+        pnl[mask] += proceeds - shares[mask] * entry[mask]
+        trades[mask] += 1
+        wins[mask & won] += 1
+        shares[mask] = 0.0
+        stop[mask] = np.nan
+        target[mask] = np.nan
+        return float(proceeds.sum())
+
+    with np.errstate(invalid="ignore"):
+        for i in range(n):
+            equity[i] = cash + float(shares @ valuation[i])
+            held = shares > 0
+            guarded = held & ~np.isnan(stop)
+
+            # 1. 손절  2. 목표가 (단일 엔진과 같은 우선순위)
+            stopped = guarded & (low[i] <= stop)
+            hit = guarded & ~stopped & (high[i] >= target)
+            if stopped.any():
+                cash += _close_out(stopped, stop, np.zeros(k, dtype=bool))
+                stop_hits[stopped] += 1
+            if hit.any():
+                cash += _close_out(hit, target, np.ones(k, dtype=bool))
+                target_hits[hit] += 1
+            exited = stopped | hit
+
+            # 3. SELL 신호 청산
+            code = sig_code[i]
+            sells = held & ~exited & (code == -1)
+            if sells.any():
+                cash += _close_out(sells, sig_price[i], sig_price[i] > entry)
+
+            # BUY 진입 — 빈 슬롯과 현금 한도 내에서 종목 순서대로
+            buys = (code == 1) & (shares == 0) & ~exited
+            free = max_positions - int((shares > 0).sum())
+            if buys.any() and free > 0 and cash > 0:
+                candidates = np.flatnonzero(buys)[:free]
+                alloc = min(equity[i] / max_positions, cash / len(candidates))
+                price = sig_price[i, candidates]
+                shares[candidates] = alloc / price
+                entry[candidates] = price
+                stop[candidates] = sig_stop[i, candidates]
+                target[candidates] = sig_target[i, candidates]
+                cash -= alloc * len(candidates)
+
+    # 미청산 포지션 마지막 종가로 정산
+    open_positions = shares > 0
+    if open_positions.any():
+        final_price = valuation[-1] if n else np.zeros(k)
+        cash += _close_out(open_positions, final_price, final_price > entry)
+
+    total_trades = int(trades.sum())
+    attribution = {
+        t: TickerAttribution(
+            ticker=t,
+            pnl=round(float(pnl[j]), 2),
+            contribution=round(float(pnl[j]) / initial_capital * 100, 2),
+            trade_count=int(trades[j]),
+            wins=int(wins[j]),
+            stop_loss_hits=int(stop_hits[j]),
+            target_hits=int(target_hits[j]),
+        )
+        for j, t in enumerate(tickers)
+    }
+    return PortfolioResult(
+        start_date=index[0].date(),
+        end_date=index[-1].date(),
+        initial_capital=initial_capital,
+        final_equity=round(cash, 2),
+        total_return=round((cash - initial_capital) / initial_capital * 100, 2),
+        trade_count=total_trades,
+        win_rate=round(int(wins.sum()) / total_trades * 100 if total_trades else 0.0, 2),
+        max_drawdown=_calc_max_drawdown(equity),
+        equity_curve=pd.Series(equity, index=index, name="equity"),
+        attribution=attribution,
+    )
+
+
+def run_portfolio(
+    tickers: list[str],
+    start: str,
+    end: str,
+    initial_capital: float = DEFAULT_CAPITAL,
+    max_positions: int = DEFAULT_MAX_POSITIONS,
+    provider: Optional[DataProvider] = None,
+) -> PortfolioResult:
+    """관심 종목 전체를 수집·신호 생성한 뒤 공유 자본 포트폴리오로 시뮬레이션합니다."""
+    raw = fetch_multiple(tickers, provider=provider, period="2y")
+    frames: dict[str, pd.DataFrame] = {}
+    signals: dict[str, list[Signal]] = {}
+    for ticker, df in raw.items():
+        try:
+            df = clean(df)
+            validate(df)
+        except InsufficientDataError as exc:
+            logger.error("%s: 건너뜀 - %s", ticker, exc)
+            continue
+        df = df.loc[start:end]
+        if df.empty:
+            continue
+        frames[ticker] = df
+        signals[ticker] = generate(df, ticker)
+
+    if not frames:
+        raise InsufficientDataError("포트폴리오 구성 가능한 종목 없음")
+    return simulate_portfolio(frames, signals, initial_capital, max_positions)
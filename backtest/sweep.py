@@ -0,0 +1,243 @@
+"""
+파라미터 스윕 백테스팅 — 파라미터 격자를 프로세스 풀에 분산해 실행합니다.
+
+OHLCV 는 부모 프로세스가 공유 메모리 한 블록에 올리고, 워커는 이를 복사 없이
+붙여(attach) 사용하므로 작업마다 데이터를 pickle 하지 않습니다.
+작업은 지표 파라미터(IndicatorParams) 단위로 묶여, 같은 지표 조합에 대한
+ATR 손절/목표 배수 변형은 한 번 계산한 지표를 재사용합니다. 프로세스(또는 순차
+실행)마다 IndicatorCache 하나를 두어, 지표 파라미터가 다른 작업 사이에서도 바뀐
+파라미터에 의존하지 않는 지표(예: rsi_period 스윕에서 MA·MACD·ATR·ADX)는 다시
+계산하지 않습니다.
+"""
+from __future__ import annotations
+
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, fields, replace
+from multiprocessing import resource_tracker, shared_memory
+from typing import Iterator, Optional
+
+import numpy as np
+import pandas as pd
+
+from backtest.engine import load_frame, simulate
+from config import DEFAULT_CAPITAL
+from data.providers import DataFetchError
+from indicators.atr import ATR_STOP_MULT, ATR_TARGET_MULT
+from indicators.engine import DEFAULT_PARAMS, IndicatorCache, IndicatorParams
+from signals.generator import generate_from_indicators
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_OHLCV = ["Open", "High", "Low", "Close", "Volume"]
+_INDICATOR_FIELDS = {f.name for f in fields(IndicatorParams)}
+SWEEP_KEYS: set[str] = _INDICATOR_FIELDS | {"stop_mult", "target_mult"}
+
+# 워커 프로세스 전역 (initializer 에서 설정)
+_worker_df: Optional[pd.DataFrame] = None
+_worker_indicators: Optional[IndicatorCache] = None
+_worker_shm: Optional[shared_memory.SharedMemory] = None
+
+
+@dataclass
+class SweepResult:
+    params: dict
+    total_return: float
+    trade_count: int
+    win_rate: float
+    max_drawdown: float
+    stop_loss_hits: int
+    target_hits: int
+
+
+def build_grid(axes: dict[str, list]) -> list[dict]:
+    """{"rsi_period": [7, 14], ...} 형태의 축을 모든 조합의 목록으로 펼칩니다."""
+    unknown = set(axes) - SWEEP_KEYS
+    if unknown:
+        raise ValueError(f"지원하지 않는 스윕 파라미터: {sorted(unknown)}")
+    keys = list(axes)
+    return [dict(zip(keys, values)) for values in itertools.product(*(axes[k] for k in keys))]
+
+
+def parse_grid_arg(arg: str) -> tuple[str, list]:
+    """CLI 인자 "key=v1,v2" 를 (key, [값...]) 으로 변환합니다. ma_windows 는 "5/20/60"."""
+    key, _, raw = arg.partition("=")
+    key = key.strip()
+    if key not in SWEEP_KEYS or not raw:
+        raise ValueError(f"잘못된 --grid 인자: {arg}")
+    default = getattr(DEFAULT_PARAMS, key, ATR_STOP_MULT)
+    values: list = []
+    for item in raw.split(","):
+        item = item.strip()
+        if key == "ma_windows":
+            values.append(tuple(int(w) for w in item.split("/")))
+        elif isinstance(default, int):
+            values.append(int(item))
+        else:
+            values.append(float(item))
+    return key, values
+
+
+def _group_tasks(grid: list[dict]) -> list[tuple[IndicatorParams, list[dict]]]:
+    """격자를 지표 파라미터별로 묶습니다 (같은 지표 → 한 작업)."""
+    groups: dict[IndicatorParams, list[dict]] = {}
+    for combo in grid:
+        params = replace(DEFAULT_PARAMS, **{k: v for k, v in combo.items() if k in _INDICATOR_FIELDS})
+        groups.setdefault(params, []).append(combo)
+    return list(groups.items())
+
+
+def _run_group(
+    indicators: IndicatorCache,
+    ticker: str,
+    params: IndicatorParams,
+    combos: list[dict],
+    initial_capital: float,
+) -> list[SweepResult]:
+    df = indicators.df
+    enriched = indicators.frame(params)
+    results = []
+    for combo in combos:
+        signals = generate_from_indicators(
+            enriched, ticker, params,
+            stop_mult=combo.get("stop_mult", ATR_STOP_MULT),
+            target_mult=combo.get("target_mult", ATR_TARGET_MULT),
+        )
+        r = simulate(df, signals, ticker, initial_capital)
+        results.append(SweepResult(
+            params=combo,
+            total_return=r.total_return,
+            trade_count=r.trade_count,
+            win_rate=r.win_rate,
+            max_drawdown=r.max_drawdown,
+            stop_loss_hits=r.stop_loss_hits,
+            target_hits=r.target_hits,
+        ))
+    return results
+
+
+# ─── 공유 메모리 ────────────────────────────────────────────────────────────
+
+def _to_shared(df: pd.DataFrame) -> tuple[shared_memory.SharedMemory, tuple[int, int]]:
+    """OHLCV + 날짜(int64 ns)를 (n, 6) float64 블록 하나로 공유 메모리에 올립니다."""
+    n = len(df)
+    shm = shared_memory.SharedMemory(create=True, size=max(n * 6 * 8, 1))
+    block = np.ndarray((n, 6), dtype=np.float64, buffer=shm.buf)
+    block[:, :5] = df[_OHLCV].to_numpy(dtype=np.float64)
+    block[:, 5] = df.index.to_numpy(dtype="datetime64[ns]").view(np.int64).view(np.float64)
+    return shm, (n, 6)
+
+
+def _frame_from_block(block: np.ndarray) -> pd.DataFrame:
+    index = pd.DatetimeIndex(block[:, 5].view(np.int64).view("datetime64[ns]"))
+    return pd.DataFrame(block[:, :5], index=index, columns=_OHLCV, copy=False)
+
+
+def _attach(shm_name: str) -> shared_memory.SharedMemory:
+    """
+    부모가 만든 블록에 resource_tracker 등록 없이 붙습니다.
+
+    Python 3.12 이하는 붙기만 해도 블록을 추적 대상으로 등록해, 워커 종료 시 누수
+    경고나 부모보다 먼저 unlink 하는 문제가 생깁니다 (3.13 부터는 track=False).
+    """
+    try:
+        return shared_memory.SharedMemory(name=shm_name, track=False)
+    except TypeError:
+        pass
+    register = resource_tracker.register
+    resource_tracker.register = lambda name, rtype: None
+    try:
+        return shared_memory.SharedMemory(name=shm_name)
+    finally:
+        resource_tracker.register = register
+
+
+def _init_worker(shm_name: str, shape: tuple[int, int]) -> None:
+    global _worker_df, _worker_indicators, _worker_shm
+    # 워커는 붙기만 하고, close/unlink 는 블록을 만든 부모가 담당합니다.
+    _worker_shm = _attach(shm_name)
+    _worker_df = _frame_from_block(np.ndarray(shape, dtype=np.float64, buffer=_worker_shm.buf))
+    _worker_indicators = IndicatorCache(_worker_df)
+
+
+def _worker_task(
+    ticker: str,
+    params: IndicatorParams,
+    combos: list[dict],
+    initial_capital: float,
+) -> list[SweepResult]:
+    return _run_group(_worker_indicators, ticker, params, combos, initial_capital)
+
+
+# ─── 실행 ───────────────────────────────────────────────────────────────────
+
+def iter_sweep(
+    df: pd.DataFrame,
+    ticker: str,
+    grid: list[dict],
+    workers: Optional[int] = None,
+    initial_capital: float = DEFAULT_CAPITAL,
+) -> Iterator[SweepResult]:
+    """
+    준비된 OHLCV 로 격자 전체를 실행하고, 끝나는 순서대로 결과를 내보냅니다.
+
+    workers 가 1 이면 현재 프로세스에서 순차 실행, None 이면 CPU 코어 수만큼 사용합니다.
+    """
+    tasks = _group_tasks(grid)
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(tasks) <= 1:
+        indicators = IndicatorCache(df)
+        for params, combos in tasks:
+            yield from _run_group(indicators, ticker, params, combos, initial_capital)
+        return
+
+    shm, shape = _to_shared(df)
+    try:
+        with ProcessPoolExecutor(
+            max_workers=min(workers, len(tasks)),
+            initializer=_init_worker,
+            initargs=(shm.name, shape),
+        ) as pool:
+            futures = [
+                pool.submit(_worker_task, ticker, params, combos, initial_capital)
+                for params, combos in tasks
+            ]
+            for future in as_completed(futures):
+                yield from future.result()
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+def rank(results: list[SweepResult], key: str = "total_return") -> list[SweepResult]:
+    """지정 지표 기준 내림차순 (max_drawdown 은 오름차순)."""
+    return sorted(results, key=lambda r: getattr(r, key), reverse=key != "max_drawdown")
+
+
+def sweep(
+    ticker: str,
+    start: str,
+    end: str,
+    grid: list[dict],
+    workers: Optional[int] = None,
+    initial_capital: float = DEFAULT_CAPITAL,
+) -> list[SweepResult]:
+    """데이터를 한 번 수집한 뒤 격자 전체를 실행하고 수익률 순으로 반환합니다."""
+    df = load_frame(ticker, start, end)
+    if df.empty:
+        raise DataFetchError(f"{ticker}: 지정 기간 내 데이터 없음")
+    return rank(list(iter_sweep(df, ticker, grid, workers, initial_capital)))
+
+
+def format_table(results: list[SweepResult], top: Optional[int] = None) -> str:
+    """순위표 문자열을 만듭니다."""
+    lines = [f"  {'순위':>4}  {'수익률':>8}  {'MDD':>7}  {'매매':>4}  {'승률':>6}  파라미터"]
+    for i, r in enumerate(results[:top] if top else results, 1):
+        params = ", ".join(f"{k}={v}" for k, v in r.params.items())
+        lines.append(
+            f"  {i:>4}  {r.total_return:>+7.2f}%  {-r.max_drawdown:>6.2f}%  "
+            f"{r.trade_count:>4}  {r.win_rate:>5.1f}%  {params}"
+        )
+    return "\n".join(lines)
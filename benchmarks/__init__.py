@@ -0,0 +1,8 @@
+"""
+성능 벤치마크 — 합성 OHLCV 로 지표·신호·백테스트·직렬화·수집 구간을 측정합니다.
+
+    python -m benchmarks --preset quick --save benchmarks/baselines/local.json
+    python -m benchmarks --preset quick --compare benchmarks/baselines/local.json
+
+결과는 JSON 기준선으로 저장하고, --compare 로 기준선 대비 느려진 항목을 표시합니다.
+"""
@@ -0,0 +1,155 @@
+"""
+벤치마크 항목 — 이름, 크기 축(bars: 봉 수 / tickers: 종목 수), 측정할 호출을 만드는 함수.
+
+각 함수는 (크기, ExitStack) 을 받아 준비를 마친 뒤 인자 없는 호출 하나를 반환합니다.
+준비 시간은 측정에 포함되지 않으며, 바꿔 둔 전역 상태는 ExitStack 으로 되돌립니다.
+"""
+from __future__ import annotations
+
+import tempfile
+from contextlib import ExitStack
+from dataclasses import dataclass
+from typing import Callable, Optional
+from unittest import mock
+
+import pandas as pd
+
+import api.routes as routes
+import data.fetcher as fetcher
+from api.serializers import encode_json, frame_to_payload, gzip_body, signals_to_list
+from backtest.engine import run
+from benchmarks.data import SyntheticProvider, synthetic_ohlcv, ticker_names
+from data.cache import OHLCVCache
+from data.fetcher import fetch_multiple
+from data.processor import clean
+from indicators.adx import add_adx, add_volume_ma
+from indicators.atr import add_atr
+from indicators.bollinger import add_bollinger
+from indicators.engine import compute_indicators
+from indicators.macd import add_macd
+from indicators.moving_average import add_ma
+from indicators.rsi import add_rsi
+from indicators.stochastic import add_stochastic
+from indicators.streaming import IndicatorState
+from signals.generator import generate, generate_with_indicators
+
+BARS, TICKERS = "bars", "tickers"
+TICKER_BARS = 500   # 종목 축 항목의 종목당 봉 수
+
+
+@dataclass(frozen=True)
+class Case:
+    name: str
+    axis: str
+    build: Callable[[int, ExitStack], Callable[[], object]]
+    max_size: Optional[int] = None   # 이보다 큰 크기는 건너뜀 (메모리·시간 한계)
+
+
+CASES: list[Case] = []
+
+
+def case(name: str, axis: str = BARS, max_size: Optional[int] = None):
+    def register(build: Callable[[int, ExitStack], Callable[[], object]]):
+        CASES.append(Case(name, axis, build, max_size))
+        return build
+    return register
+
+
+# ─── 봉 수 축: 지표 / 신호 / 백테스트 / 직렬화 ─────────────────────────────
+
+def _frame(size: int) -> pd.DataFrame:
+    return clean(synthetic_ohlcv(size, seed=size))
+
+
+def _indicator_case(name: str, func: Callable[[pd.DataFrame], pd.DataFrame]) -> None:
+    @case(f"indicators.{name}")
+    def build(size: int, stack: ExitStack) -> Callable[[], object]:
+        df = _frame(size)
+        return lambda: func(df)
+
+
+for _name, _func in [
+    ("add_ma", add_ma),
+    ("add_rsi", add_rsi),
+    ("add_macd", add_macd),
+    ("add_bollinger", add_bollinger),
+    ("add_stochastic", add_stochastic),
+    ("add_atr", add_atr),
+    ("add_adx", add_adx),
+    ("add_volume_ma", add_volume_ma),
+    ("compute_indicators", compute_indicators),
+]:
+    _indicator_case(_name, _func)
+
+
+@case("indicators.streaming", max_size=100_000)
+def _streaming(size: int, stack: ExitStack) -> Callable[[], object]:
+    df = _frame(size)
+    return lambda: IndicatorState.from_history(df)
+
+
+@case("signals.generate")
+def _generate(size: int, stack: ExitStack) -> Callable[[], object]:
+    df = _frame(size)
+    return lambda: generate(df, "SYN")
+
+
+@case("backtest.run")
+def _backtest(size: int, stack: ExitStack) -> Callable[[], object]:
+    provider = SyntheticProvider(bars=size)
+    index = provider.frame("SYN").index
+    start, end = str(index[0].date()), str(index[-1].date())
+    return lambda: run("SYN", start, end, provider=provider)
+
+
+def _enriched(size: int) -> tuple[pd.DataFrame, list]:
+    return generate_with_indicators(_frame(size), "SYN")
+
+
+@case("serialize.rows", max_size=1_000_000)
+def _serialize_rows(size: int, stack: ExitStack) -> Callable[[], object]:
+    frame, signals = _enriched(size)
+    return lambda: encode_json({**frame_to_payload(frame), "signals": signals_to_list(signals)})
+
+
+@case("serialize.columns", max_size=1_000_000)
+def _serialize_columns(size: int, stack: ExitStack) -> Callable[[], object]:
+    frame, signals = _enriched(size)
+    return lambda: encode_json({**frame_to_payload(frame, columnar=True), "signals": signals_to_list(signals)})
+
+
+@case("serialize.gzip", max_size=1_000_000)
+def _serialize_gzip(size: int, stack: ExitStack) -> Callable[[], object]:
+    frame, _ = _enriched(size)
+    body = encode_json(frame_to_payload(frame))
+    return lambda: gzip_body(body)
+
+
+# ─── 종목 수 축: 수집 / API 파이프라인 ─────────────────────────────────────
+
+@case("fetch.provider", axis=TICKERS)
+def _fetch_provider(size: int, stack: ExitStack) -> Callable[[], object]:
+    provider = SyntheticProvider(bars=TICKER_BARS)
+    tickers = ticker_names(size)
+    for t in tickers:
+        provider.frame(t)
+    return lambda: fetch_multiple(tickers, provider=provider)
+
+
+@case("fetch.cache_hit", axis=TICKERS)
+def _fetch_cache_hit(size: int, stack: ExitStack) -> Callable[[], object]:
+    cache_dir = stack.enter_context(tempfile.TemporaryDirectory(prefix="bench-cache-"))
+    stack.enter_context(mock.patch.object(fetcher, "_cache", OHLCVCache(cache_dir)))
+    provider = SyntheticProvider(bars=TICKER_BARS, cacheable=True)
+    tickers = ticker_names(size)
+    fetch_multiple(tickers, provider=provider, period="max")   # 캐시 채우기
+    return lambda: fetch_multiple(tickers, provider=provider, period="max")
+
+
+@case("api.analyze", axis=TICKERS)
+def _api_analyze(size: int, stack: ExitStack) -> Callable[[], object]:
+    """결과 캐시 없이 종목별 정리 → 지표 → 신호 → 직렬화 → gzip 전체."""
+    stack.enter_context(mock.patch.object(routes, "_result_cache", None))
+    provider = SyntheticProvider(bars=TICKER_BARS)
+    frames = {t: provider.frame(t) for t in ticker_names(size)}
+    return lambda: [routes._analyze_response(t, "1y", "rows", df) for t, df in frames.items()]
@@ -0,0 +1,68 @@
+"""벤치마크용 합성 OHLCV — 봉 수·종목 수를 자유롭게 키울 수 있는 결정적 데이터."""
+from __future__ import annotations
+
+import zlib
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from data.providers import DataProvider
+
+_DAILY_LIMIT = 50_000   # 이보다 길면 Timestamp 범위를 넘지 않도록 분봉 인덱스 사용
+_END = "2025-12-31"
+
+
+def synthetic_ohlcv(n: int, seed: int = 0, base: float = 50_000.0) -> pd.DataFrame:
+    """
+    n봉짜리 기하 브라운 운동 OHLCV 를 만듭니다 (High ≥ max(Open, Close), Low ≤ min).
+
+    n 이 _DAILY_LIMIT 이하이면 영업일, 그보다 길면 분 단위 인덱스를 씁니다.
+    """
+    rng = np.random.default_rng(seed)
+    close = base * np.exp(np.cumsum(rng.normal(0.0, 0.015, n)))
+    open_ = np.empty(n)
+    open_[0] = base
+    open_[1:] = close[:-1] * (1.0 + rng.normal(0.0, 0.003, n - 1))
+    wick = np.abs(rng.normal(0.0, 0.008, (2, n)))
+    freq = "B" if n <= _DAILY_LIMIT else "min"
+    return pd.DataFrame(
+        {
+            "Open": open_,
+            "High": np.maximum(open_, close) * (1.0 + wick[0]),
+            "Low": np.minimum(open_, close) * (1.0 - wick[1]),
+            "Close": close,
+            "Volume": rng.lognormal(14.5, 0.4, n).astype(np.int64),
+        },
+        index=pd.date_range(end=_END, periods=n, freq=freq, name="Date"),
+    )
+
+
+def ticker_names(count: int) -> list[str]:
+    return [f"SYN{i:05d}" for i in range(count)]
+
+
+class SyntheticProvider(DataProvider):
+    """종목마다 고정 시드로 만든 합성 데이터를 돌려주는 공급자 (네트워크 없음)."""
+
+    name = "synthetic"
+
+    def __init__(self, bars: int = 500, cacheable: bool = False) -> None:
+        self.bars = bars
+        self.cacheable = cacheable
+        self._frames: dict[str, pd.DataFrame] = {}
+
+    def frame(self, ticker: str) -> pd.DataFrame:
+        df = self._frames.get(ticker)
+        if df is None:
+            df = self._frames[ticker] = synthetic_ohlcv(self.bars, seed=zlib.crc32(ticker.encode()))
+        return df
+
+    def download(
+        self,
+        ticker: str,
+        period: Optional[str] = None,
+        start: Optional[pd.Timestamp] = None,
+    ) -> pd.DataFrame:
+        df = self.frame(ticker)
+        return df if start is None else df.loc[start:]
@@ -0,0 +1,248 @@
+"""
+벤치마크 실행 · 기준선 저장 · 비교.
+
+항목마다 한 번 예열한 뒤 최대 repeat 회(항목당 max_time 초 안에서) 측정하고, 최솟값을
+대표값으로 씁니다. --compare 는 같은 (항목, 크기) 의 최솟값이 기준선보다 threshold
+비율 이상 느려지면 회귀로 표시하고 종료 코드 1 을 돌려줍니다.
+"""
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import gc
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from contextlib import ExitStack
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Iterable, Optional
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.cases import BARS, CASES, TICKERS, Case
+
+PRESETS: dict[str, dict[str, list[int]]] = {
+    "quick": {BARS: [1_000, 10_000], TICKERS: [1, 10]},
+    "default": {BARS: [1_000, 10_000, 100_000, 1_000_000], TICKERS: [1, 10, 100, 1_000]},
+    "full": {BARS: [1_000, 10_000, 100_000, 1_000_000, 10_000_000], TICKERS: [1, 10, 100, 1_000, 5_000]},
+}
+DEFAULT_THRESHOLD = 0.15
+
+
+def measure(fn: Callable[[], object], repeat: int = 5, max_time: float = 10.0) -> list[float]:
+    """예열 1회 후 최대 repeat 회 측정한 소요 시간(초). 예열이 max_time 을 넘으면 그 값 하나."""
+    started = time.perf_counter()
+    fn()
+    warmup = time.perf_counter() - started
+    if warmup >= max_time:
+        return [warmup]
+
+    samples: list[float] = []
+    deadline = time.perf_counter() + max_time
+    gc.collect()
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            started = time.perf_counter()
+            fn()
+            samples.append(time.perf_counter() - started)
+            if time.perf_counter() >= deadline:
+                break
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return samples
+
+
+def run_case(c: Case, size: int, repeat: int, max_time: float) -> dict:
+    with ExitStack() as stack:
+        fn = c.build(size, stack)
+        samples = measure(fn, repeat, max_time)
+    best = min(samples)
+    return {
+        "name": c.name,
+        "axis": c.axis,
+        "size": size,
+        "runs": len(samples),
+        "min": best,
+        "median": statistics.median(samples),
+        "mean": statistics.fmean(samples),
+        "per_second": size / best if best > 0 else None,
+    }
+
+
+def select(pattern: Optional[str]) -> list[Case]:
+    """이름이 glob 패턴(또는 부분 문자열)과 맞는 항목."""
+    if not pattern:
+        return list(CASES)
+    return [c for c in CASES if fnmatch.fnmatch(c.name, pattern) or pattern in c.name]
+
+
+def run_all(
+    cases: Iterable[Case],
+    sizes: dict[str, list[int]],
+    repeat: int = 5,
+    max_time: float = 10.0,
+    report: Callable[[dict], None] = lambda record: None,
+) -> list[dict]:
+    results = []
+    for c in cases:
+        for size in sizes[c.axis]:
+            if c.max_size is not None and size > c.max_size:
+                continue
+            record = run_case(c, size, repeat, max_time)
+            results.append(record)
+            report(record)
+    return results
+
+
+# ─── 기준선 ────────────────────────────────────────────────────────────────
+
+def _git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=5,
+            cwd=Path(__file__).resolve().parent,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def environment() -> dict:
+    return {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def save(path: str, results: list[dict]) -> None:
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text(
+        json.dumps({"environment": environment(), "results": results}, indent=2) + "\n",
+        encoding="utf-8",
+    )
+
+
+def load(path: str) -> dict:
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def compare(baseline: list[dict], current: list[dict], threshold: float = DEFAULT_THRESHOLD) -> list[dict]:
+    """
+    (항목, 크기) 별 최솟값 비교. status: regression / improved / ok / new.
+
+    ratio 는 현재 / 기준선 — 1.20 이면 20% 느려졌다는 뜻입니다.
+    """
+    base = {(r["name"], r["size"]): r for r in baseline}
+    rows = []
+    for record in current:
+        before = base.get((record["name"], record["size"]))
+        if before is None:
+            rows.append({**_key(record), "baseline": None, "current": record["min"], "ratio": None, "status": "new"})
+            continue
+        ratio = record["min"] / before["min"] if before["min"] > 0 else float("inf")
+        status = "regression" if ratio > 1 + threshold else "improved" if ratio < 1 - threshold else "ok"
+        rows.append({**_key(record), "baseline": before["min"], "current": record["min"], "ratio": ratio, "status": status})
+    return rows
+
+
+def _key(record: dict) -> dict:
+    return {"name": record["name"], "size": record["size"]}
+
+
+# ─── 출력 ──────────────────────────────────────────────────────────────────
+
+def _fmt_time(seconds: Optional[float]) -> str:
+    if seconds is None:
+        return "-"
+    if seconds < 1e-3:
+        return f"{seconds * 1e6:.1f}µs"
+    if seconds < 1:
+        return f"{seconds * 1e3:.2f}ms"
+    return f"{seconds:.3f}s"
+
+
+def format_record(record: dict) -> str:
+    rate = f"{record['per_second']:,.0f}/s" if record["per_second"] else "-"
+    return (
+        f"  {record['name']:<30} {record['axis']:>7}={record['size']:<10,} "
+        f"min {_fmt_time(record['min']):>10}  median {_fmt_time(record['median']):>10}  "
+        f"{rate:>16}  ({record['runs']}회)"
+    )
+
+
+def format_comparison(rows: list[dict]) -> str:
+    lines = [f"  {'항목':<30} {'크기':>10} {'기준선':>10} {'현재':>10} {'변화':>8}  상태"]
+    for row in rows:
+        change = f"{(row['ratio'] - 1) * 100:+.1f}%" if row["ratio"] is not None else "-"
+        mark = {"regression": "⚠️  회귀", "improved": "개선", "ok": "", "new": "신규"}[row["status"]]
+        lines.append(
+            f"  {row['name']:<30} {row['size']:>10,} {_fmt_time(row['baseline']):>10} "
+            f"{_fmt_time(row['current']):>10} {change:>8}  {mark}"
+        )
+    return "\n".join(lines)
+
+
+def _sizes_arg(text: str) -> list[int]:
+    return [int(float(v)) for v in text.split(",") if v.strip()]
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="성능 벤치마크")
+    parser.add_argument("--preset", choices=sorted(PRESETS), default="quick", help="크기 묶음 (기본: quick)")
+    parser.add_argument("--bars", type=_sizes_arg, help="봉 수 목록 (예: 1000,1e6) — preset 대신 사용")
+    parser.add_argument("--tickers", type=_sizes_arg, help="종목 수 목록 (예: 1,100,5000)")
+    parser.add_argument("-k", "--filter", help="항목 이름 glob 또는 부분 문자열 (예: 'indicators.*')")
+    parser.add_argument("--repeat", type=int, default=5, help="항목당 최대 측정 횟수")
+    parser.add_argument("--max-time", type=float, default=10.0, help="항목당 측정 시간 상한(초)")
+    parser.add_argument("--save", help="결과를 기준선 JSON 으로 저장할 경로")
+    parser.add_argument("--compare", help="비교할 기준선 JSON 경로 (회귀가 있으면 종료 코드 1)")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="회귀로 볼 느려짐 비율 (기본 0.15 = 15%%)")
+    parser.add_argument("--list", action="store_true", help="항목 목록만 출력")
+    args = parser.parse_args(argv)
+
+    cases = select(args.filter)
+    if args.list:
+        for c in cases:
+            print(f"  {c.name:<30} {c.axis}" + (f" (≤{c.max_size:,})" if c.max_size else ""))
+        return
+
+    sizes = dict(PRESETS[args.preset])
+    if args.bars:
+        sizes[BARS] = args.bars
+    if args.tickers:
+        sizes[TICKERS] = args.tickers
+
+    # 종목별 수집 로그가 측정을 방해하지 않도록 INFO 이하는 끕니다.
+    logging.disable(logging.INFO)
+    try:
+        results = run_all(cases, sizes, args.repeat, args.max_time, report=lambda r: print(format_record(r), flush=True))
+    finally:
+        logging.disable(logging.NOTSET)
+
+    if args.save:
+        save(args.save, results)
+        print(f"\n  기준선 저장: {args.save}")
+    if args.compare:
+        rows = compare(load(args.compare)["results"], results, args.threshold)
+        print(f"\n[기준선 비교] {args.compare} (임계값 {args.threshold:.0%})")
+        print(format_comparison(rows))
+        if any(row["status"] == "regression" for row in rows):
+            sys.exit(1)
@@ -6,10 +6,52 @@ from pathlib import Path
 WATCHLIST_FILE: str = "watchlist.txt"
 LOG_FILE: str = "signals.log"
 LOG_LEVEL: str = "INFO"
+LOG_JSON: bool = False   # 파일 로그를 JSON-lines 형식으로 기록
 
 # 데이터 수집
 DATA_PERIOD: str = "1y"
 MAX_RETRY: int = 3
+RETRY_BACKOFF: float = 1.0   # 재시도 대기 기본값(초) — 지수 증가 + 지터
+FETCH_WORKERS: int = 8       # fetch_multiple 동시 수집 종목 수
+DATA_DIR: str = ""   # 지정 시 yfinance 대신 로컬 {ticker}.csv / .parquet 파일 사용
+
+# 데이터 캐시 (종목별 로컬 파일, 마지막 봉 이후만 추가 수집)
+CACHE_ENABLED: bool = True
+CACHE_DIR: str = ".cache/ohlcv"
+CACHE_TTL: int = 6 * 60 * 60   # 초 — 장 마감 후 수집한 캐시를 네트워크 없이 쓰는 상한
+CACHE_TTL_OPEN: int = 60       # 초 — 정규장 중 캐시 유효 시간 (이후 마지막 봉부터 증분 수집)
+
+# API 분석 결과 캐시 (프로세스 메모리, 본문 바이트 합계 기준 LRU)
+RESULT_CACHE_ENABLED: bool = True
+RESULT_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
+RESULT_CACHE_TTL_OPEN: int = 60             # 초 — 정규장 중 (마지막 봉이 계속 바뀜)
+RESULT_CACHE_TTL_CLOSED: int = 6 * 60 * 60  # 초 — 장 마감 후 상한 (다음 개장 전 만료)
+GZIP_MIN_BYTES: int = 1024                  # 이보다 큰 응답 본문만 gzip 압축
+GZIP_LEVEL: int = 6
+BATCH_MAX_TICKERS: int = 100   # POST /api/analyze/batch 한 번에 받는 최대 종목 수
+BATCH_WORKERS: int = 8         # 일괄 분석 동시 계산 스레드 수
+SCAN_WORKERS: int = 8          # /api/scan/stream 동시 분석 스레드 수
+SCAN_POLL_INTERVAL: int = 60   # 초 — watch 모드 재스캔 주기
+SCAN_MAX_WATCHERS: int = 4     # watch 모드 동시 연결 상한 — 넘으면 503
+SSE_KEEPALIVE: int = 15        # 초 — SSE 연결 유지 주석 간격
+
+# 단계별 소요 시간 계측 (GET /api/metrics, main.py --metrics)
+METRICS_ENABLED: bool = True
+METRICS_MAX_TICKERS: int = 1000    # 종목 라벨 상한 (넘치면 _other 로 합산)
+
+# 프로파일링 (main.py --profile, API ?profile=1 / X-Profile: 1)
+PROFILE_DIR: str = ".profiles"     # .prof / .txt 저장 위치
+PROFILE_API: bool = False          # API 요청 단위 프로파일링 허용 (create_app(profile_api=...))
+PROFILE_TOP: int = 15              # 요약에 보일 함수·할당 위치 수
+PROFILE_TRACE_FRAMES: int = 16     # tracemalloc 이 보관할 호출 스택 깊이
+
+# 캐시 예열 스케줄러 (Flask 앱 백그라운드 스레드)
+WARM_ENABLED: bool = False
+WARM_INTERVAL: int = 15 * 60       # 초 — 실행 주기 (±10% 지터)
+WARM_WORKERS: int = 4              # 동시 예열 종목 수
+WARM_JITTER: float = 5.0           # 초 — 종목별 시작 지연 상한
+WARM_PERIODS: list[str] = ["1y"]   # 예열할 조회 기간
+WARM_FORMATS: list[str] = ["rows"]  # 예열할 응답 형식
 
 # 지표 파라미터
 MA_WINDOWS: list[int] = [5, 20, 60]
@@ -24,6 +66,9 @@ BB_STD: float = 2.0
 
 # 백테스팅
 DEFAULT_CAPITAL: float = 1_000_000.0
+BACKTEST_WORKERS: int = 2               # POST /api/backtest 작업 프로세스 수
+BACKTEST_MAX_JOBS: int = 256            # 보관할 최대 작업 수 (완료 작업부터 정리)
+BACKTEST_RESULT_TTL: int = 60 * 60      # 초 — 완료된 작업 결과 보관 시간
 MIN_DATA_ROWS: int = 60
 
 
@@ -0,0 +1,120 @@
+"""OHLCV 로컬 디스크 캐시 — 종목별 컬럼형 파일(Parquet, 미설치 시 pickle) + 메타데이터"""
+from __future__ import annotations
+
+import json
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+from config import CACHE_DIR, CACHE_TTL, CACHE_TTL_OPEN
+from data.providers import safe_filename
+from utils.logger import get_logger
+from utils.market import is_market_open, last_close
+
+try:
+    import pyarrow  # noqa: F401
+    _USE_PARQUET = True
+except ImportError:
+    _USE_PARQUET = False
+
+logger = get_logger(__name__)
+
+
+class OHLCVCache:
+    """
+    종목별 OHLCV 캐시.
+
+    메타데이터:
+      - start      : 캐시가 보장하는 조회 시작일 (None 이면 전체 이력)
+      - fetched_at : 마지막 수집 시각 (epoch 초)
+    """
+
+    def __init__(self, cache_dir: str = CACHE_DIR, ttl: int = CACHE_TTL, ttl_open: int = CACHE_TTL_OPEN) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+        self.ttl_open = ttl_open
+
+    def _paths(self, ticker: str) -> tuple[Path, Path]:
+        name = safe_filename(ticker)
+        ext = "parquet" if _USE_PARQUET else "pkl"
+        return self.cache_dir / f"{name}.{ext}", self.cache_dir / f"{name}.json"
+
+    def load(self, ticker: str) -> tuple[Optional[pd.DataFrame], dict]:
+        """캐시된 DataFrame과 메타데이터를 반환합니다. 없거나 손상되면 (None, {})."""
+        data_path, meta_path = self._paths(ticker)
+        if not data_path.exists() or not meta_path.exists():
+            return None, {}
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            if _USE_PARQUET:
+                df = pd.read_parquet(data_path)
+            else:
+                df = pd.read_pickle(data_path)
+        except Exception as exc:
+            logger.warning("%s: 캐시 읽기 실패 - %s", ticker, exc)
+            return None, {}
+        if df.empty:
+            return None, {}
+        return df, meta
+
+    def save(self, ticker: str, df: pd.DataFrame, start: Optional[pd.Timestamp]) -> None:
+        """DataFrame과 메타데이터를 기록합니다. 기록 실패는 경고만 남깁니다."""
+        data_path, meta_path = self._paths(ticker)
+        meta = {
+            "start": start.strftime("%Y-%m-%d") if start is not None else None,
+            "fetched_at": time.time(),
+        }
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = data_path.with_suffix(data_path.suffix + ".tmp")
+            if _USE_PARQUET:
+                df.to_parquet(tmp_path)
+            else:
+                df.to_pickle(tmp_path)
+            tmp_path.replace(data_path)
+            meta_path.write_text(json.dumps(meta), encoding="utf-8")
+        except Exception as exc:
+            logger.warning("%s: 캐시 기록 실패 - %s", ticker, exc)
+
+    def covers(self, meta: dict, start: Optional[pd.Timestamp]) -> bool:
+        """캐시가 요청 시작일 이후 구간을 모두 포함하면 True."""
+        if "start" not in meta:
+            return False
+        if meta["start"] is None:
+            return True
+        if start is None:
+            return False
+        return pd.Timestamp(meta["start"]) <= start
+
+    def is_fresh(self, meta: dict, ticker: Optional[str] = None, now: Optional[float] = None) -> bool:
+        """
+        마지막 수집 후 TTL 이 지나지 않았으면 True.
+
+        ticker 를 주면 거래 시간도 봅니다. 정규장 중에는 마지막 봉이 계속 바뀌므로
+        ttl_open(기본 60초) 안에 수집한 캐시만, 장 마감 후에는 직전 마감 이후에 수집한
+        캐시만 (TTL 안에서) 신선합니다.
+        """
+        now = time.time() if now is None else now
+        fetched_at = meta.get("fetched_at", 0.0)
+        if now - fetched_at >= self.ttl:
+            return False
+        if ticker is None:
+            return True
+        moment = datetime.fromtimestamp(now, tz=timezone.utc)
+        if is_market_open(ticker, moment):
+            return now - fetched_at < self.ttl_open
+        return fetched_at >= last_close(ticker, moment).timestamp()
+
+    def clear(self, ticker: Optional[str] = None) -> None:
+        """지정 종목(없으면 전체)의 캐시 파일을 삭제합니다."""
+        if ticker is not None:
+            for path in self._paths(ticker):
+                path.unlink(missing_ok=True)
+            return
+        if self.cache_dir.exists():
+            for path in self.cache_dir.iterdir():
+                if path.is_file():
+                    path.unlink()
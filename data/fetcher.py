@@ -1,48 +1,236 @@
 from __future__ import annotations
 
+import random
 import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
 
 import pandas as pd
-import yfinance as yf
 
-from config import DATA_PERIOD, MAX_RETRY
+from config import (
+    CACHE_ENABLED,
+    DATA_DIR,
+    DATA_PERIOD,
+    FETCH_WORKERS,
+    MAX_RETRY,
+    RETRY_BACKOFF,
+)
+from data.cache import OHLCVCache
+from data.providers import (  # noqa: F401 (DataFetchError 재노출)
+    DataFetchError,
+    DataProvider,
+    FileProvider,
+    YFinanceProvider,
+    period_start,
+)
 from utils.logger import get_logger
+from utils.metrics import span
+from utils.singleflight import SingleFlight
 
 logger = get_logger(__name__)
 
+_cache: Optional[OHLCVCache] = OHLCVCache() if CACHE_ENABLED else None
+_provider: DataProvider = FileProvider(DATA_DIR) if DATA_DIR else YFinanceProvider()
+_inflight = SingleFlight()
 
-class DataFetchError(Exception):
-    """데이터 수집 실패"""
 
+def get_provider() -> DataProvider:
+    """현재 기본 데이터 공급자를 반환합니다."""
+    return _provider
 
-def fetch_ohlcv(ticker: str, period: str = DATA_PERIOD) -> pd.DataFrame:
-    """yfinance로 일봉 데이터를 수집합니다. 실패 시 MAX_RETRY회 재시도합니다."""
+
+def set_provider(provider: DataProvider) -> None:
+    """기본 데이터 공급자를 교체합니다 (CLI / Flask / 백테스터 공통)."""
+    global _provider
+    _provider = provider
+    logger.info("데이터 공급자: %s", provider.name)
+
+
+def _download(
+    ticker: str,
+    provider: DataProvider,
+    period: Optional[str] = None,
+    start: Optional[pd.Timestamp] = None,
+) -> pd.DataFrame:
+    """
+    공급자로 일봉 데이터를 수집합니다.
+
+    실패 시 MAX_RETRY회까지 재시도하며, 대기 시간은
+    RETRY_BACKOFF * 2^(시도-1) 에 0~RETRY_BACKOFF 초 지터를 더합니다.
+    """
     for attempt in range(1, MAX_RETRY + 1):
         try:
-            df = yf.download(ticker, period=period, progress=False, auto_adjust=True)
+            df = provider.download(ticker, period=period, start=start)
             if df.empty:
                 raise DataFetchError(f"{ticker}: 데이터 없음")
-            # 멀티인덱스 컬럼 평탄화
-            if isinstance(df.columns, pd.MultiIndex):
-                df.columns = df.columns.get_level_values(0)
-            logger.info(f"{ticker}: {len(df)}행 수집 완료")
+            logger.info("%s: %d행 수집 완료", ticker, len(df))
             return df
         except DataFetchError:
             raise
         except Exception as exc:
-            logger.warning(f"{ticker}: 수집 실패 ({attempt}/{MAX_RETRY}) - {exc}")
+            logger.warning("%s: 수집 실패 (%d/%d) - %s", ticker, attempt, MAX_RETRY, exc)
             if attempt < MAX_RETRY:
-                time.sleep(1)
+                time.sleep(RETRY_BACKOFF * 2 ** (attempt - 1) + random.uniform(0, RETRY_BACKOFF))
 
     raise DataFetchError(f"{ticker}: {MAX_RETRY}회 재시도 후 실패")
 
 
-def fetch_multiple(tickers: list[str]) -> dict[str, pd.DataFrame]:
-    """여러 종목을 일괄 수집합니다. 실패 종목은 건너뜁니다."""
+def _refresh_tail(ticker: str, provider: DataProvider, cached: pd.DataFrame) -> Optional[pd.DataFrame]:
+    """캐시 마지막 봉부터 다시 수집해 병합합니다. 새 데이터가 없으면 None."""
+    last = cached.index[-1]
+    try:
+        tail = _download(ticker, provider, start=last)
+    except DataFetchError as exc:
+        logger.warning("%s: 증분 수집 실패, 캐시 사용 - %s", ticker, exc)
+        return None
+    # 마지막 봉은 장중 값일 수 있으므로 새로 받은 값으로 덮어씁니다.
+    merged = pd.concat([cached[cached.index < tail.index[0]], tail])
+    return merged[~merged.index.duplicated(keep="last")]
+
+
+def fetch_ohlcv(
+    ticker: str,
+    period: str = DATA_PERIOD,
+    use_cache: bool = True,
+    provider: Optional[DataProvider] = None,
+    refresh: bool = False,
+) -> pd.DataFrame:
+    """
+    일봉 데이터를 반환합니다.
+
+    캐시가 요청 구간을 포함하고 신선하면 (장 마감 후 수집, TTL 이내) 네트워크 없이
+    반환하고, 정규장 중이거나 TTL 이 지났으면 마지막 캐시 봉 이후만 추가 수집해 병합합니다.
+    provider 를 생략하면 set_provider 로 지정한 기본 공급자를 사용합니다.
+    refresh=True 이면 TTL 과 무관하게 캐시를 만료된 것으로 보고 증분 수집합니다.
+
+    같은 (공급자, 종목, 기간) 수집이 이미 진행 중이면 새로 수집하지 않고 그 결과
+    (또는 예외)를 함께 받습니다. 이때 반환되는 DataFrame 은 호출자 간에 공유되므로
+    수정하지 말고 clean() 처럼 복사본을 만들어 사용합니다.
+    """
+    provider = provider or _provider
+
+    def lead() -> pd.DataFrame:
+        # on_fetched 는 실제로 수집한 호출에서만 한 번 부릅니다. 기다리기만 한
+        # 호출까지 부르면 RecordingProvider 가 같은 아카이브를 여러 번 씁니다.
+        started = time.perf_counter()
+        df = _fetch_ohlcv(ticker, period, use_cache, provider, refresh)
+        provider.on_fetched(ticker, period, df, time.perf_counter() - started)
+        return df
+
+    with span("fetch", ticker):
+        return _inflight.do((provider, ticker, period, use_cache, refresh), lead)
+
+
+def _fetch_ohlcv(
+    ticker: str, period: str, use_cache: bool, provider: DataProvider, refresh: bool
+) -> pd.DataFrame:
+    cache = _cache if use_cache and provider.cacheable else None
+    if cache is None:
+        return _download(ticker, provider, period=period)
+
+    start = period_start(period)
+    cached, meta = cache.load(ticker)
+
+    if cached is not None and cache.covers(meta, start):
+        if cache.is_fresh(meta, ticker) and not refresh:
+            logger.debug("%s: 캐시 적중", ticker)
+        else:
+            merged = _refresh_tail(ticker, provider, cached)
+            # 증분 수집이 실패하면 이전 캐시를 그대로 쓰되, 수집 시각은 갱신하지 않아
+            # 다음 호출에서 다시 시도합니다.
+            if merged is not None:
+                cached = merged
+                cache.save(ticker, cached, pd.Timestamp(meta["start"]) if meta["start"] else None)
+        df = cached if start is None else cached.loc[start:]
+        if df.empty:
+            raise DataFetchError(f"{ticker}: 데이터 없음")
+        return df
+
+    df = _download(ticker, provider, period=period)
+    cache.save(ticker, df, start)
+    return df
+
+
+def _fetch_bulk(
+    tickers: list[str],
+    provider: DataProvider,
+    period: str,
+) -> dict[str, pd.DataFrame]:
+    """
+    캐시로 해결되지 않는 종목을 공급자의 일괄 수집으로 한 번에 받습니다.
+
+    일괄 수집에서 빠졌거나 비어 있는 종목은 결과에서 제외되어
+    호출 측의 종목별 수집(재시도 포함)으로 넘어갑니다.
+    """
+    cache = _cache if provider.cacheable else None
+    start = period_start(period)
     results: dict[str, pd.DataFrame] = {}
+    pending: list[str] = []
     for ticker in tickers:
+        cached, meta = cache.load(ticker) if cache is not None else (None, {})
+        if cached is not None and cache.covers(meta, start) and cache.is_fresh(meta, ticker):
+            results[ticker] = cached if start is None else cached.loc[start:]
+        else:
+            pending.append(ticker)
+
+    if not pending:
+        return results
+    try:
+        bulk = provider.download_many(pending, period)
+    except Exception as exc:
+        logger.warning("일괄 수집 실패, 종목별 수집으로 전환 - %s", exc)
+        return results
+
+    for ticker, df in bulk.items():
+        if df.empty:
+            continue
+        if cache is not None:
+            cache.save(ticker, df, start)
+        results[ticker] = df
+    logger.info("일괄 수집: %d/%d개 종목", len(bulk), len(pending))
+    return results
+
+
+def fetch_multiple(
+    tickers: list[str],
+    provider: Optional[DataProvider] = None,
+    period: str = DATA_PERIOD,
+    max_workers: int = FETCH_WORKERS,
+    bulk: bool = False,
+    errors: Optional[dict[str, DataFetchError]] = None,
+) -> dict[str, pd.DataFrame]:
+    """
+    여러 종목을 일괄 수집합니다. 실패 종목은 건너뜁니다.
+
+    bulk=True 이면 먼저 공급자의 일괄 수집을 한 번 호출하고, 나머지 종목은
+    최대 max_workers 개 스레드에서 종목별로 (각자 재시도하며) 수집합니다.
+    결과는 입력 순서를 유지합니다. errors 를 주면 실패 종목의 예외를 종목별로 담습니다.
+    """
+    provider = provider or _provider
+    fetched: dict[str, pd.DataFrame] = {}
+    if bulk:
+        started = time.perf_counter()
+        fetched = _fetch_bulk(tickers, provider, period)
+        # fetch_ohlcv 를 거치지 않은 응답도 공급자에 알립니다 (소요 시간은 종목 수로 나눔).
+        elapsed = (time.perf_counter() - started) / max(len(fetched), 1)
+        for ticker, df in fetched.items():
+            provider.on_fetched(ticker, period, df, elapsed)
+    remaining = [t for t in tickers if t not in fetched]
+
+    def _fetch_one(ticker: str) -> Optional[pd.DataFrame]:
         try:
-            results[ticker] = fetch_ohlcv(ticker)
+            return fetch_ohlcv(ticker, period=period, provider=provider)
         except DataFetchError as exc:
-            logger.error(f"{ticker}: 건너뜀 - {exc}")
-    return results
+            logger.error("%s: 건너뜀 - %s", ticker, exc)
+            if errors is not None:
+                errors[ticker] = exc
+            return None
+
+    if remaining:
+        workers = max(1, min(max_workers, len(remaining)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for ticker, df in zip(remaining, pool.map(_fetch_one, remaining)):
+                if df is not None:
+                    fetched[ticker] = df
+
+    return {t: fetched[t] for t in tickers if t in fetched}
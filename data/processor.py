@@ -4,6 +4,7 @@ import pandas as pd
 
 from config import MIN_DATA_ROWS
 from utils.logger import get_logger
+from utils.metrics import span
 
 logger = get_logger(__name__)
 
@@ -14,12 +15,17 @@ class InsufficientDataError(Exception):
 
 def clean(df: pd.DataFrame) -> pd.DataFrame:
     """결측값을 제거하고 데이터 타입을 정규화합니다."""
+    with span("clean"):
+        return _clean(df)
+
+
+def _clean(df: pd.DataFrame) -> pd.DataFrame:
     df = df.copy()
     before = len(df)
     df.dropna(inplace=True)
     removed = before - len(df)
     if removed:
-        logger.debug(f"결측값 {removed}행 제거")
+        logger.debug("결측값 %d행 제거", removed)
     for col in ["Open", "High", "Low", "Close"]:
         if col in df.columns:
             df[col] = df[col].astype(float)
@@ -0,0 +1,161 @@
+"""OHLCV 데이터 소스 — yfinance / 로컬 파일(CSV, Parquet) 공급자"""
+from __future__ import annotations
+
+import re
+import threading
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Optional
+
+import pandas as pd
+
+OHLCV_COLUMNS: list[str] = ["Open", "High", "Low", "Close", "Volume"]
+_PRICE_DTYPES = {"Open": "float64", "High": "float64", "Low": "float64", "Close": "float64"}
+_PERIOD_UNITS = {"d": "days", "mo": "months", "y": "years"}
+
+
+class DataFetchError(Exception):
+    """데이터 수집 실패"""
+
+
+def period_start(period: str, today: Optional[pd.Timestamp] = None) -> Optional[pd.Timestamp]:
+    """yfinance period 문자열("1y", "6mo", "ytd", "max" 등)의 시작일을 반환합니다."""
+    if period == "max":
+        return None
+    today = (today or pd.Timestamp.today()).normalize()
+    if period == "ytd":
+        return pd.Timestamp(year=today.year, month=1, day=1)
+    match = re.fullmatch(r"(\d+)(d|mo|y)", period)
+    if match is None:
+        raise ValueError(f"지원하지 않는 period: {period}")
+    n, unit = int(match.group(1)), match.group(2)
+    return today - pd.DateOffset(**{_PERIOD_UNITS[unit]: n})
+
+
+def safe_filename(ticker: str) -> str:
+    """종목 코드를 파일명으로 쓸 수 있는 문자열로 바꿉니다."""
+    return re.sub(r"[^0-9A-Za-z._^=-]", "_", ticker)
+
+
+class DataProvider(ABC):
+    """일봉 OHLCV 공급자 인터페이스."""
+
+    name: str = "base"
+    cacheable: bool = True   # False 이면 fetch_ohlcv 가 디스크 캐시를 거치지 않음
+
+    @abstractmethod
+    def download(
+        self,
+        ticker: str,
+        period: Optional[str] = None,
+        start: Optional[pd.Timestamp] = None,
+    ) -> pd.DataFrame:
+        """
+        period 또는 start 이후의 일봉을 반환합니다.
+
+        데이터가 없으면 빈 DataFrame을 반환하고, 재시도해도 소용없는 실패는
+        DataFetchError를 던집니다. 그 외 예외는 호출 측에서 재시도합니다.
+        """
+
+    def download_many(self, tickers: list[str], period: str) -> dict[str, pd.DataFrame]:
+        """여러 종목을 한 번에 수집합니다. 기본 구현은 종목별 download 를 반복합니다."""
+        return {t: self.download(t, period=period) for t in tickers}
+
+    def on_fetched(self, ticker: str, period: str, df: pd.DataFrame, elapsed: float) -> None:
+        """fetch_ohlcv 가 (캐시 적중 포함) 반환한 응답을 받습니다. 기본 구현은 아무것도 하지 않습니다."""
+
+
+class YFinanceProvider(DataProvider):
+    """
+    yfinance 기반 공급자.
+
+    yf.download 는 모듈 전역 상태를 공유해 동시 호출에 안전하지 않으므로,
+    종목별 수집은 Ticker.history 를 쓰고 일괄 수집(yf.download)은 잠금으로 직렬화합니다.
+    """
+
+    name = "yfinance"
+    _bulk_lock = threading.Lock()
+
+    def download(
+        self,
+        ticker: str,
+        period: Optional[str] = None,
+        start: Optional[pd.Timestamp] = None,
+    ) -> pd.DataFrame:
+        import yfinance as yf
+
+        kwargs = {"period": period} if start is None else {"start": start.strftime("%Y-%m-%d")}
+        df = yf.Ticker(ticker).history(auto_adjust=True, **kwargs)
+        return _normalize_yf(df)
+
+    def download_many(self, tickers: list[str], period: str) -> dict[str, pd.DataFrame]:
+        import yfinance as yf
+
+        with self._bulk_lock:
+            raw = yf.download(
+                tickers, period=period, group_by="ticker",
+                progress=False, auto_adjust=True, threads=True,
+            )
+        results: dict[str, pd.DataFrame] = {}
+        if raw.empty:
+            return results
+        if not isinstance(raw.columns, pd.MultiIndex):
+            return {tickers[0]: _normalize_yf(raw)} if len(tickers) == 1 else results
+        available = set(raw.columns.get_level_values(0))
+        for ticker in tickers:
+            if ticker in available:
+                results[ticker] = _normalize_yf(raw[ticker].dropna(how="all"))
+        return results
+
+
+def _normalize_yf(df: pd.DataFrame) -> pd.DataFrame:
+    """yfinance 결과를 tz 없는 날짜 인덱스 + OHLCV 컬럼으로 정규화합니다."""
+    if isinstance(df.columns, pd.MultiIndex):
+        df.columns = df.columns.get_level_values(0)
+    if isinstance(df.index, pd.DatetimeIndex) and df.index.tz is not None:
+        df.index = df.index.tz_localize(None)
+    df.index.name = "Date"
+    return df[[c for c in OHLCV_COLUMNS if c in df.columns]]
+
+
+class FileProvider(DataProvider):
+    """
+    로컬 디렉터리({ticker}.parquet 또는 {ticker}.csv) 기반 공급자.
+
+    CSV 는 첫 컬럼을 날짜 인덱스로, 가격 컬럼은 float64 로 한 번에 읽습니다.
+    period 는 오늘이 아니라 파일의 마지막 봉을 기준으로 자릅니다
+    (사전에 준비된 과거 데이터셋에서도 같은 구간이 나오도록).
+    """
+
+    name = "file"
+    cacheable = False
+
+    def __init__(self, data_dir: str) -> None:
+        self.data_dir = Path(data_dir)
+
+    def _read(self, ticker: str) -> pd.DataFrame:
+        name = safe_filename(ticker)
+        parquet_path = self.data_dir / f"{name}.parquet"
+        csv_path = self.data_dir / f"{name}.csv"
+        if parquet_path.exists():
+            df = pd.read_parquet(parquet_path)
+        elif csv_path.exists():
+            df = pd.read_csv(csv_path, index_col=0, parse_dates=True, dtype=_PRICE_DTYPES)
+        else:
+            raise DataFetchError(f"{ticker}: {self.data_dir} 에 데이터 파일 없음")
+        df.columns = [str(c).title() for c in df.columns]
+        df.index.name = "Date"
+        return df[[c for c in OHLCV_COLUMNS if c in df.columns]]
+
+    def download(
+        self,
+        ticker: str,
+        period: Optional[str] = None,
+        start: Optional[pd.Timestamp] = None,
+    ) -> pd.DataFrame:
+        df = self._read(ticker)
+        if df.empty:
+            return df
+        if start is None and period is not None:
+            start = period_start(period, today=df.index[-1])
+        return df if start is None else df.loc[start:]
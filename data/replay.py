@@ -0,0 +1,175 @@
+"""
+녹화/재생 공급자 — fetch_ohlcv 응답을 로컬 아카이브에 기록하고 네트워크 없이 그대로 재생합니다.
+
+아카이브는 디렉터리 하나이며, (종목, 기간) 응답마다 압축 npz 파일 하나
+({종목}__{기간}.npz)에 OHLCV 배열·날짜 인덱스·원래 소요 시간을 담습니다. 파일은 임시
+파일에 쓴 뒤 교체하므로 여러 스레드·프로세스가 동시에 녹화해도 깨지지 않고, 같은 키를
+다시 받으면 마지막 응답으로 덮어씁니다. 디렉터리째 복사하면 CI·다른 PC 에서 같은
+스캔을 그대로 재현할 수 있습니다.
+"""
+from __future__ import annotations
+
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+import pandas as pd
+
+from data.providers import (
+    OHLCV_COLUMNS,
+    DataFetchError,
+    DataProvider,
+    period_start,
+    safe_filename,
+)
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+LATENCY_RECORDED = "recorded"   # 녹화 당시 소요 시간만큼 지연
+
+
+def _entry_path(archive: Path, ticker: str, period: str) -> Path:
+    return archive / f"{safe_filename(ticker)}__{safe_filename(period)}.npz"
+
+
+def save_response(archive: Union[str, Path], ticker: str, period: str, df: pd.DataFrame, elapsed: float) -> Path:
+    """응답 하나를 아카이브에 원자적으로 기록합니다."""
+    archive = Path(archive)
+    archive.mkdir(parents=True, exist_ok=True)
+    arrays = {col: df[col].to_numpy() for col in OHLCV_COLUMNS if col in df.columns}
+    path = _entry_path(archive, ticker, period)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    with open(tmp, "wb") as fh:
+        np.savez_compressed(
+            fh,
+            index=pd.DatetimeIndex(df.index).to_numpy(),
+            ticker=np.array(ticker),
+            period=np.array(period),
+            elapsed=np.array(float(elapsed)),
+            recorded_at=np.array(datetime.now(timezone.utc).isoformat(timespec="seconds")),
+            **arrays,
+        )
+    os.replace(tmp, path)
+    return path
+
+
+def load_response(path: Union[str, Path]) -> tuple[pd.DataFrame, float]:
+    """기록된 응답을 (DataFrame, 녹화 당시 소요 시간) 으로 읽습니다."""
+    with np.load(path, allow_pickle=False) as data:
+        columns = {col: data[col] for col in OHLCV_COLUMNS if col in data.files}
+        index = pd.DatetimeIndex(data["index"], name="Date")
+        return pd.DataFrame(columns, index=index), float(data["elapsed"])
+
+
+class RecordingProvider(DataProvider):
+    """
+    다른 공급자를 감싸 수집은 그대로 맡기고, fetch_ohlcv 응답을 아카이브에 기록합니다.
+
+    디스크 캐시 적중 응답도 기록되므로 재생 결과는 녹화 당시 호출 측이 받은 값과 같습니다.
+    """
+
+    def __init__(self, inner: DataProvider, archive: Union[str, Path]) -> None:
+        self.inner = inner
+        self.archive = Path(archive)
+        self.name = f"record:{inner.name}"
+        self.cacheable = inner.cacheable
+
+    def download(
+        self,
+        ticker: str,
+        period: Optional[str] = None,
+        start: Optional[pd.Timestamp] = None,
+    ) -> pd.DataFrame:
+        return self.inner.download(ticker, period=period, start=start)
+
+    def download_many(self, tickers: list[str], period: str) -> dict[str, pd.DataFrame]:
+        return self.inner.download_many(tickers, period)
+
+    def on_fetched(self, ticker: str, period: str, df: pd.DataFrame, elapsed: float) -> None:
+        try:
+            save_response(self.archive, ticker, period, df, elapsed)
+        except OSError as exc:
+            logger.warning("%s: 녹화 실패 - %s", ticker, exc)
+        self.inner.on_fetched(ticker, period, df, elapsed)
+
+
+class ReplayProvider(DataProvider):
+    """
+    아카이브에 기록된 응답을 돌려주는 공급자 (네트워크·디스크 캐시 없음).
+
+    같은 (종목, 기간) 기록이 있으면 그대로, 없으면 그 종목의 가장 긴 기록을 마지막 봉
+    기준 기간으로 잘라 돌려줍니다. 종목 기록이 아예 없으면 DataFetchError.
+    latency: None(지연 없음) / 초(고정 지연) / "recorded"(녹화 당시 소요 시간).
+    """
+
+    name = "replay"
+    cacheable = False
+
+    def __init__(self, archive: Union[str, Path], latency: Union[float, str, None] = None) -> None:
+        self.archive = Path(archive)
+        if not self.archive.is_dir():
+            raise DataFetchError(f"녹화 아카이브 없음: {self.archive}")
+        self.latency = latency
+        self._loaded: dict[Path, tuple[pd.DataFrame, float]] = {}
+
+    def _read(self, path: Path) -> tuple[pd.DataFrame, float]:
+        entry = self._loaded.get(path)
+        if entry is None:
+            entry = self._loaded[path] = load_response(path)
+        return entry
+
+    def _lookup(self, ticker: str, period: Optional[str]) -> tuple[pd.DataFrame, float]:
+        if period is not None:
+            path = _entry_path(self.archive, ticker, period)
+            if path.exists():
+                return self._read(path)
+        candidates = [self._read(p) for p in sorted(self.archive.glob(f"{safe_filename(ticker)}__*.npz"))]
+        if not candidates:
+            raise DataFetchError(f"{ticker}: 녹화 아카이브에 기록 없음")
+        df, elapsed = max(candidates, key=lambda entry: len(entry[0]))
+        start = period_start(period, today=df.index[-1]) if period is not None and not df.empty else None
+        return (df if start is None else df.loc[start:]), elapsed
+
+    def _wait(self, elapsed: float) -> None:
+        delay = elapsed if self.latency == LATENCY_RECORDED else float(self.latency or 0.0)
+        if delay > 0:
+            time.sleep(delay)
+
+    def download(
+        self,
+        ticker: str,
+        period: Optional[str] = None,
+        start: Optional[pd.Timestamp] = None,
+    ) -> pd.DataFrame:
+        df, elapsed = self._lookup(ticker, period)
+        self._wait(elapsed)
+        return df if start is None else df.loc[start:]
+
+    def download_many(self, tickers: list[str], period: str) -> dict[str, pd.DataFrame]:
+        results: dict[str, pd.DataFrame] = {}
+        for ticker in tickers:
+            try:
+                results[ticker] = self.download(ticker, period=period)
+            except DataFetchError:
+                continue
+        return results
+
+    def __getstate__(self) -> dict:
+        # 프로세스 풀로 보낼 때 읽어 둔 프레임은 빼고 경로만 넘깁니다.
+        state = self.__dict__.copy()
+        state["_loaded"] = {}
+        return state
+
+
+def parse_latency(text: Optional[str]) -> Union[float, str, None]:
+    """CLI/환경변수 값 → ReplayProvider latency ("recorded" 또는 초)."""
+    if not text:
+        return None
+    if text == LATENCY_RECORDED:
+        return LATENCY_RECORDED
+    return float(text)
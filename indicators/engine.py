@@ -0,0 +1,234 @@
+"""
+통합 지표 엔진 — 모든 지표를 NumPy 배열 위에서 한 번에 계산합니다.
+
+add_ma / add_rsi / ... 를 연쇄 호출하면 DataFrame 이 지표마다 복사되고
+True Range 등 공통 중간값이 중복 계산됩니다. 이 모듈은 OHLCV 배열을 한 번만
+꺼내 중간값(전일 종가, True Range, 이동 윈도우)을 공유하고, 결과를 미리 할당한
+하나의 2차원 블록에 기록한 뒤 원본과 한 번만 합칩니다. 지표별 결과는 IndicatorCache 에
+그 지표가 쓰는 파라미터 단위로 남으므로, 같은 데이터에 파라미터만 바꿔 다시 계산할 때
+바뀐 지표만 새로 계산합니다.
+EWM·이동평균·표준편차는 기존 함수와 같은 값을 내도록 pandas 1차원 커널을 사용합니다.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+import numpy as np
+import pandas as pd
+
+from config import (
+    BB_PERIOD,
+    BB_STD,
+    MA_WINDOWS,
+    MACD_FAST,
+    MACD_SIGNAL,
+    MACD_SLOW,
+    RSI_PERIOD,
+)
+from indicators.adx import ADX_PERIOD, VOLUME_MA_PERIOD
+from indicators.atr import ATR_PERIOD
+from indicators.stochastic import STOCH_D, STOCH_K
+
+
+@dataclass(frozen=True)
+class IndicatorParams:
+    """지표 파라미터 묶음 (기본값은 config / 각 지표 모듈 상수)."""
+
+    ma_windows: tuple[int, ...] = tuple(MA_WINDOWS)
+    rsi_period: int = RSI_PERIOD
+    macd_fast: int = MACD_FAST
+    macd_slow: int = MACD_SLOW
+    macd_signal: int = MACD_SIGNAL
+    bb_period: int = BB_PERIOD
+    bb_std: float = BB_STD
+    stoch_k: int = STOCH_K
+    stoch_d: int = STOCH_D
+    atr_period: int = ATR_PERIOD
+    adx_period: int = ADX_PERIOD
+    volume_ma_period: int = VOLUME_MA_PERIOD
+
+    def columns(self) -> list[str]:
+        """compute_indicators 가 추가하는 컬럼 이름 (기존 add_* 연쇄 순서)."""
+        return (
+            [f"MA{w}" for w in self.ma_windows]
+            + ["RSI", "MACD", "MACD_signal", "BB_mid", "BB_upper", "BB_lower",
+               "Stoch_K", "Stoch_D", "ATR", "ADX", "Plus_DI", "Minus_DI", "Volume_MA"]
+        )
+
+
+DEFAULT_PARAMS = IndicatorParams()
+
+
+class _Windows:
+    """배열별 이동평균/표준편차를 (배열 이름, 윈도우) 단위로 한 번만 계산해 공유합니다."""
+
+    def __init__(self) -> None:
+        self._series: dict[str, pd.Series] = {}
+        self._means: dict[tuple[str, int], np.ndarray] = {}
+        self._stds: dict[tuple[str, int], np.ndarray] = {}
+
+    def register(self, name: str, values: np.ndarray) -> None:
+        self._series[name] = pd.Series(values, copy=False)
+
+    def mean(self, name: str, window: int) -> np.ndarray:
+        key = (name, window)
+        if key not in self._means:
+            self._means[key] = self._series[name].rolling(window=window).mean().to_numpy()
+        return self._means[key]
+
+    def std(self, name: str, window: int) -> np.ndarray:
+        key = (name, window)
+        if key not in self._stds:
+            self._stds[key] = self._series[name].rolling(window=window).std().to_numpy()
+        return self._stds[key]
+
+
+def _ewm(values: np.ndarray, span: int) -> np.ndarray:
+    return pd.Series(values, copy=False).ewm(span=span, adjust=False).mean().to_numpy()
+
+
+def _rolling_extreme(values: np.ndarray, window: int, func) -> np.ndarray:
+    """윈도우 최소/최대 — 앞쪽 window-1 개는 NaN."""
+    out = np.full(len(values), np.nan)
+    if len(values) >= window:
+        out[window - 1:] = func(np.lib.stride_tricks.sliding_window_view(values, window), axis=1)
+    return out
+
+
+def _shift(values: np.ndarray) -> np.ndarray:
+    out = np.empty_like(values)
+    out[:1] = np.nan
+    out[1:] = values[:-1]
+    return out
+
+
+class IndicatorCache:
+    """
+    OHLCV 하나에 대한 지표 결과를 지표별로, 그 지표가 쓰는 파라미터 단위로 캐시합니다.
+
+    파라미터 스윕처럼 같은 데이터에 여러 IndicatorParams 를 적용할 때, 바뀐
+    파라미터에 의존하는 지표만 다시 계산하고 나머지(예: rsi_period 만 바꿀 때의
+    MA·MACD·볼린저·스토캐스틱·ATR·ADX)는 이전 결과를 그대로 씁니다.
+    반환 배열은 캐시와 공유되므로 수정하지 않습니다.
+    """
+
+    def __init__(self, df: pd.DataFrame) -> None:
+        self.df = df
+        self.high = df["High"].to_numpy(dtype=float)
+        self.low = df["Low"].to_numpy(dtype=float)
+        self.close = df["Close"].to_numpy(dtype=float)
+        self.prev_close = _shift(self.close)
+        self.windows = _Windows()
+        self.windows.register("close", self.close)
+        self.windows.register("volume", df["Volume"].to_numpy(dtype=float))
+        self._results: dict[tuple, tuple[np.ndarray, ...]] = {}
+
+    def _get(self, key: tuple, compute: Callable[[], tuple[np.ndarray, ...]]) -> tuple[np.ndarray, ...]:
+        result = self._results.get(key)
+        if result is None:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                result = self._results[key] = compute()
+        return result
+
+    def _series(self, name: str) -> str:
+        """파생 입력(gain/loss/tr)을 처음 필요할 때 한 번만 만들어 windows 에 등록합니다."""
+        def build() -> tuple[np.ndarray, ...]:
+            high, low, close, prev_close = self.high, self.low, self.close, self.prev_close
+            if name == "tr":
+                # True Range — ATR 과 ADX 가 공유 (첫 봉은 High - Low)
+                values = np.fmax(np.fmax(high - low, np.abs(high - prev_close)), np.abs(low - prev_close))
+            elif name == "gain":
+                values = np.maximum(close - prev_close, 0.0)
+            else:
+                values = -np.minimum(close - prev_close, 0.0)
+            self.windows.register(name, values)
+            return (values,)
+
+        self._get(("series", name), build)
+        return name
+
+    def _rsi(self, period: int) -> tuple[np.ndarray, ...]:
+        gain = self.windows.mean(self._series("gain"), period)
+        loss = self.windows.mean(self._series("loss"), period)
+        rs = gain / np.where(loss == 0, np.nan, loss)
+        return (100 - (100 / (1 + rs)),)
+
+    def _ewm_close(self, span: int) -> np.ndarray:
+        return self._get(("ewm", span), lambda: (_ewm(self.close, span),))[0]
+
+    def _macd(self, fast: int, slow: int, signal: int) -> tuple[np.ndarray, ...]:
+        macd = self._ewm_close(fast) - self._ewm_close(slow)
+        return macd, _ewm(macd, signal)
+
+    def _bollinger(self, period: int, num_std: float) -> tuple[np.ndarray, ...]:
+        # BB_mid 는 같은 윈도우의 MA 와 공유
+        bb_mid = self.windows.mean("close", period)
+        bb_std = self.windows.std("close", period)
+        return bb_mid, bb_mid + num_std * bb_std, bb_mid - num_std * bb_std
+
+    def _stoch_k(self, k: int) -> str:
+        def build() -> tuple[np.ndarray, ...]:
+            lowest_low = _rolling_extreme(self.low, k, np.min)
+            highest_high = _rolling_extreme(self.high, k, np.max)
+            values = (self.close - lowest_low) / (highest_high - lowest_low) * 100
+            self.windows.register(f"stoch_k{k}", values)
+            return (values,)
+
+        self._get(("stoch_k", k), build)
+        return f"stoch_k{k}"
+
+    def _stochastic(self, k: int, d: int) -> tuple[np.ndarray, ...]:
+        name = self._stoch_k(k)
+        return self._results[("stoch_k", k)][0], self.windows.mean(name, d)
+
+    def _adx(self, period: int) -> tuple[np.ndarray, ...]:
+        high, low = self.high, self.low
+        plus_dm = high - _shift(high)
+        minus_dm = _shift(low) - low
+        plus_dm = np.where((plus_dm > minus_dm) & (plus_dm > 0), plus_dm, 0.0)
+        minus_dm = np.where((minus_dm > plus_dm) & (minus_dm > 0), minus_dm, 0.0)
+        atr_ewm = _ewm(self._results[("series", self._series("tr"))][0], period)
+        plus_di = 100 * _ewm(plus_dm, period) / atr_ewm
+        minus_di = 100 * _ewm(minus_dm, period) / atr_ewm
+        di_sum = plus_di + minus_di
+        dx = np.abs(plus_di - minus_di) / np.where(di_sum == 0, np.nan, di_sum) * 100
+        return _ewm(dx, period), plus_di, minus_di
+
+    def arrays(self, params: Optional[IndicatorParams] = None) -> list[np.ndarray]:
+        """params.columns() 순서의 지표 배열 목록."""
+        p = params or DEFAULT_PARAMS
+        windows = self.windows
+        out = [windows.mean("close", w) for w in p.ma_windows]
+        out += self._get(("rsi", p.rsi_period), lambda: self._rsi(p.rsi_period))
+        out += self._get(("macd", p.macd_fast, p.macd_slow, p.macd_signal),
+                         lambda: self._macd(p.macd_fast, p.macd_slow, p.macd_signal))
+        out += self._get(("bb", p.bb_period, p.bb_std), lambda: self._bollinger(p.bb_period, p.bb_std))
+        out += self._get(("stoch", p.stoch_k, p.stoch_d), lambda: self._stochastic(p.stoch_k, p.stoch_d))
+        out.append(windows.mean(self._series("tr"), p.atr_period))
+        out += self._get(("adx", p.adx_period), lambda: self._adx(p.adx_period))
+        out.append(windows.mean("volume", p.volume_ma_period))
+        return out
+
+    def frame(self, params: Optional[IndicatorParams] = None) -> pd.DataFrame:
+        """원본 OHLCV 에 params 의 지표 컬럼을 더한 새 DataFrame."""
+        p = params or DEFAULT_PARAMS
+        columns = p.columns()
+        out = np.empty((len(self.df), len(columns)))
+        for i, values in enumerate(self.arrays(p)):
+            out[:, i] = values
+        block = pd.DataFrame(out, index=self.df.index, columns=columns)
+        base = self.df.drop(columns=[c for c in columns if c in self.df.columns])
+        return pd.concat([base, block], axis=1)
+
+
+def compute_indicators(df: pd.DataFrame, params: Optional[IndicatorParams] = None) -> pd.DataFrame:
+    """
+    모든 지표 컬럼을 한 번에 추가한 새 DataFrame을 반환합니다.
+
+    결과 컬럼과 값은 add_ma → add_rsi → add_macd → add_bollinger →
+    add_stochastic → add_atr → add_adx → add_volume_ma 연쇄 호출과 같습니다.
+    같은 데이터에 여러 파라미터를 적용할 때는 IndicatorCache 를 직접 쓰면
+    바뀌지 않은 지표를 다시 계산하지 않습니다.
+    """
+    return IndicatorCache(df).frame(params)
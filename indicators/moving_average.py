@@ -13,14 +13,15 @@ def add_ma(df: pd.DataFrame, windows: list[int] = MA_WINDOWS) -> pd.DataFrame:
     return df
 
 
-def detect_crossover(df: pd.DataFrame) -> pd.Series:
-    """골든크로스(+1) / 데드크로스(-1) / 없음(0) 시리즈를 반환합니다."""
-    if "MA5" not in df.columns or "MA20" not in df.columns:
+def detect_crossover(df: pd.DataFrame, fast: int = 5, slow: int = 20) -> pd.Series:
+    """골든크로스(+1) / 데드크로스(-1) / 없음(0) 시리즈를 반환합니다 (기본 MA5 / MA20)."""
+    fast_col, slow_col = f"MA{fast}", f"MA{slow}"
+    if fast_col not in df.columns or slow_col not in df.columns:
         return pd.Series(0, index=df.index)
 
     cross = pd.Series(0, index=df.index)
-    prev_diff = df["MA5"].shift(1) - df["MA20"].shift(1)
-    curr_diff = df["MA5"] - df["MA20"]
+    prev_diff = df[fast_col].shift(1) - df[slow_col].shift(1)
+    curr_diff = df[fast_col] - df[slow_col]
 
     cross[(prev_diff < 0) & (curr_diff >= 0)] = 1   # 골든크로스
     cross[(prev_diff > 0) & (curr_diff <= 0)] = -1  # 데드크로스
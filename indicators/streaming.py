@@ -0,0 +1,397 @@
+"""
+스트리밍 지표 — 새 봉 하나마다 O(1)로 갱신되는 상태 객체
+
+각 클래스는 배치 함수(add_ma, add_rsi, ...)와 같은 값을 허용 오차 안에서 내며,
+to_dict() / from_dict() 로 JSON 직렬화해 재시작 후에도 이어서 갱신할 수 있습니다.
+입력 봉은 clean() 을 거친 유효한 값(NaN 없음)이라고 가정합니다.
+"""
+from __future__ import annotations
+
+import math
+from collections import deque
+from typing import Optional
+
+import pandas as pd
+
+from indicators.engine import DEFAULT_PARAMS, IndicatorParams
+
+NAN = float("nan")
+
+
+def _is_nan(x: float) -> bool:
+    return x != x
+
+
+def _div(num: float, den: float) -> float:
+    """NumPy 와 같은 규칙의 나눗셈 (0/0 → NaN, x/0 → ±inf)."""
+    if den == 0:
+        if num == 0 or _is_nan(num):
+            return NAN
+        return math.copysign(math.inf, num)
+    return num / den
+
+
+# ─── 직렬화 ─────────────────────────────────────────────────────────────────
+
+_TYPES: dict[str, type] = {}
+
+
+def _encode(value: object) -> object:
+    if isinstance(value, _Stateful):
+        return {"__type__": type(value).__name__, "state": value.to_dict()}
+    if isinstance(value, deque):
+        return {"__deque__": [_encode(v) for v in value], "maxlen": value.maxlen}
+    if isinstance(value, (list, tuple)):
+        return [_encode(v) for v in value]
+    if isinstance(value, float) and _is_nan(value):
+        return None
+    return value
+
+
+def _decode(value: object) -> object:
+    if isinstance(value, dict) and "__type__" in value:
+        return _TYPES[value["__type__"]].from_dict(value["state"])
+    if isinstance(value, dict) and "__deque__" in value:
+        return deque((_decode(v) for v in value["__deque__"]), maxlen=value["maxlen"])
+    if isinstance(value, list):
+        return [_decode(v) for v in value]
+    if value is None:
+        return NAN
+    return value
+
+
+class _Stateful:
+    """속성 전체를 JSON 호환 dict 로 저장/복원하는 기반 클래스."""
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        _TYPES[cls.__name__] = cls
+
+    def to_dict(self) -> dict:
+        return {k: _encode(v) for k, v in vars(self).items()}
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        obj = cls.__new__(cls)
+        for k, v in data.items():
+            setattr(obj, k, _decode(v))
+        return obj
+
+
+# ─── 기본 구성 요소 ─────────────────────────────────────────────────────────
+
+class _RollingStats(_Stateful):
+    """
+    고정 윈도우 평균/표본표준편차 (pandas rolling 과 같은 min_periods=window 규칙).
+
+    합계는 첫 값 기준 편차로 누적하고, 윈도우가 한 바퀴 돌 때마다 다시 합산해
+    부동소수 누적 오차를 막습니다 (기준값도 이때 윈도우 첫 값으로 옮김, 분할 상환 O(1)).
+    """
+
+    def __init__(self, window: int) -> None:
+        self.window = window
+        self.values: deque = deque(maxlen=window)
+        self.shift = NAN
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.nan_count = 0
+        self.same_run = 0
+        self.pushes = 0
+
+    def push(self, x: float) -> None:
+        if len(self.values) == self.window:
+            old = self.values[0]
+            if _is_nan(old):
+                self.nan_count -= 1
+            else:
+                self.total -= old - self.shift
+                self.total_sq -= (old - self.shift) ** 2
+        if self.values and self.values[-1] == x:
+            self.same_run += 1
+        else:
+            self.same_run = 1
+        self.values.append(x)
+        if _is_nan(x):
+            self.nan_count += 1
+        else:
+            if _is_nan(self.shift):
+                self.shift = x
+            self.total += x - self.shift
+            self.total_sq += (x - self.shift) ** 2
+
+        self.pushes += 1
+        if self.pushes % self.window == 0:
+            valid = [v for v in self.values if not _is_nan(v)]
+            if valid:
+                self.shift = valid[0]
+            deviations = [v - self.shift for v in valid]
+            self.total = math.fsum(deviations)
+            self.total_sq = math.fsum(d * d for d in deviations)
+
+    def _ready(self) -> bool:
+        return len(self.values) == self.window and self.nan_count == 0
+
+    def mean(self) -> float:
+        if not self._ready():
+            return NAN
+        return self.shift + self.total / self.window
+
+    def std(self) -> float:
+        if not self._ready() or self.window < 2:
+            return NAN
+        if self.same_run >= self.window:
+            return 0.0
+        var = (self.total_sq - self.total * self.total / self.window) / (self.window - 1)
+        return math.sqrt(max(var, 0.0))
+
+
+class _RollingExtreme(_Stateful):
+    """단조 덱(monotonic deque) 기반 윈도우 최소/최대."""
+
+    def __init__(self, window: int, mode: str) -> None:
+        self.window = window
+        self.is_max = mode == "max"
+        self.items: deque = deque()   # [봉 번호, 값]
+        self.count = 0
+
+    def push(self, x: float) -> float:
+        if self.is_max:
+            while self.items and self.items[-1][1] <= x:
+                self.items.pop()
+        else:
+            while self.items and self.items[-1][1] >= x:
+                self.items.pop()
+        self.items.append([self.count, x])
+        if self.items[0][0] <= self.count - self.window:
+            self.items.popleft()
+        self.count += 1
+        return self.items[0][1] if self.count >= self.window else NAN
+
+
+class _EWM(_Stateful):
+    """pandas ewm(span, adjust=False) 와 같은 재귀 (NaN 구간 가중치 감쇠 포함)."""
+
+    def __init__(self, span: int) -> None:
+        self.alpha = 2.0 / (span + 1)
+        self.value = NAN
+        self.old_wt = 1.0
+
+    def push(self, x: float) -> float:
+        if not _is_nan(self.value):
+            self.old_wt *= 1.0 - self.alpha
+            if not _is_nan(x):
+                if self.value != x:
+                    self.value = (self.old_wt * self.value + self.alpha * x) / (self.old_wt + self.alpha)
+                self.old_wt = 1.0
+        elif not _is_nan(x):
+            self.value = x
+        return self.value
+
+
+def _true_range(high: float, low: float, prev_close: float) -> float:
+    """첫 봉(전일 종가 없음)은 High - Low."""
+    if _is_nan(prev_close):
+        return high - low
+    return max(high - low, abs(high - prev_close), abs(low - prev_close))
+
+
+# ─── 지표 ───────────────────────────────────────────────────────────────────
+
+class StreamingMA(_Stateful):
+    """이동평균 (MA{w})."""
+
+    def __init__(self, windows: tuple[int, ...] = DEFAULT_PARAMS.ma_windows) -> None:
+        self.windows = list(windows)
+        self.stats = [_RollingStats(w) for w in windows]
+
+    def update(self, close: float) -> dict[str, float]:
+        result = {}
+        for w, stats in zip(self.windows, self.stats):
+            stats.push(close)
+            result[f"MA{w}"] = stats.mean()
+        return result
+
+
+class StreamingRSI(_Stateful):
+    """RSI — 상승폭/하락폭 단순 이동평균 기반 (add_rsi 와 동일)."""
+
+    def __init__(self, period: int = DEFAULT_PARAMS.rsi_period) -> None:
+        self.gain = _RollingStats(period)
+        self.loss = _RollingStats(period)
+        self.prev_close = NAN
+
+    def update(self, close: float) -> dict[str, float]:
+        delta = close - self.prev_close
+        self.prev_close = close
+        self.gain.push(max(delta, 0.0) if not _is_nan(delta) else NAN)
+        self.loss.push(-min(delta, 0.0) if not _is_nan(delta) else NAN)
+        loss = self.loss.mean()
+        rs = self.gain.mean() / (NAN if loss == 0 else loss)
+        return {"RSI": 100 - (100 / (1 + rs))}
+
+
+class StreamingMACD(_Stateful):
+    """MACD, MACD_signal."""
+
+    def __init__(
+        self,
+        fast: int = DEFAULT_PARAMS.macd_fast,
+        slow: int = DEFAULT_PARAMS.macd_slow,
+        signal: int = DEFAULT_PARAMS.macd_signal,
+    ) -> None:
+        self.fast = _EWM(fast)
+        self.slow = _EWM(slow)
+        self.signal = _EWM(signal)
+
+    def update(self, close: float) -> dict[str, float]:
+        macd = self.fast.push(close) - self.slow.push(close)
+        return {"MACD": macd, "MACD_signal": self.signal.push(macd)}
+
+
+class StreamingBollinger(_Stateful):
+    """BB_mid, BB_upper, BB_lower."""
+
+    def __init__(self, period: int = DEFAULT_PARAMS.bb_period, std: float = DEFAULT_PARAMS.bb_std) -> None:
+        self.stats = _RollingStats(period)
+        self.num_std = std
+
+    def update(self, close: float) -> dict[str, float]:
+        self.stats.push(close)
+        mid, std = self.stats.mean(), self.stats.std()
+        return {
+            "BB_mid": mid,
+            "BB_upper": mid + self.num_std * std,
+            "BB_lower": mid - self.num_std * std,
+        }
+
+
+class StreamingStochastic(_Stateful):
+    """Stoch_K, Stoch_D — 윈도우 최고/최저가는 단조 덱으로 O(1) 갱신."""
+
+    def __init__(self, k_period: int = DEFAULT_PARAMS.stoch_k, d_period: int = DEFAULT_PARAMS.stoch_d) -> None:
+        self.lowest = _RollingExtreme(k_period, "min")
+        self.highest = _RollingExtreme(k_period, "max")
+        self.d = _RollingStats(d_period)
+
+    def update(self, high: float, low: float, close: float) -> dict[str, float]:
+        lowest_low = self.lowest.push(low)
+        highest_high = self.highest.push(high)
+        k = _div(close - lowest_low, highest_high - lowest_low) * 100
+        self.d.push(k)
+        return {"Stoch_K": k, "Stoch_D": self.d.mean()}
+
+
+class StreamingATR(_Stateful):
+    """ATR — True Range 단순 이동평균."""
+
+    def __init__(self, period: int = DEFAULT_PARAMS.atr_period) -> None:
+        self.stats = _RollingStats(period)
+        self.prev_close = NAN
+
+    def update(self, high: float, low: float, close: float) -> dict[str, float]:
+        self.stats.push(_true_range(high, low, self.prev_close))
+        self.prev_close = close
+        return {"ATR": self.stats.mean()}
+
+
+class StreamingADX(_Stateful):
+    """ADX, Plus_DI, Minus_DI."""
+
+    def __init__(self, period: int = DEFAULT_PARAMS.adx_period) -> None:
+        self.tr = _EWM(period)
+        self.plus = _EWM(period)
+        self.minus = _EWM(period)
+        self.adx = _EWM(period)
+        self.prev_high = NAN
+        self.prev_low = NAN
+        self.prev_close = NAN
+
+    def update(self, high: float, low: float, close: float) -> dict[str, float]:
+        plus_dm = high - self.prev_high
+        minus_dm = self.prev_low - low
+        plus_dm = plus_dm if (plus_dm > minus_dm and plus_dm > 0) else 0.0
+        minus_dm = minus_dm if (minus_dm > plus_dm and minus_dm > 0) else 0.0
+        atr = self.tr.push(_true_range(high, low, self.prev_close))
+        self.prev_high, self.prev_low, self.prev_close = high, low, close
+
+        plus_di = _div(100 * self.plus.push(plus_dm), atr)
+        minus_di = _div(100 * self.minus.push(minus_dm), atr)
+        di_sum = plus_di + minus_di
+        dx = abs(plus_di - minus_di) / (NAN if di_sum == 0 else di_sum) * 100
+        return {"ADX": self.adx.push(dx), "Plus_DI": plus_di, "Minus_DI": minus_di}
+
+
+class StreamingVolumeMA(_Stateful):
+    """거래량 이동평균 (Volume_MA)."""
+
+    def __init__(self, period: int = DEFAULT_PARAMS.volume_ma_period) -> None:
+        self.stats = _RollingStats(period)
+
+    def update(self, volume: float) -> dict[str, float]:
+        self.stats.push(float(volume))
+        return {"Volume_MA": self.stats.mean()}
+
+
+class IndicatorState(_Stateful):
+    """
+    전체 지표의 스트리밍 상태. update() 는 compute_indicators 와 같은 컬럼의
+    최신 값을 dict 로 반환합니다.
+    """
+
+    def __init__(self, params: Optional[IndicatorParams] = None) -> None:
+        p = params or DEFAULT_PARAMS
+        self.ma = StreamingMA(p.ma_windows)
+        self.rsi = StreamingRSI(p.rsi_period)
+        self.macd = StreamingMACD(p.macd_fast, p.macd_slow, p.macd_signal)
+        self.bollinger = StreamingBollinger(p.bb_period, p.bb_std)
+        self.stochastic = StreamingStochastic(p.stoch_k, p.stoch_d)
+        self.atr = StreamingATR(p.atr_period)
+        self.adx = StreamingADX(p.adx_period)
+        self.volume_ma = StreamingVolumeMA(p.volume_ma_period)
+        self.bars = 0
+        self.last_date: Optional[str] = None
+
+    def update(
+        self,
+        high: float,
+        low: float,
+        close: float,
+        volume: float,
+        date: Optional[str] = None,
+    ) -> dict[str, float]:
+        values: dict[str, float] = {}
+        values.update(self.ma.update(close))
+        values.update(self.rsi.update(close))
+        values.update(self.macd.update(close))
+        values.update(self.bollinger.update(close))
+        values.update(self.stochastic.update(high, low, close))
+        values.update(self.atr.update(high, low, close))
+        values.update(self.adx.update(high, low, close))
+        values.update(self.volume_ma.update(volume))
+        self.bars += 1
+        if date is not None:
+            self.last_date = date
+        return values
+
+    def to_dict(self) -> dict:
+        data = super().to_dict()
+        data["last_date"] = self.last_date
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "IndicatorState":
+        obj = super().from_dict(data)
+        obj.last_date = data.get("last_date")
+        return obj
+
+    @classmethod
+    def from_history(cls, df: pd.DataFrame, params: Optional[IndicatorParams] = None) -> "IndicatorState":
+        """과거 OHLCV 를 한 번 재생해 상태를 만듭니다 (시작 시 1회)."""
+        state = cls(params)
+        for ts, high, low, close, volume in zip(
+            df.index, df["High"].to_numpy(float), df["Low"].to_numpy(float),
+            df["Close"].to_numpy(float), df["Volume"].to_numpy(float),
+        ):
+            date = ts.strftime("%Y-%m-%d") if hasattr(ts, "strftime") else str(ts)
+            state.update(high, low, close, volume, date)
+        return state
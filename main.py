@@ -6,35 +6,98 @@ stock-automation: 주식 기술적 지표 기반 매매 신호 생성기
   python main.py --ticker AAPL          # 단일 종목 분석
   python main.py --backtest AAPL        # 백테스팅 실행
   python main.py --backtest AAPL --start 2024-01-01 --end 2024-12-31
+  python main.py --data-dir ./history    # 로컬 CSV/Parquet 데이터로 오프라인 분석
+  python main.py --portfolio --max-positions 5   # watchlist 공유 자본 포트폴리오 백테스팅
+  python main.py --sweep AAPL --grid rsi_period=7,14,21 --grid stop_mult=1.0,1.5,2.0 --jobs 8
+  python main.py --jobs 8               # watchlist 병렬 분석 (수집: 스레드, 지표/신호: 프로세스)
 """
+from __future__ import annotations
 
 import argparse
 import sys
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional
 
-from config import load_watchlist
-from data.fetcher import DataFetchError, fetch_ohlcv
+import pandas as pd
+
+from config import FETCH_WORKERS, PROFILE_DIR, load_watchlist
+from data.fetcher import DataFetchError, fetch_ohlcv, get_provider, set_provider
+from data.providers import FileProvider
+from data.replay import RecordingProvider, ReplayProvider, parse_latency
 from data.processor import InsufficientDataError, clean, validate
-from signals.generator import generate, print_signals
-from backtest.engine import run as run_backtest
+from signals.generator import Signal, generate, print_signals
+from backtest.engine import load_frame, run as run_backtest
+from backtest.portfolio import DEFAULT_MAX_POSITIONS, run_portfolio
+from backtest.sweep import build_grid, format_table, iter_sweep, parse_grid_arg, rank
 from utils.logger import get_logger
+from utils.metrics import REGISTRY, current_ticker, reset_worker
+from utils.profiling import profile_session
 
 logger = get_logger(__name__)
 
 
-def analyze_ticker(ticker: str) -> None:
-    """단일 종목을 분석하고 매매 신호를 출력합니다."""
+def _print_header(ticker: str) -> None:
     print(f"\n{'='*50}")
     print(f"  종목: {ticker}")
     print(f"{'='*50}")
+
+
+def _report_skip(ticker: str, exc: Exception) -> None:
+    print(f"  ⚠️  건너뜀: {exc}")
+    logger.error("%s: %s", ticker, exc)
+
+
+def _compute_signals(ticker: str, df: pd.DataFrame) -> list[Signal]:
+    """전처리 → 검증 → 신호 생성."""
+    with current_ticker(ticker):
+        df = clean(df)
+    validate(df)
+    return generate(df, ticker)
+
+
+def _compute_signals_task(ticker: str, df: pd.DataFrame) -> tuple[list[Signal], dict]:
+    """프로세스 풀 작업 단위 — 신호와 함께 워커에서 기록한 계측을 돌려줍니다."""
+    try:
+        return _compute_signals(ticker, df), REGISTRY.drain()
+    except Exception:
+        REGISTRY.reset()
+        raise
+
+
+def analyze_ticker(ticker: str) -> None:
+    """단일 종목을 분석하고 매매 신호를 출력합니다."""
+    _print_header(ticker)
     try:
         df = fetch_ohlcv(ticker)
-        df = clean(df)
-        validate(df)
-        signals = generate(df, ticker)
-        print_signals(signals)
+        print_signals(_compute_signals(ticker, df))
     except (DataFetchError, InsufficientDataError) as exc:
-        print(f"  ⚠️  건너뜀: {exc}")
-        logger.error(f"{ticker}: {exc}")
+        _report_skip(ticker, exc)
+
+
+def analyze_parallel(tickers: list[str], jobs: int) -> None:
+    """
+    여러 종목을 병렬로 분석합니다.
+
+    수집은 스레드 풀(I/O), 전처리·지표·신호는 프로세스 풀(CPU)에서 실행하고,
+    출력은 입력 순서대로 — 앞선 종목이 끝나는 즉시 — 이어서 내보냅니다.
+    실패 종목은 순차 분석과 같은 형식으로 보고합니다.
+    """
+    with ThreadPoolExecutor(max_workers=min(FETCH_WORKERS, len(tickers))) as io_pool, \
+         ProcessPoolExecutor(max_workers=jobs, initializer=reset_worker) as cpu_pool:
+
+        def _fetch_then_submit(ticker: str) -> Future:
+            # 수집이 끝나는 즉시 계산 작업을 프로세스 풀에 넘깁니다.
+            return cpu_pool.submit(_compute_signals_task, ticker, fetch_ohlcv(ticker))
+
+        pending = [(t, io_pool.submit(_fetch_then_submit, t)) for t in tickers]
+        for ticker, fetched in pending:
+            _print_header(ticker)
+            try:
+                signals, spans = fetched.result().result()
+                REGISTRY.merge(spans)
+                print_signals(signals)
+            except (DataFetchError, InsufficientDataError) as exc:
+                _report_skip(ticker, exc)
 
 
 def backtest_ticker(ticker: str, start: str, end: str) -> None:
@@ -54,16 +117,99 @@ def backtest_ticker(ticker: str, start: str, end: str) -> None:
         print_signals(result.signals)
     except (DataFetchError, InsufficientDataError) as exc:
         print(f"  ⚠️  건너뜀: {exc}")
-        logger.error(f"{ticker}: {exc}")
+        logger.error("%s: %s", ticker, exc)
 
 
-def main() -> None:
-    parser = argparse.ArgumentParser(description="주식 매매 신호 생성기")
-    parser.add_argument("--ticker", help="분석할 단일 종목 코드")
-    parser.add_argument("--backtest", help="백테스팅할 종목 코드")
-    parser.add_argument("--start", default="2024-01-01", help="백테스팅 시작일 (YYYY-MM-DD)")
-    parser.add_argument("--end", default="2024-12-31", help="백테스팅 종료일 (YYYY-MM-DD)")
-    args = parser.parse_args()
+def backtest_portfolio(tickers: list[str], start: str, end: str, max_positions: int) -> None:
+    """여러 종목을 공유 자본으로 백테스팅하고 종목별 기여도를 출력합니다."""
+    print(f"\n{'='*50}")
+    print(f"  포트폴리오 백테스팅: {len(tickers)}개 종목 ({start} ~ {end})")
+    print(f"{'='*50}")
+    try:
+        result = run_portfolio(tickers, start, end, max_positions=max_positions)
+    except (DataFetchError, InsufficientDataError) as exc:
+        print(f"  ⚠️  건너뜀: {exc}")
+        logger.error("portfolio: %s", exc)
+        return
+    print(f"  수익률    : {result.total_return:+.2f}%")
+    print(f"  최종 자산  : {result.final_equity:,.0f}")
+    print(f"  최대 낙폭  : -{result.max_drawdown:.2f}%")
+    print(f"  매매 횟수  : {result.trade_count}회")
+    print(f"  승률      : {result.win_rate:.1f}%")
+    print(f"\n  [종목별 기여도]")
+    ranked = sorted(result.attribution.values(), key=lambda a: a.pnl, reverse=True)
+    for a in ranked:
+        print(
+            f"  {a.ticker:<12} 손익: {a.pnl:>+14,.0f} | 기여: {a.contribution:>+7.2f}% | "
+            f"매매: {a.trade_count:>3}회 | 손절: {a.stop_loss_hits:>2} | 목표: {a.target_hits:>2}"
+        )
+
+
+def sweep_ticker(
+    ticker: str, start: str, end: str, grid_args: list[str], jobs: Optional[int], top: int,
+) -> None:
+    """파라미터 격자 백테스팅을 실행하고 결과를 순위표로 출력합니다."""
+    print(f"\n{'='*50}")
+    print(f"  파라미터 스윕: {ticker} ({start} ~ {end})")
+    print(f"{'='*50}")
+    try:
+        grid = build_grid(dict(parse_grid_arg(arg) for arg in grid_args))
+    except ValueError as exc:
+        print(f"  ⚠️  {exc}")
+        sys.exit(1)
+    try:
+        df = load_frame(ticker, start, end)
+    except (DataFetchError, InsufficientDataError) as exc:
+        print(f"  ⚠️  건너뜀: {exc}")
+        logger.error("%s: %s", ticker, exc)
+        return
+    if df.empty:
+        print("  ⚠️  지정 기간 내 데이터 없음")
+        return
+
+    results = []
+    for result in iter_sweep(df, ticker, grid, workers=jobs):
+        results.append(result)
+        print(f"  [{len(results)}/{len(grid)}] {result.total_return:+.2f}%  {result.params}")
+    print(f"\n  [순위 — 상위 {min(top, len(results))}개]")
+    print(format_table(rank(results), top=top))
+
+
+def print_metrics() -> None:
+    """단계별 소요 시간 요약표를 출력합니다."""
+    print(f"\n{'='*50}")
+    print("  단계별 소요 시간")
+    print(f"{'='*50}")
+    print(REGISTRY.format_summary())
+
+
+def profile_run(args: argparse.Namespace) -> None:
+    """프로세스 풀 없이 실행하며 프로파일링하고, 요약과 저장 경로를 출력합니다."""
+    args.jobs = 1
+    label = args.sweep or args.backtest or ("portfolio" if args.portfolio else None) or args.ticker or "watchlist"
+    with profile_session(f"cli-{label}", out_dir=args.profile) as session:
+        _run(args)
+    report = session.report
+    print(f"\n{'='*50}")
+    print("  프로파일")
+    print(f"{'='*50}")
+    print(report.summary)
+    print(f"  저장: {report.prof_path}  (python -m pstats {report.prof_path})")
+    print(f"        {report.summary_path}")
+
+
+def _run(args: argparse.Namespace) -> None:
+    """인자에 따라 스윕 / 백테스팅 / 포트폴리오 / 분석을 실행합니다."""
+    if args.replay:
+        set_provider(ReplayProvider(args.replay, latency=parse_latency(args.replay_latency)))
+    elif args.data_dir:
+        set_provider(FileProvider(args.data_dir))
+    if args.record:
+        set_provider(RecordingProvider(get_provider(), args.record))
+
+    if args.sweep:
+        sweep_ticker(args.sweep, args.start, args.end, args.grid, args.jobs, args.top)
+        return
 
     if args.backtest:
         backtest_ticker(args.backtest, args.start, args.end)
@@ -74,14 +220,59 @@ def main() -> None:
         print("⚠️  분석할 종목이 없습니다. watchlist.txt를 확인하세요.")
         sys.exit(1)
 
+    if args.portfolio:
+        backtest_portfolio(tickers, args.start, args.end, args.max_positions)
+        return
+
     print(f"\n[주식 자동화 분석] 총 {len(tickers)}개 종목")
-    for ticker in tickers:
-        analyze_ticker(ticker)
+    if args.jobs and args.jobs > 1 and len(tickers) > 1:
+        analyze_parallel(tickers, args.jobs)
+    else:
+        for ticker in tickers:
+            analyze_ticker(ticker)
 
     print(f"\n{'='*50}")
     print("  분석 완료. 로그: signals.log")
     print(f"{'='*50}\n")
 
 
+def main() -> None:
+    parser = argparse.ArgumentParser(description="주식 매매 신호 생성기")
+    parser.add_argument("--ticker", help="분석할 단일 종목 코드")
+    parser.add_argument("--backtest", help="백테스팅할 종목 코드")
+    parser.add_argument("--start", default="2024-01-01", help="백테스팅 시작일 (YYYY-MM-DD)")
+    parser.add_argument("--end", default="2024-12-31", help="백테스팅 종료일 (YYYY-MM-DD)")
+    parser.add_argument("--data-dir", help="yfinance 대신 사용할 로컬 CSV/Parquet 디렉터리")
+    parser.add_argument("--record", metavar="DIR", help="수집한 응답을 DIR 아카이브에 녹화")
+    parser.add_argument("--replay", metavar="DIR", help="네트워크 대신 DIR 아카이브의 녹화 응답 사용")
+    parser.add_argument("--replay-latency", metavar="SEC|recorded",
+                        help="재생 지연 — 초 단위 고정값 또는 recorded(녹화 당시 소요 시간)")
+    parser.add_argument("--portfolio", action="store_true",
+                        help="watchlist(또는 --ticker) 종목을 공유 자본으로 백테스팅")
+    parser.add_argument("--max-positions", type=int, default=DEFAULT_MAX_POSITIONS,
+                        help="포트폴리오 동시 보유 종목 수")
+    parser.add_argument("--sweep", help="파라미터 스윕 백테스팅할 종목 코드")
+    parser.add_argument("--grid", action="append", default=[],
+                        help="스윕 축 key=v1,v2 (반복 지정, ma_windows 는 5/20/60 형식)")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="병렬 프로세스 수 (분석 기본: 1 = 순차, 스윕 기본: CPU 코어 수)")
+    parser.add_argument("--top", type=int, default=20, help="스윕 순위표 출력 개수")
+    parser.add_argument("--metrics", action="store_true",
+                        help="종료 시 단계별(수집·전처리·지표·신호) 소요 시간 요약 출력")
+    parser.add_argument("--profile", nargs="?", const=PROFILE_DIR, metavar="DIR",
+                        help=f"CPU 프로파일(.prof)과 메모리 요약(.txt)을 DIR(기본 {PROFILE_DIR})에 저장 "
+                             "— 한 프로세스에서 순차 실행")
+    args = parser.parse_args()
+
+    try:
+        if args.profile:
+            profile_run(args)
+        else:
+            _run(args)
+    finally:
+        if args.metrics:
+            print_metrics()
+
+
 if __name__ == "__main__":
     main()
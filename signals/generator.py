@@ -5,16 +5,19 @@ from datetime import date
 from enum import Enum
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
-from indicators.adx import add_adx, add_volume_ma, is_trending, is_volume_confirmed
-from indicators.atr import add_atr, get_stop_and_target
-from indicators.bollinger import add_bollinger, get_bb_signal
-from indicators.macd import add_macd, detect_macd_cross
-from indicators.moving_average import add_ma, detect_crossover
-from indicators.rsi import add_rsi, get_rsi_signal
-from indicators.stochastic import add_stochastic, get_stoch_signal
+from indicators.adx import is_trending, is_volume_confirmed
+from indicators.atr import ATR_STOP_MULT, ATR_TARGET_MULT
+from indicators.bollinger import get_bb_signal
+from indicators.engine import DEFAULT_PARAMS, IndicatorParams, compute_indicators
+from indicators.macd import detect_macd_cross
+from indicators.moving_average import detect_crossover
+from indicators.rsi import get_rsi_signal
+from indicators.stochastic import get_stoch_signal
 from utils.logger import get_logger
+from utils.metrics import span
 
 logger = get_logger(__name__)
 
@@ -36,20 +39,38 @@ class Signal:
     target: Optional[float] = field(default=None)      # ATR 기반 목표가
 
 
-def _add_all_indicators(df: pd.DataFrame) -> pd.DataFrame:
-    """모든 지표를 DataFrame에 추가합니다."""
-    df = add_ma(df)
-    df = add_rsi(df)
-    df = add_macd(df)
-    df = add_bollinger(df)
-    df = add_stochastic(df)
-    df = add_atr(df)
-    df = add_adx(df)
-    df = add_volume_ma(df)
-    return df
+def _add_all_indicators(df: pd.DataFrame, params: Optional[IndicatorParams] = None) -> pd.DataFrame:
+    """모든 지표를 DataFrame에 추가합니다 (통합 엔진으로 한 번에 계산)."""
+    return compute_indicators(df, params)
 
 
-def generate(df: pd.DataFrame, ticker: str) -> list[Signal]:
+# 투표 순서: MA, RSI, MACD, BB, 스토캐스틱 — (BUY 사유, SELL 사유)
+_VOTE_REASONS: list[tuple[str, str]] = [
+    ("MA 골든크로스", "MA 데드크로스"),
+    ("RSI 과매도({rsi:.1f})", "RSI 과매수({rsi:.1f})"),
+    ("MACD 골든크로스", "MACD 데드크로스"),
+    ("BB 하단 터치", "BB 상단 터치"),
+    ("스토캐스틱 BUY", "스토캐스틱 SELL"),
+]
+
+
+def _build_reason(votes: np.ndarray, rsi: float) -> str:
+    reasons = []
+    for vote, (buy_text, sell_text) in zip(votes, _VOTE_REASONS):
+        if vote == 1:
+            reasons.append(buy_text.format(rsi=rsi))
+        elif vote == -1:
+            reasons.append(sell_text.format(rsi=rsi))
+    return ", ".join(reasons) if reasons else "복합 신호"
+
+
+def generate(
+    df: pd.DataFrame,
+    ticker: str,
+    params: Optional[IndicatorParams] = None,
+    stop_mult: float = ATR_STOP_MULT,
+    target_mult: float = ATR_TARGET_MULT,
+) -> list[Signal]:
     """
     모든 지표 신호를 종합하여 최종 Signal 리스트를 반환합니다.
 
@@ -58,68 +79,86 @@ def generate(df: pd.DataFrame, ticker: str) -> list[Signal]:
       - 거래량 < 거래량MA: 신호 무효 처리
     다수결: 5개 지표 중 2개 이상 BUY → BUY, 2개 이상 SELL → SELL
     """
-    df = _add_all_indicators(df)
+    return generate_with_indicators(df, ticker, params, stop_mult, target_mult)[1]
+
+
+def generate_with_indicators(
+    df: pd.DataFrame,
+    ticker: str,
+    params: Optional[IndicatorParams] = None,
+    stop_mult: float = ATR_STOP_MULT,
+    target_mult: float = ATR_TARGET_MULT,
+) -> tuple[pd.DataFrame, list[Signal]]:
+    """
+    generate 와 같되, 신호 계산에 쓴 지표 DataFrame도 함께 반환합니다.
+
+    차트용 지표를 따로 계산하지 않고 이 결과를 그대로 쓰면 지표는 요청당 한 번만
+    계산되고, 차트와 신호가 항상 같은 값을 기준으로 합니다.
+    """
+    with span("indicators", ticker):
+        enriched = _add_all_indicators(df, params)
+    return enriched, generate_from_indicators(enriched, ticker, params, stop_mult, target_mult)
+
+
+def generate_from_indicators(
+    df: pd.DataFrame,
+    ticker: str,
+    params: Optional[IndicatorParams] = None,
+    stop_mult: float = ATR_STOP_MULT,
+    target_mult: float = ATR_TARGET_MULT,
+) -> list[Signal]:
+    """
+    지표 컬럼이 이미 계산된 DataFrame에서 신호를 만듭니다 (generate 의 후반부).
+
+    투표·필터·손절/목표가는 전체 행에 대해 배열 연산으로 계산하고,
+    사유 문자열과 Signal 객체는 실제 신호가 발생한 행에 대해서만 만듭니다.
+    """
+    with span("signals", ticker):
+        return _signals_from_indicators(df, ticker, params or DEFAULT_PARAMS, stop_mult, target_mult)
+
+
+def _signals_from_indicators(
+    df: pd.DataFrame, ticker: str, p: IndicatorParams, stop_mult: float, target_mult: float
+) -> list[Signal]:
     df = df.dropna()
 
     if df.empty:
-        logger.warning(f"{ticker}: 지표 계산 후 유효 데이터 없음")
+        logger.warning("%s: 지표 계산 후 유효 데이터 없음", ticker)
         return []
 
-    ma_cross   = detect_crossover(df)
-    rsi_sig    = get_rsi_signal(df)
-    macd_cross = detect_macd_cross(df)
-    bb_sig     = get_bb_signal(df)
-    stoch_sig  = get_stoch_signal(df)
-    trending   = is_trending(df)
-    vol_ok     = is_volume_confirmed(df)
-
+    ma_fast, ma_slow = (p.ma_windows[0], p.ma_windows[1]) if len(p.ma_windows) >= 2 else (5, 20)
+    votes = np.column_stack([
+        detect_crossover(df, ma_fast, ma_slow).to_numpy(dtype=int),
+        get_rsi_signal(df).to_numpy(dtype=int),
+        detect_macd_cross(df).to_numpy(dtype=int),
+        get_bb_signal(df).to_numpy(dtype=int),
+        get_stoch_signal(df).to_numpy(dtype=int),
+    ])
+    score = votes.sum(axis=1)
+    passed = is_trending(df).to_numpy(dtype=bool) & is_volume_confirmed(df).to_numpy(dtype=bool)
+    is_buy = score >= 2
+    emit = passed & (is_buy | (score <= -2))
+
+    close = df["Close"].to_numpy(dtype=float)
+    atr = df["ATR"].to_numpy(dtype=float)
+    rsi = df["RSI"].to_numpy(dtype=float)
+    # get_stop_and_target 과 같은 연산 순서 (반올림은 발생 행에서 round 로 동일하게 처리)
+    stop = np.where(is_buy, close - atr * stop_mult, close + atr * stop_mult)
+    target = np.where(is_buy, close + atr * target_mult, close - atr * target_mult)
+
+    index = df.index
     signals: list[Signal] = []
-    for idx in df.index:
-        # 필터: 횡보장 or 거래량 부족 → 스킵
-        if not trending.get(idx, True) or not vol_ok.get(idx, True):
-            continue
-
-        votes = [
-            int(ma_cross.get(idx, 0)),
-            int(rsi_sig.get(idx, 0)),
-            int(macd_cross.get(idx, 0)),
-            int(bb_sig.get(idx, 0)),
-            int(stoch_sig.get(idx, 0)),
-        ]
-        score = sum(votes)
-
-        reasons = []
-        if ma_cross.get(idx, 0) == 1:    reasons.append("MA 골든크로스")
-        elif ma_cross.get(idx, 0) == -1: reasons.append("MA 데드크로스")
-        if rsi_sig.get(idx, 0) == 1:     reasons.append(f"RSI 과매도({df.loc[idx, 'RSI']:.1f})")
-        elif rsi_sig.get(idx, 0) == -1:  reasons.append(f"RSI 과매수({df.loc[idx, 'RSI']:.1f})")
-        if macd_cross.get(idx, 0) == 1:  reasons.append("MACD 골든크로스")
-        elif macd_cross.get(idx, 0) == -1: reasons.append("MACD 데드크로스")
-        if bb_sig.get(idx, 0) == 1:      reasons.append("BB 하단 터치")
-        elif bb_sig.get(idx, 0) == -1:   reasons.append("BB 상단 터치")
-        if stoch_sig.get(idx, 0) == 1:   reasons.append("스토캐스틱 BUY")
-        elif stoch_sig.get(idx, 0) == -1: reasons.append("스토캐스틱 SELL")
-
-        if score >= 2:
-            sig_type = SignalType.BUY
-        elif score <= -2:
-            sig_type = SignalType.SELL
-        else:
-            continue
-
-        price = float(df.loc[idx, "Close"])
-        atr   = float(df.loc[idx, "ATR"])
-        stop, target = get_stop_and_target(price, atr, sig_type.value)
-
+    for i in np.flatnonzero(emit):
+        idx = index[i]
         signals.append(
             Signal(
                 ticker=ticker,
                 date=idx.date() if hasattr(idx, "date") else idx,
-                signal=sig_type,
-                reason=", ".join(reasons) if reasons else "복합 신호",
-                price=price,
-                stop_loss=stop,
-                target=target,
+                signal=SignalType.BUY if is_buy[i] else SignalType.SELL,
+                reason=_build_reason(votes[i], rsi[i]),
+                price=float(close[i]),
+                stop_loss=round(float(stop[i]), 2),
+                target=round(float(target[i]), 2),
             )
         )
 
@@ -0,0 +1,349 @@
+"""Flask API 라우트 단위 테스트"""
+from __future__ import annotations
+
+import gzip
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import api.routes as routes
+import indicators.engine as engine
+import signals.generator as generator
+import utils.metrics as metrics
+from api.result_cache import ResultCache
+from app import create_app
+from data.providers import FileProvider
+from tests.conftest import make_ohlcv
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    df = make_ohlcv(400, seed=3)
+    df.index.name = "Date"
+    df.to_csv(tmp_path / "TEST.csv")
+    monkeypatch.setattr("data.fetcher._provider", FileProvider(str(tmp_path)))
+    monkeypatch.setattr("api.routes._result_cache", ResultCache())
+    return create_app().test_client()
+
+
+class TestAnalyze:
+    def test_payload(self, client):
+        body = client.get("/api/analyze?ticker=test&period=1y").get_json()
+        assert body["ticker"] == "TEST"
+        assert len(body["ohlcv"]) == len(body["indicators"]["ma"]) == len(body["indicators"]["rsi"])
+        assert set(body["indicators"]) == {"ma", "rsi", "macd", "bollinger"}
+        assert body["indicators"]["ma"][-1]["ma20"] is not None
+
+    def test_indicators_computed_once(self, client, monkeypatch):
+        calls = []
+        original = engine.compute_indicators
+
+        def counting(df, params=None):
+            calls.append(len(df))
+            return original(df, params)
+
+        monkeypatch.setattr(generator, "compute_indicators", counting)
+        assert client.get("/api/analyze?ticker=TEST").status_code == 200
+        assert len(calls) == 1
+
+    def test_unknown_ticker_404(self, client):
+        assert client.get("/api/analyze?ticker=NOPE").status_code == 404
+
+    def test_missing_ticker_400(self, client):
+        assert client.get("/api/analyze").status_code == 400
+
+    def test_columnar_format(self, client):
+        rows = client.get("/api/analyze?ticker=TEST").get_json()
+        cols = client.get("/api/analyze?ticker=TEST&format=columns").get_json()
+        assert cols["format"] == "columns"
+        assert cols["dates"] == [r["date"] for r in rows["ohlcv"]]
+        assert cols["indicators"]["macd"]["histogram"] == [r["histogram"] for r in rows["indicators"]["macd"]]
+        assert cols["signals"] == rows["signals"]
+
+
+class TestResultCache:
+    def test_second_request_served_from_cache(self, client, monkeypatch):
+        calls = []
+        original = engine.compute_indicators
+        monkeypatch.setattr(generator, "compute_indicators", lambda df, p=None: calls.append(1) or original(df, p))
+
+        first = client.get("/api/analyze?ticker=TEST")
+        second = client.get("/api/analyze?ticker=TEST")
+        assert first.get_data() == second.get_data()
+        assert len(calls) == 1
+
+        stats = client.get("/api/cache/stats").get_json()
+        # 첫 요청: 응답 본문 + 분석 프레임 두 항목 모두 실패 후 저장
+        assert stats["enabled"] and stats["hits"] == 1 and stats["misses"] == 2
+        assert stats["entries"] == 2 and stats["bytes"] > len(first.get_data())
+
+    def test_key_includes_format(self, client):
+        client.get("/api/analyze?ticker=TEST")
+        client.get("/api/analyze?ticker=TEST&format=columns")
+        # 형식별 본문 2개 + 공유하는 분석 프레임 1개
+        assert client.get("/api/cache/stats").get_json()["entries"] == 3
+
+    def test_errors_not_cached(self, client):
+        client.get("/api/analyze?ticker=NOPE")
+        assert client.get("/api/cache/stats").get_json()["entries"] == 0
+
+    def test_disabled(self, client, monkeypatch):
+        monkeypatch.setattr("api.routes._result_cache", None)
+        assert client.get("/api/analyze?ticker=TEST").status_code == 200
+        assert client.get("/api/cache/stats").get_json() == {"enabled": False}
+
+
+class TestMetrics:
+    def test_stage_histograms(self, client):
+        metrics.REGISTRY.reset()
+        client.get("/api/analyze?ticker=TEST")
+        response = client.get("/api/metrics")
+        assert response.status_code == 200
+        assert response.content_type.startswith("text/plain")
+        text = response.get_data(as_text=True)
+        for stage in ("fetch", "clean", "indicators", "signals", "serialize"):
+            assert f'stock_stage_duration_seconds_count{{stage="{stage}",ticker="TEST"}} 1' in text
+        assert "stock_result_cache_misses_total 2" in text
+
+
+class TestCoalescing:
+    def test_concurrent_requests_share_one_computation(self, client, monkeypatch):
+        gate = threading.Event()
+        calls = []
+        original = routes._analyze_response
+
+        def slow_body(*args):
+            calls.append(args)
+            gate.wait(5)
+            return original(*args)
+
+        monkeypatch.setattr(routes, "_analyze_response", slow_body)
+        monkeypatch.setattr(routes, "_analyze_flights", routes.SingleFlight())
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [pool.submit(client.get, "/api/analyze?ticker=TEST") for _ in range(4)]
+            while routes._analyze_flights.coalesced < 3:
+                threading.Event().wait(0.001)
+            gate.set()
+            bodies = {f.result().get_data() for f in futures}
+        assert len(calls) == 1
+        assert len(bodies) == 1
+
+
+class TestConditionalAndGzip:
+    def test_etag_and_304(self, client):
+        first = client.get("/api/analyze?ticker=TEST")
+        etag = first.headers["ETag"]
+        assert etag.startswith('W/"')
+        assert first.headers["Cache-Control"] == "no-cache"
+
+        second = client.get("/api/analyze?ticker=TEST", headers={"If-None-Match": etag})
+        assert second.status_code == 304
+        assert second.get_data() == b""
+        assert second.headers["ETag"] == etag
+
+    def test_stale_etag_gets_full_body(self, client):
+        response = client.get("/api/analyze?ticker=TEST", headers={"If-None-Match": 'W/"stale"'})
+        assert response.status_code == 200 and response.get_json()["ticker"] == "TEST"
+
+    def test_etag_differs_by_format_and_period(self, client):
+        tags = {
+            client.get(f"/api/analyze?ticker=TEST&{q}").headers["ETag"]
+            for q in ["period=1y", "period=6mo", "period=1y&format=columns"]
+        }
+        assert len(tags) == 3
+
+    def test_etag_stable_across_recompute(self, client, monkeypatch):
+        first = client.get("/api/analyze?ticker=TEST").headers["ETag"]
+        monkeypatch.setattr(routes, "_result_cache", ResultCache())
+        assert client.get("/api/analyze?ticker=TEST").headers["ETag"] == first
+
+    def test_gzip_when_accepted(self, client):
+        plain = client.get("/api/analyze?ticker=TEST")
+        zipped = client.get("/api/analyze?ticker=TEST", headers={"Accept-Encoding": "gzip, deflate"})
+        assert zipped.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in zipped.headers["Vary"]
+        assert gzip.decompress(zipped.get_data()) == plain.get_data()
+        assert len(zipped.get_data()) < len(plain.get_data()) / 3
+        assert "Content-Encoding" not in plain.headers
+
+
+class TestBatch:
+    @pytest.fixture
+    def batch_client(self, tmp_path, monkeypatch):
+        for i, t in enumerate(["AAA", "BBB"]):
+            df = make_ohlcv(400, seed=i)
+            df.index.name = "Date"
+            df.to_csv(tmp_path / f"{t}.csv")
+        make_ohlcv(30).rename_axis("Date").to_csv(tmp_path / "SHORT.csv")
+        monkeypatch.setattr("data.fetcher._provider", FileProvider(str(tmp_path)))
+        monkeypatch.setattr(routes, "_result_cache", ResultCache())
+        return create_app().test_client()
+
+    def test_results_match_single_endpoint(self, batch_client):
+        body = batch_client.post("/api/analyze/batch", json={"tickers": ["aaa", "BBB"], "period": "6mo"}).get_json()
+        assert list(body["results"]) == ["AAA", "BBB"]
+        assert body["errors"] == {} and body["period"] == "6mo"
+        single = batch_client.get("/api/analyze?ticker=AAA&period=6mo").get_json()
+        assert body["results"]["AAA"] == single
+
+    def test_errors_reported_per_ticker(self, batch_client):
+        body = batch_client.post("/api/analyze/batch", json={"tickers": ["AAA", "NOPE", "SHORT"]}).get_json()
+        assert list(body["results"]) == ["AAA"]
+        assert set(body["errors"]) == {"NOPE", "SHORT"}
+        assert "최소" in body["errors"]["SHORT"]
+        # 수집 실패는 공급자가 낸 실제 사유를 그대로 전달합니다.
+        assert "데이터 파일 없음" in body["errors"]["NOPE"]
+
+    def test_latest_only(self, batch_client):
+        body = batch_client.post("/api/analyze/batch", json={"tickers": ["AAA"], "latest_only": True}).get_json()
+        result = body["results"]["AAA"]
+        assert body["format"] == "latest"
+        assert "ohlcv" not in result and "signals" not in result
+        full = batch_client.get("/api/analyze?ticker=AAA").get_json()
+        assert result["signal"] == (full["signals"][-1] if full["signals"] else None)
+        assert result["last_close"] == full["ohlcv"][-1]["close"]
+
+    def test_reuses_result_cache(self, batch_client, monkeypatch):
+        batch_client.get("/api/analyze?ticker=AAA")
+        monkeypatch.setattr(routes, "_analyze_response", lambda *a: pytest.fail("재계산 발생"))
+        monkeypatch.setattr(routes, "fetch_multiple", lambda *a, **k: pytest.fail("재수집 발생"))
+        body = batch_client.post("/api/analyze/batch", json={"tickers": ["AAA"]}).get_json()
+        assert "AAA" in body["results"]
+
+    def test_cached_frame_skips_bulk_fetch(self, batch_client, monkeypatch):
+        # 다른 형식 요청으로 분석 결과(frame)만 캐시된 상태
+        batch_client.get("/api/analyze?ticker=AAA&format=columns")
+        monkeypatch.setattr(routes, "fetch_multiple", lambda *a, **k: pytest.fail("재수집 발생"))
+        body = batch_client.post("/api/analyze/batch", json={"tickers": ["AAA"]}).get_json()
+        assert "AAA" in body["results"]
+
+    def test_validation(self, batch_client, monkeypatch):
+        assert batch_client.post("/api/analyze/batch", json={}).status_code == 400
+        assert batch_client.post("/api/analyze/batch", json={"tickers": "AAA"}).status_code == 400
+        monkeypatch.setattr(routes, "BATCH_MAX_TICKERS", 2)
+        assert batch_client.post("/api/analyze/batch", json={"tickers": ["A", "B", "C"]}).status_code == 400
+
+    def test_rejects_non_object_body(self, batch_client):
+        assert batch_client.post("/api/analyze/batch", json=["AAA"]).status_code == 400
+        assert batch_client.post("/api/analyze/batch", json="AAA").status_code == 400
+
+    def test_non_string_period_and_format_fall_back(self, batch_client):
+        response = batch_client.post(
+            "/api/analyze/batch", json={"tickers": ["AAA"], "period": ["6mo"], "format": {"x": 1}},
+        )
+        body = response.get_json()
+        assert response.status_code == 200
+        assert body["period"] == "1y" and body["format"] == "rows"
+        assert "AAA" in body["results"]
+
+    def test_gzip(self, batch_client):
+        response = batch_client.post(
+            "/api/analyze/batch", json={"tickers": ["AAA", "BBB"]}, headers={"Accept-Encoding": "gzip"},
+        )
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert list(json.loads(gzip.decompress(response.get_data()))["results"]) == ["AAA", "BBB"]
+
+
+class TestDelta:
+    def test_since_returns_only_newer_bars(self, client):
+        full = client.get("/api/analyze?ticker=TEST").get_json()
+        since = full["ohlcv"][-6]["date"]
+        delta = client.get(f"/api/analyze?ticker=TEST&since={since}").get_json()
+        assert delta["since"] == since
+        assert delta["ohlcv"] == full["ohlcv"][-5:]
+        for group in ["ma", "rsi", "macd", "bollinger"]:
+            assert delta["indicators"][group] == full["indicators"][group][-5:]
+        assert delta["signals"] == [s for s in full["signals"] if s["date"] > since]
+
+    def test_since_columnar(self, client):
+        full = client.get("/api/analyze?ticker=TEST&format=columns").get_json()
+        since = full["dates"][-3]
+        delta = client.get(f"/api/analyze?ticker=TEST&format=columns&since={since}").get_json()
+        assert delta["dates"] == full["dates"][-2:]
+        assert delta["ohlcv"]["close"] == full["ohlcv"]["close"][-2:]
+
+    def test_since_latest_bar_is_empty(self, client):
+        full = client.get("/api/analyze?ticker=TEST").get_json()
+        delta = client.get(f"/api/analyze?ticker=TEST&since={full['last_updated']}").get_json()
+        assert delta["ohlcv"] == [] and delta["signals"] == []
+
+    def test_served_from_cached_frame(self, client, monkeypatch):
+        client.get("/api/analyze?ticker=TEST")
+        monkeypatch.setattr(generator, "compute_indicators", lambda *a: pytest.fail("재계산 발생"))
+        monkeypatch.setattr(routes, "fetch_ohlcv", lambda *a: pytest.fail("재수집 발생"))
+        assert client.get("/api/analyze?ticker=TEST&since=2024-06-01").status_code == 200
+
+    def test_delta_etag(self, client):
+        first = client.get("/api/analyze?ticker=TEST&since=2024-06-01")
+        again = client.get("/api/analyze?ticker=TEST&since=2024-06-01", headers={"If-None-Match": first.headers["ETag"]})
+        assert again.status_code == 304
+        other = client.get("/api/analyze?ticker=TEST&since=2024-06-02")
+        assert other.headers["ETag"] != first.headers["ETag"]
+
+    def test_invalid_since(self, client):
+        assert client.get("/api/analyze?ticker=TEST&since=notadate").status_code == 400
+        assert client.get("/api/analyze?ticker=TEST&since=2025-09-20T00:00Z").status_code == 400
+        assert client.get("/api/analyze?ticker=TEST&since=2025-09-20T00:00:00%2B09:00").status_code == 400
+
+
+def _parse_sse(chunks) -> list[tuple[str, dict]]:
+    events = []
+    for block in b"".join(chunks).decode("utf-8").split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines() if not line.startswith(":"))
+        if "event" in lines:
+            events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+class TestScanStream:
+    def test_streams_results_and_errors(self, client):
+        response = client.get("/api/scan/stream?tickers=TEST,NOPE,test")
+        assert response.mimetype == "text/event-stream"
+        events = _parse_sse(response.response)
+        names = [e for e, _ in events]
+        assert names[0] == "start" and names[-1] == "done"
+        assert events[0][1]["total"] == 2
+        assert sorted(names[1:-1]) == ["error", "result"]
+        result = next(d for e, d in events if e == "result")
+        assert result["ticker"] == "TEST" and result["format"] == "latest"
+        assert next(d for e, d in events if e == "error")["ticker"] == "NOPE"
+        assert events[-1][1]["errors"] == 1
+
+    def test_bounded_submission(self, client, monkeypatch):
+        monkeypatch.setattr(routes, "SCAN_WORKERS", 2)
+        submitted = []
+        monkeypatch.setattr(routes, "_analyze_one", lambda t, p, f: submitted.append(t) or (None, "x"))
+        stream = routes._scan([f"T{i}" for i in range(100)], "1y")
+        next(stream)
+        assert len(submitted) <= 5      # 창 크기(4) + 완료 후 보충 1
+        stream.close()
+        assert len(submitted) < 100
+
+    def test_watch_emits_changed_signals(self, client, monkeypatch):
+        monkeypatch.setattr(routes, "SCAN_POLL_INTERVAL", 0)
+        keys = iter([("2024-01-02", "BUY"), ("2024-01-02", "BUY"), ("2024-03-04", "SELL")])
+        monkeypatch.setattr(routes, "_signal_key", lambda t, p: next(keys))
+        response = client.get("/api/scan/stream?tickers=TEST&watch=1", buffered=False)
+        chunks = response.response
+        received = []
+        for chunk in chunks:
+            received.append(chunk)
+            if chunk.startswith(b"event: signal"):
+                break
+        response.close()
+        names = [e for e, _ in _parse_sse(received)]
+        assert names == ["start", "result", "done", "signal"]
+
+    def test_watchers_are_capped(self, client, monkeypatch):
+        monkeypatch.setattr(routes, "SCAN_MAX_WATCHERS", 1)
+        first = client.get("/api/scan/stream?tickers=TEST&watch=1", buffered=False)
+        assert client.get("/api/scan/stream?tickers=TEST&watch=1").status_code == 503
+        # watch 없는 1회 스캔은 상한과 무관합니다.
+        assert client.get("/api/scan/stream?tickers=TEST").status_code == 200
+        first.close()
+        second = client.get("/api/scan/stream?tickers=TEST&watch=1", buffered=False)
+        assert second.status_code == 200
+        second.close()
+        assert routes._watchers == 0
@@ -8,7 +8,7 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from backtest.engine import BacktestResult, _calc_max_drawdown, run
+from backtest.engine import BacktestResult, _calc_max_drawdown, run, simulate
 from signals.generator import Signal, SignalType
 from tests.conftest import make_ohlcv
 
@@ -25,6 +25,9 @@ class TestCalcMaxDrawdown:
     def test_empty_curve(self):
         assert _calc_max_drawdown([]) == 0.0
 
+    def test_accepts_numpy_array(self):
+        assert _calc_max_drawdown(np.array([100.0, 80.0, 90.0])) == 20.0
+
     def test_recovery_after_drawdown(self):
         # 100 → 50 → 150: MDD = 50%
         result = _calc_max_drawdown([100.0, 50.0, 150.0])
@@ -130,3 +133,48 @@ class TestBacktestRun:
              patch("backtest.engine.generate", return_value=signals):
             result = run("TEST", "2024-01-01", "2024-12-31")
         assert result.max_drawdown >= 0.0
+
+    def test_progress_reports_stages(self):
+        df = make_ohlcv(120)
+        stages = []
+        with patch("backtest.engine.fetch_ohlcv", return_value=df), \
+             patch("backtest.engine.generate", return_value=self._make_signals(df)):
+            run("TEST", "2024-01-01", "2024-12-31", progress=lambda s, f: stages.append((s, f)))
+        assert stages == [("fetch", 0.0), ("signals", 0.4), ("simulate", 0.8)]
+
+
+class TestSimulate:
+    def test_matches_run(self):
+        df = make_ohlcv(120)
+        signals = TestBacktestRun()._make_signals(df)
+        with patch("backtest.engine.fetch_ohlcv", return_value=df), \
+             patch("backtest.engine.generate", return_value=signals):
+            expected = run("TEST", "2024-01-01", "2024-12-31")
+        assert simulate(df, signals, "TEST") == expected
+
+    def test_sell_exit_at_signal_price(self):
+        df = make_ohlcv(120)
+        signals = TestBacktestRun()._make_signals(df)
+        signals[0].stop_loss = 0.0
+        signals[0].target = float("inf")
+        result = simulate(df, signals, "TEST", initial_capital=1_000.0)
+        expected = (signals[1].price / signals[0].price - 1) * 100
+        assert result.trade_count == 1
+        assert result.total_return == round(expected, 2)
+
+    def test_buy_without_stop_holds_until_sell(self):
+        df = make_ohlcv(120)
+        signals = TestBacktestRun()._make_signals(df)
+        signals[0].stop_loss = None
+        signals[0].target = None
+        result = simulate(df, signals, "TEST")
+        assert result.stop_loss_hits == 0
+        assert result.target_hits == 0
+        assert result.trade_count == 1
+
+    def test_ignores_signals_outside_frame(self):
+        df = make_ohlcv(120)
+        outside = Signal("TEST", date(2030, 1, 1), SignalType.BUY, "x", 1.0, 0.5, 2.0)
+        result = simulate(df, [outside], "TEST")
+        assert result.trade_count == 0
+        assert result.total_return == 0.0
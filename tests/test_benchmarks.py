@@ -0,0 +1,81 @@
+"""benchmarks/ 합성 데이터·실행기·기준선 비교 단위 테스트"""
+from __future__ import annotations
+
+import json
+
+import pytest
+
+import api.routes as routes
+import data.fetcher as fetcher
+from benchmarks.cases import BARS, CASES, TICKERS, Case
+from benchmarks.data import SyntheticProvider, synthetic_ohlcv
+from benchmarks.runner import compare, main, run_all, select
+
+
+class TestSyntheticData:
+    def test_valid_bars(self):
+        df = synthetic_ohlcv(1_000, seed=1)
+        assert len(df) == 1_000 and df.index.is_monotonic_increasing
+        assert (df["High"] >= df[["Open", "Close"]].max(axis=1)).all()
+        assert (df["Low"] <= df[["Open", "Close"]].min(axis=1)).all()
+        assert synthetic_ohlcv(1_000, seed=1).equals(df)
+
+    def test_long_series_uses_intraday_index(self):
+        df = synthetic_ohlcv(60_000)
+        assert len(df) == 60_000 and df.index.is_unique
+
+    def test_provider_is_deterministic(self):
+        a, b = SyntheticProvider(bars=100), SyntheticProvider(bars=100)
+        assert a.download("X").equals(b.download("X"))
+        assert not a.download("X").equals(a.download("Y"))
+
+
+class TestRunner:
+    def test_every_case_runs(self):
+        cache, result_cache = fetcher._cache, routes._result_cache
+        results = run_all(CASES, {BARS: [300], TICKERS: [2]}, repeat=1)
+        assert {r["name"] for r in results} == {c.name for c in CASES}
+        assert all(r["min"] > 0 and r["runs"] >= 1 for r in results)
+        # 바꿔 둔 전역 상태는 항목이 끝나면 되돌립니다.
+        assert fetcher._cache is cache and routes._result_cache is result_cache
+
+    def test_max_size_skips(self):
+        calls = []
+        c = Case("dummy", BARS, lambda size, stack: lambda: calls.append(size), max_size=10)
+        results = run_all([c], {BARS: [5, 50]}, repeat=2)
+        assert [r["size"] for r in results] == [5] and set(calls) == {5}
+
+    def test_select(self):
+        assert {c.name for c in select("indicators.add_r*")} == {"indicators.add_rsi"}
+        assert all(c.name.startswith("serialize.") for c in select("serialize"))
+
+
+class TestCompare:
+    def test_statuses(self):
+        baseline = [
+            {"name": "a", "size": 1, "min": 1.0},
+            {"name": "b", "size": 1, "min": 1.0},
+            {"name": "c", "size": 1, "min": 1.0},
+        ]
+        current = [
+            {"name": "a", "size": 1, "min": 1.3},
+            {"name": "b", "size": 1, "min": 0.5},
+            {"name": "c", "size": 1, "min": 1.05},
+            {"name": "d", "size": 1, "min": 1.0},
+        ]
+        rows = compare(baseline, current, threshold=0.15)
+        assert [r["status"] for r in rows] == ["regression", "improved", "ok", "new"]
+        assert rows[0]["ratio"] == pytest.approx(1.3)
+
+    def test_cli_save_and_compare(self, tmp_path, capsys):
+        path = tmp_path / "baseline.json"
+        main(["-k", "indicators.add_ma", "--bars", "300", "--repeat", "1", "--save", str(path)])
+        saved = json.loads(path.read_text(encoding="utf-8"))
+        assert saved["environment"]["python"] and saved["results"][0]["name"] == "indicators.add_ma"
+
+        saved["results"][0]["min"] /= 100      # 기준선을 100배 빠르게 → 회귀
+        path.write_text(json.dumps(saved), encoding="utf-8")
+        with pytest.raises(SystemExit) as exc:
+            main(["-k", "indicators.add_ma", "--bars", "300", "--repeat", "1", "--compare", str(path)])
+        assert exc.value.code == 1
+        assert "회귀" in capsys.readouterr().out
@@ -0,0 +1,145 @@
+"""data/cache.py 및 fetch_ohlcv 캐시 경로 단위 테스트"""
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+
+import pandas as pd
+import pytest
+
+import data.cache as cache_module
+import data.fetcher as fetcher
+from data.cache import OHLCVCache
+from data.fetcher import fetch_ohlcv
+from data.providers import DataProvider, period_start
+from tests.conftest import make_ohlcv
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch) -> OHLCVCache:
+    c = OHLCVCache(str(tmp_path), ttl=3600)
+    monkeypatch.setattr(fetcher, "_cache", c)
+    # 실행 시각과 무관하도록 장 마감 상태로 고정합니다.
+    monkeypatch.setattr(cache_module, "is_market_open", lambda ticker, now=None: False)
+    return c
+
+
+class FakeProvider(DataProvider):
+    """네트워크 공급자 대체 — 호출 인자를 기록하고 지정 DataFrame을 반환합니다."""
+
+    name = "fake"
+
+    def __init__(self, df: pd.DataFrame) -> None:
+        self.df = df
+        self.calls: list[dict] = []
+
+    def download(self, ticker, period=None, start=None):
+        self.calls.append({"period": period, "start": start})
+        if start is not None:
+            return self.df.loc[start:]
+        return self.df
+
+
+class TestOHLCVCache:
+    def test_round_trip(self, tmp_path):
+        c = OHLCVCache(str(tmp_path))
+        df = make_ohlcv(30)
+        c.save("AAPL", df, pd.Timestamp("2024-01-01"))
+        loaded, meta = c.load("AAPL")
+        pd.testing.assert_frame_equal(loaded, df, check_freq=False)
+        assert meta["start"] == "2024-01-01"
+
+    def test_missing_returns_none(self, tmp_path):
+        loaded, meta = OHLCVCache(str(tmp_path)).load("NONE")
+        assert loaded is None
+        assert meta == {}
+
+    def test_covers(self, tmp_path):
+        c = OHLCVCache(str(tmp_path))
+        meta = {"start": "2024-01-01"}
+        assert c.covers(meta, pd.Timestamp("2024-06-01"))
+        assert not c.covers(meta, pd.Timestamp("2023-06-01"))
+        assert not c.covers(meta, None)
+        assert c.covers({"start": None}, None)
+
+    def test_is_fresh_respects_ttl(self, tmp_path):
+        c = OHLCVCache(str(tmp_path), ttl=0)
+        c.save("AAPL", make_ohlcv(10), None)
+        _, meta = c.load("AAPL")
+        assert not c.is_fresh(meta)
+
+    def test_is_fresh_follows_session(self, tmp_path):
+        c = OHLCVCache(str(tmp_path), ttl=6 * 3600)
+        # 2026-10-16(금) 뉴욕 정규장 14:00 / 마감 후 17:00 (EDT, UTC-4)
+        in_session = datetime(2026, 10, 16, 18, 0, tzinfo=timezone.utc).timestamp()
+        after_close = datetime(2026, 10, 16, 21, 0, tzinfo=timezone.utc).timestamp()
+        # 장중에는 CACHE_TTL_OPEN(60초) 안의 반복 조회만 캐시로 답하고, 그 뒤엔 마지막 봉을 다시 받습니다.
+        assert c.is_fresh({"fetched_at": in_session - 10}, "AAPL", now=in_session)
+        assert not c.is_fresh({"fetched_at": in_session - 120}, "AAPL", now=in_session)
+        # 장중에 수집한 캐시는 마감 후 최종 봉으로 한 번 더 갱신합니다.
+        assert not c.is_fresh({"fetched_at": in_session}, "AAPL", now=after_close)
+        assert c.is_fresh({"fetched_at": after_close - 60}, "AAPL", now=after_close)
+        # 종목 없이 부르면 TTL 만 봅니다.
+        assert c.is_fresh({"fetched_at": in_session - 10}, now=in_session)
+
+
+class TestPeriodStart:
+    def test_relative_periods(self):
+        today = pd.Timestamp("2024-06-15")
+        assert period_start("1y", today) == pd.Timestamp("2023-06-15")
+        assert period_start("3mo", today) == pd.Timestamp("2024-03-15")
+        assert period_start("ytd", today) == pd.Timestamp("2024-01-01")
+        assert period_start("max", today) is None
+
+    def test_invalid_period(self):
+        with pytest.raises(ValueError):
+            period_start("abc")
+
+
+class TestFetchOhlcvCache:
+    def test_fresh_cache_skips_network(self, cache, monkeypatch):
+        fake = FakeProvider(make_ohlcv(30))
+        monkeypatch.setattr(fetcher, "_provider", fake)
+        fetch_ohlcv("AAPL", period="max")
+        fetch_ohlcv("AAPL", period="max")
+        assert len(fake.calls) == 1
+
+    def test_stale_cache_fetches_tail_only(self, cache, monkeypatch):
+        full = make_ohlcv(40)
+        fake = FakeProvider(full.iloc[:30])
+        monkeypatch.setattr(fetcher, "_provider", fake)
+        fetch_ohlcv("AAPL", period="max")
+
+        cache.ttl = 0
+        fake.df = full
+        result = fetch_ohlcv("AAPL", period="max")
+        assert fake.calls[-1]["start"] == full.index[29]
+        assert len(result) == 40
+        assert not result.index.duplicated().any()
+
+    def test_failed_refresh_keeps_entry_stale(self, cache, monkeypatch):
+        fake = FakeProvider(make_ohlcv(30))
+        monkeypatch.setattr(fetcher, "_provider", fake)
+        fetch_ohlcv("AAPL", period="max")
+        _, meta_path = cache._paths("AAPL")
+        meta_path.write_text(json.dumps({"start": None, "fetched_at": 0.0}), encoding="utf-8")
+
+        fake.df = fake.df.iloc[:0]   # 증분 수집 실패 (데이터 없음)
+        assert len(fetch_ohlcv("AAPL", period="max")) == 30
+        assert cache.load("AAPL")[1]["fetched_at"] == 0.0
+        fetch_ohlcv("AAPL", period="max")
+        assert len(fake.calls) == 3   # 수집 시각이 그대로라 다음 호출에서 다시 시도
+
+    def test_uncovered_period_downloads_full(self, cache, monkeypatch):
+        fake = FakeProvider(make_ohlcv(30))
+        monkeypatch.setattr(fetcher, "_provider", fake)
+        fetch_ohlcv("AAPL", period="1y")
+        fetch_ohlcv("AAPL", period="max")
+        assert [c.get("period") for c in fake.calls] == ["1y", "max"]
+
+    def test_use_cache_false_always_downloads(self, cache, monkeypatch):
+        fake = FakeProvider(make_ohlcv(30))
+        monkeypatch.setattr(fetcher, "_provider", fake)
+        fetch_ohlcv("AAPL", period="max", use_cache=False)
+        fetch_ohlcv("AAPL", period="max", use_cache=False)
+        assert len(fake.calls) == 2
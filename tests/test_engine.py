@@ -0,0 +1,90 @@
+"""indicators/engine.py 단위 테스트"""
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from indicators.adx import add_adx, add_volume_ma
+from indicators.atr import add_atr
+from indicators.bollinger import add_bollinger
+import indicators.engine as engine
+from indicators.engine import IndicatorCache, IndicatorParams, compute_indicators
+from indicators.macd import add_macd
+from indicators.moving_average import add_ma
+from indicators.rsi import add_rsi
+from indicators.stochastic import add_stochastic
+from tests.conftest import make_ohlcv
+
+
+def _chained(df: pd.DataFrame) -> pd.DataFrame:
+    for fn in (add_ma, add_rsi, add_macd, add_bollinger, add_stochastic, add_atr, add_adx, add_volume_ma):
+        df = fn(df)
+    return df
+
+
+class TestComputeIndicators:
+    @pytest.mark.parametrize("n", [10, 120, 2_000])
+    def test_matches_chained_add_functions(self, n):
+        df = make_ohlcv(n)
+        expected = _chained(df)
+        result = compute_indicators(df)
+        assert list(result.columns) == list(expected.columns)
+        np.testing.assert_allclose(
+            result.to_numpy(dtype=float), expected.to_numpy(dtype=float),
+            rtol=1e-9, atol=1e-9, equal_nan=True,
+        )
+
+    def test_matches_with_flat_prices(self, golden_cross_df):
+        expected = _chained(golden_cross_df)
+        result = compute_indicators(golden_cross_df)
+        np.testing.assert_allclose(
+            result.to_numpy(dtype=float), expected.to_numpy(dtype=float),
+            rtol=1e-9, atol=1e-9, equal_nan=True,
+        )
+
+    def test_custom_params(self, sample_df):
+        params = IndicatorParams(ma_windows=(5, 10, 20), rsi_period=7, bb_period=10)
+        result = compute_indicators(sample_df, params)
+        expected = add_rsi(add_ma(sample_df, [5, 10, 20]), period=7)
+        assert "MA10" in result.columns
+        pd.testing.assert_series_equal(result["RSI"], expected["RSI"], check_names=False)
+        pd.testing.assert_series_equal(
+            result["BB_mid"], add_bollinger(sample_df, period=10)["BB_mid"], check_names=False
+        )
+
+    def test_does_not_mutate_original(self, sample_df):
+        cols = list(sample_df.columns)
+        compute_indicators(sample_df)
+        assert list(sample_df.columns) == cols
+
+    def test_empty_frame(self):
+        df = pd.DataFrame(columns=["Open", "High", "Low", "Close", "Volume"])
+        result = compute_indicators(df)
+        assert result.empty
+        assert "ADX" in result.columns
+
+
+class TestIndicatorCache:
+    def test_frames_match_fresh_computation(self, sample_df):
+        cache = IndicatorCache(sample_df)
+        for params in (IndicatorParams(), IndicatorParams(rsi_period=7), IndicatorParams(bb_std=1.5, stoch_k=9)):
+            pd.testing.assert_frame_equal(cache.frame(params), compute_indicators(sample_df, params))
+
+    def test_only_changed_indicator_recomputed(self, sample_df, monkeypatch):
+        calls = []
+        original = engine._ewm
+
+        def counting(values, span):
+            calls.append(span)
+            return original(values, span)
+
+        monkeypatch.setattr(engine, "_ewm", counting)
+        cache = IndicatorCache(sample_df)
+        cache.frame(IndicatorParams())
+        first = len(calls)
+        # RSI 기간만 바꾸면 MACD·ADX 의 EWM 은 다시 계산하지 않습니다.
+        cache.frame(IndicatorParams(rsi_period=7))
+        assert len(calls) == first
+        cache.frame(IndicatorParams(macd_signal=5))
+        assert calls[first:] == [5]
@@ -0,0 +1,177 @@
+"""api.jobs 비동기 백테스트 작업 단위 테스트"""
+from __future__ import annotations
+
+import time
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+import api.routes as routes
+from api.jobs import DONE, FAILED, Job, JobManager, JobsUnavailable, job_id
+from api.serializers import backtest_to_dict
+from app import create_app
+from backtest.engine import run
+from data.providers import FileProvider
+from tests.conftest import make_ohlcv
+
+SPEC = {"ticker": "AAA", "start": "2024-03-01", "end": "2025-01-31", "initial_capital": 1_000_000.0}
+
+
+@pytest.fixture
+def provider(tmp_path, monkeypatch):
+    make_ohlcv(400, seed=3).rename_axis("Date").to_csv(tmp_path / "AAA.csv")
+    provider = FileProvider(str(tmp_path))
+    monkeypatch.setattr("data.fetcher._provider", provider)
+    return provider
+
+
+@pytest.fixture
+def manager():
+    jobs = JobManager(workers=1)
+    yield jobs
+    jobs.shutdown()
+
+
+def _wait(jobs: JobManager, key: str, timeout: float = 30.0) -> dict:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        status = jobs.status(key)
+        if status["status"] in (DONE, FAILED):
+            return status
+        time.sleep(0.01)
+    raise AssertionError("작업 시간 초과")
+
+
+class TestJobManager:
+    def test_result_matches_direct_run(self, provider, manager):
+        job, created = manager.submit(SPEC)
+        assert created
+        status = _wait(manager, job.id)
+        assert status["status"] == DONE and status["progress"] == 1.0
+        expected = backtest_to_dict(run("AAA", SPEC["start"], SPEC["end"], provider=provider))
+        assert manager.get(job.id).result == expected
+
+    def test_identical_specs_deduplicated(self, provider, manager):
+        first, _ = manager.submit(SPEC)
+        second, created = manager.submit(dict(SPEC))
+        assert second is first and not created
+        _wait(manager, first.id)
+        third, created = manager.submit(SPEC)
+        assert third is first and not created   # 완료 결과 재사용
+
+    def test_failed_job_reported_and_resubmittable(self, provider, manager):
+        spec = {**SPEC, "ticker": "NOPE"}
+        job, _ = manager.submit(spec)
+        status = _wait(manager, job.id)
+        assert status["status"] == FAILED and "NOPE" in status["error"]
+        again, created = manager.submit(spec)
+        assert created and again is not job
+
+    def test_expired_results_pruned(self, provider, manager):
+        manager.result_ttl = 0
+        job, _ = manager.submit(SPEC)
+        _wait(manager, job.id)
+        time.sleep(0.01)
+        _, created = manager.submit(SPEC)
+        assert created
+
+    def test_active_jobs_bounded(self, provider, manager):
+        manager.max_jobs = 1
+        manager._jobs["pending"] = Job(id="pending", spec=SPEC, future=Future())
+        with pytest.raises(JobsUnavailable):
+            manager.submit(SPEC)
+
+    def test_broken_pool_recreated(self, provider, manager):
+        class BrokenPool:
+            def submit(self, *args, **kwargs):
+                raise BrokenProcessPool("워커 비정상 종료")
+
+            def shutdown(self, wait=True):
+                pass
+
+        manager._pool = BrokenPool()
+        with pytest.raises(JobsUnavailable):
+            manager.submit(SPEC)
+        assert not isinstance(manager._pool, BrokenPool)
+        job, created = manager.submit(SPEC)
+        assert created and _wait(manager, job.id)["status"] == DONE
+
+    def test_finish_marks_crashed_jobs(self, manager):
+        for key, exc in (("crash", BrokenProcessPool("워커 종료")), ("input", ValueError("데이터 없음"))):
+            future = Future()
+            future.set_exception(exc)
+            job = Job(id=key, spec=SPEC)
+            manager._finish(job, future)
+            assert job.status == FAILED and job.crashed == (key == "crash")
+
+    def test_job_id_stable(self):
+        assert job_id(SPEC) == job_id(dict(reversed(list(SPEC.items()))))
+        assert job_id(SPEC) != job_id({**SPEC, "end": "2025-02-01"})
+
+
+class TestBacktestRoutes:
+    @pytest.fixture
+    def client(self, provider, monkeypatch):
+        jobs = JobManager(workers=1)
+        monkeypatch.setattr(routes, "_jobs", jobs)
+        yield create_app().test_client()
+        jobs.shutdown()
+
+    def test_submit_poll_result(self, client):
+        submitted = client.post("/api/backtest", json={"ticker": "aaa", "start": SPEC["start"], "end": SPEC["end"]})
+        assert submitted.status_code == 202
+        body = submitted.get_json()
+        assert body["spec"] == SPEC and not body["deduplicated"]
+
+        deadline = time.monotonic() + 30
+        while client.get(body["status_url"]).get_json()["status"] not in (DONE, FAILED):
+            assert time.monotonic() < deadline
+            time.sleep(0.01)
+        result = client.get(body["result_url"])
+        assert result.status_code == 200
+        assert result.get_json()["result"]["ticker"] == "AAA"
+
+        again = client.post("/api/backtest", json={"ticker": "AAA", "start": SPEC["start"], "end": SPEC["end"]})
+        assert again.get_json()["deduplicated"] and again.get_json()["job_id"] == body["job_id"]
+
+    def test_pending_result_is_202(self, client):
+        routes._jobs._jobs["pending"] = Job(id="pending", spec=SPEC, future=Future())
+        response = client.get("/api/backtest/pending/result")
+        assert response.status_code == 202
+        assert response.get_json()["status"] == "queued"
+
+    def test_validation(self, client):
+        assert client.post("/api/backtest", json={"start": "2024-01-01", "end": "2024-02-01"}).status_code == 400
+        assert client.post("/api/backtest", json={**SPEC, "start": "2024/01/01"}).status_code == 400
+        assert client.post("/api/backtest", json={**SPEC, "start": "2025-06-01"}).status_code == 400
+        assert client.post("/api/backtest", json={**SPEC, "initial_capital": -1}).status_code == 400
+        for value in ("nan", "inf", "-inf"):
+            assert client.post("/api/backtest", json={**SPEC, "initial_capital": value}).status_code == 400
+
+    def test_malformed_body_is_400(self, client):
+        for body in ([1], ["AAA"], "AAA"):
+            assert client.post("/api/backtest", json=body).status_code == 400
+        assert client.post("/api/backtest", json={**SPEC, "initial_capital": [1]}).status_code == 400
+        assert client.post("/api/backtest", json={**SPEC, "initial_capital": {}}).status_code == 400
+
+    def test_failed_job_result(self, client):
+        routes._jobs._jobs["bad"] = Job(id="bad", spec=SPEC, status=FAILED, error="데이터 없음")
+        response = client.get("/api/backtest/bad/result")
+        assert response.status_code == 200
+        assert response.get_json() == {"job_id": "bad", "status": "failed", "error": "데이터 없음"}
+
+        routes._jobs._jobs["dead"] = Job(id="dead", spec=SPEC, status=FAILED, error="pool", crashed=True)
+        assert client.get("/api/backtest/dead/result").status_code == 503
+
+    def test_unavailable_is_503(self, client, monkeypatch):
+        def refuse(spec):
+            raise JobsUnavailable("가득 참")
+
+        monkeypatch.setattr(routes._jobs, "submit", refuse)
+        response = client.post("/api/backtest", json=SPEC)
+        assert response.status_code == 503 and response.get_json()["error"] == "가득 참"
+
+    def test_unknown_job(self, client):
+        assert client.get("/api/backtest/deadbeef").status_code == 404
+        assert client.get("/api/backtest/deadbeef/result").status_code == 404
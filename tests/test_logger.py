@@ -0,0 +1,100 @@
+"""utils/logger.py 비동기 공용 로거 단위 테스트"""
+from __future__ import annotations
+
+import json
+import threading
+
+import pytest
+
+import utils.logger as log_module
+from utils.logger import get_logger
+
+
+@pytest.fixture
+def log_file(tmp_path):
+    path = tmp_path / "logs" / "test.log"
+    yield path
+    for key, handler in list(log_module._file_handlers.items()):
+        if key[0].startswith(str(tmp_path)):
+            handler.close()
+            del log_module._file_handlers[key]
+
+
+def _flush(path) -> None:
+    for key, handler in log_module._file_handlers.items():
+        if key[0] == str(path.resolve()):
+            handler.close()
+
+
+class TestSharedHandler:
+    def test_one_file_handler_per_path(self, log_file):
+        a = get_logger("test.shared.a", log_file=str(log_file))
+        b = get_logger("test.shared.b", log_file=str(log_file))
+        assert a.handlers[1] is b.handlers[1]
+        assert a.handlers[0] is b.handlers[0]
+
+    def test_writes_in_background(self, log_file):
+        logger = get_logger("test.bg", log_file=str(log_file))
+        handler = log_module._file_handlers[(str(log_file.resolve()), False)]
+        writers = []
+        emit = handler.target.emit
+        handler.target.emit = lambda record: (writers.append(threading.current_thread().name), emit(record))
+        logger.info("value=%s", "x")
+        _flush(log_file)
+        assert "value=x" in log_file.read_text(encoding="utf-8")
+        assert writers and threading.current_thread().name not in writers
+
+    def test_message_merged_on_calling_thread(self, log_file):
+        logger = get_logger("test.merge", log_file=str(log_file))
+        seen = []
+
+        class Probe:
+            def __str__(self):
+                seen.append(threading.current_thread().name)
+                return "probe"
+
+        state = {"step": 1}
+        logger.info("value=%s state=%s", Probe(), state)
+        state["step"] = 2   # 호출 뒤 변경은 기록에 반영되지 않습니다.
+        _flush(log_file)
+        text = log_file.read_text(encoding="utf-8")
+        assert "value=probe state={'step': 1}" in text
+        assert set(seen) == {threading.current_thread().name}
+
+    def test_concurrent_writes_not_interleaved(self, log_file):
+        logger = get_logger("test.concurrent", log_file=str(log_file), json_lines=True)
+        logger.removeHandler(logger.handlers[0])   # 콘솔 출력 생략
+
+        def work(n: int) -> None:
+            for i in range(200):
+                logger.info("worker %d line %d %s", n, i, "x" * 100)
+
+        threads = [threading.Thread(target=work, args=(n,)) for n in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        log_module._file_handlers[(str(log_file.resolve()), True)].close()
+        lines = log_file.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 1600
+        assert all(json.loads(line)["logger"] == "test.concurrent" for line in lines)
+
+
+class TestJsonLines:
+    def test_record_fields(self, log_file):
+        logger = get_logger("test.json", log_file=str(log_file), json_lines=True)
+        logger.removeHandler(logger.handlers[0])
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("%s: 실패", "AAPL")
+        log_module._file_handlers[(str(log_file.resolve()), True)].close()
+        entry = json.loads(log_file.read_text(encoding="utf-8"))
+        assert entry["level"] == "ERROR" and entry["message"] == "AAPL: 실패"
+        assert "ValueError: boom" in entry["exc"]
+
+    def test_writes_after_close(self, log_file):
+        logger = get_logger("test.closed", log_file=str(log_file))
+        _flush(log_file)
+        logger.warning("after close")
+        assert "after close" in log_file.read_text(encoding="utf-8")
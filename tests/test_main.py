@@ -0,0 +1,47 @@
+"""main.py CLI 분석 경로 단위 테스트"""
+from __future__ import annotations
+
+import re
+
+import pytest
+
+import data.fetcher as fetcher
+from data.providers import FileProvider
+from main import analyze_parallel, analyze_ticker
+from utils.metrics import REGISTRY
+from tests.conftest import make_ohlcv
+
+
+@pytest.fixture
+def file_provider(tmp_path, monkeypatch):
+    for i, t in enumerate(["AAA", "BBB", "CCC"]):
+        df = make_ohlcv(300, seed=i)
+        df.index.name = "Date"
+        df.to_csv(tmp_path / f"{t}.csv")
+    monkeypatch.setattr(fetcher, "_provider", FileProvider(str(tmp_path)))
+
+
+def _strip_logs(text: str) -> str:
+    return "\n".join(line for line in text.splitlines() if not re.match(r"\d{4}-\d{2}-\d{2} ", line))
+
+
+class TestAnalyzeParallel:
+    def test_output_matches_sequential(self, file_provider, capsys):
+        tickers = ["CCC", "MISSING", "AAA", "BBB"]
+        for t in tickers:
+            analyze_ticker(t)
+        sequential = _strip_logs(capsys.readouterr().out)
+
+        analyze_parallel(tickers, jobs=2)
+        parallel = _strip_logs(capsys.readouterr().out)
+
+        assert parallel == sequential
+        assert "건너뜀" in parallel
+        assert parallel.index("CCC") < parallel.index("MISSING") < parallel.index("AAA")
+
+    def test_worker_metrics_merged(self, file_provider):
+        REGISTRY.reset()
+        analyze_parallel(["AAA", "BBB"], jobs=2)
+        stages = REGISTRY.by_stage()
+        assert stages["fetch"].count == stages["signals"].count == stages["indicators"].count == 2
+        assert ("clean", "AAA") in REGISTRY._hists
@@ -0,0 +1,106 @@
+"""utils/metrics.py 단계별 계측 단위 테스트"""
+from __future__ import annotations
+
+import pickle
+import threading
+
+import pytest
+
+import utils.metrics as metrics
+from utils.metrics import Histogram, MetricsRegistry, current_ticker
+
+
+@pytest.fixture
+def registry():
+    return MetricsRegistry(max_tickers=2)
+
+
+class TestHistogram:
+    def test_buckets_and_quantile(self):
+        h = Histogram()
+        for seconds in [0.002] * 90 + [0.2] * 10:
+            h.observe(seconds)
+        assert h.count == 100 and h.sum == pytest.approx(2.18)
+        assert 0.001 <= h.quantile(0.5) <= 0.0025
+        assert 0.1 <= h.quantile(0.95) <= 0.2
+        assert h.quantile(1.0) == pytest.approx(0.2)
+
+    def test_overflow_bucket(self):
+        h = Histogram()
+        h.observe(30.0)
+        assert h.counts[-1] == 1 and 10.0 <= h.quantile(0.5) <= 30.0
+
+
+class TestRegistry:
+    def test_span_records_stage_and_ticker(self, registry):
+        with registry.span("fetch", "AAA"):
+            pass
+        with current_ticker("BBB"), registry.span("clean"):
+            pass
+        with registry.span("clean"):
+            pass
+        assert set(registry._hists) == {("fetch", "AAA"), ("clean", "BBB"), ("clean", "")}
+        assert registry.by_stage()["clean"].count == 2
+
+    def test_span_counts_errors(self, registry):
+        with pytest.raises(ValueError):
+            with registry.span("fetch", "AAA"):
+                raise ValueError("x")
+        hist = registry._hists[("fetch", "AAA")]
+        assert hist.count == 1 and hist.errors == 1
+
+    def test_ticker_cardinality_cap(self, registry):
+        for t in ["A", "B", "C", "D"]:
+            registry.observe("fetch", 0.01, t)
+        assert set(registry._hists) == {("fetch", "A"), ("fetch", "B"), ("fetch", "_other")}
+        assert registry._hists[("fetch", "_other")].count == 2
+
+    def test_disabled_is_noop(self, registry, monkeypatch):
+        monkeypatch.setattr(metrics, "METRICS_ENABLED", False)
+        with registry.span("fetch", "AAA"):
+            pass
+        assert registry._hists == {}
+
+    def test_thread_safety(self, registry):
+        def work():
+            for _ in range(1000):
+                registry.observe("signals", 0.001, "A")
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert registry.by_stage()["signals"].count == 8000
+
+    def test_drain_and_merge(self, registry):
+        registry.observe("fetch", 0.01, "A")
+        drained = pickle.loads(pickle.dumps(registry.drain()))
+        assert registry._hists == {}
+        target = MetricsRegistry()
+        target.merge(drained)
+        target.merge(drained)
+        assert target._hists[("fetch", "A")].count == 2
+
+
+class TestOutput:
+    def test_prometheus_text(self, registry):
+        registry.observe("fetch", 0.003, "A")
+        registry.observe("fetch", 0.3, "A")
+        text = registry.render_prometheus()
+        assert "# TYPE stock_stage_duration_seconds histogram" in text
+        assert 'stock_stage_duration_seconds_bucket{stage="fetch",ticker="A",le="0.005"} 1' in text
+        assert 'stock_stage_duration_seconds_bucket{stage="fetch",ticker="A",le="+Inf"} 2' in text
+        assert 'stock_stage_duration_seconds_count{stage="fetch",ticker="A"} 2' in text
+        assert 'stock_stage_errors_total{stage="fetch",ticker="A"} 0' in text
+
+    def test_label_escaping(self, registry):
+        registry.observe("fetch", 0.01, 'A"B')
+        assert 'ticker="A\\"B"' in registry.render_prometheus()
+
+    def test_summary(self, registry):
+        assert "없음" in registry.format_summary()
+        registry.observe("fetch", 0.01, "A")
+        registry.observe("indicators", 0.02, "A")
+        lines = registry.format_summary().splitlines()
+        assert len(lines) == 3 and lines[1].split()[0] == "fetch"
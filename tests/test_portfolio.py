@@ -0,0 +1,84 @@
+"""backtest/portfolio.py 단위 테스트"""
+from __future__ import annotations
+
+import pandas as pd
+import pytest
+
+from backtest.engine import simulate
+from backtest.portfolio import run_portfolio, simulate_portfolio
+from data.processor import clean
+from data.providers import FileProvider
+from signals.generator import Signal, SignalType, generate
+from tests.conftest import make_ohlcv
+
+
+def _buy(df: pd.DataFrame, i: int, ticker: str, stop: float = 0.5, target: float = 2.0) -> Signal:
+    price = float(df["Close"].iloc[i])
+    return Signal(ticker, df.index[i].date(), SignalType.BUY, "BUY", price, price * stop, price * target)
+
+
+def _sell(df: pd.DataFrame, i: int, ticker: str) -> Signal:
+    price = float(df["Close"].iloc[i])
+    return Signal(ticker, df.index[i].date(), SignalType.SELL, "SELL", price)
+
+
+class TestSimulatePortfolio:
+    def test_single_ticker_matches_engine(self):
+        df = clean(make_ohlcv(400, seed=3))
+        signals = generate(df, "A")
+        expected = simulate(df, signals, "A")
+        result = simulate_portfolio({"A": df}, {"A": signals}, max_positions=1)
+        assert result.total_return == expected.total_return
+        assert result.trade_count == expected.trade_count
+        assert result.win_rate == expected.win_rate
+        assert result.max_drawdown == expected.max_drawdown
+        assert result.attribution["A"].stop_loss_hits == expected.stop_loss_hits
+        assert result.attribution["A"].target_hits == expected.target_hits
+
+    def test_shared_capital_split_across_positions(self):
+        a, b = make_ohlcv(60, seed=1), make_ohlcv(60, seed=2)
+        signals = {"A": [_buy(a, 10, "A"), _sell(a, 30, "A")], "B": [_buy(b, 10, "B"), _sell(b, 30, "B")]}
+        result = simulate_portfolio({"A": a, "B": b}, signals, initial_capital=1_000.0, max_positions=2)
+        expected_pnl = {
+            t: 500.0 * (float(df["Close"].iloc[30]) / float(df["Close"].iloc[10]) - 1)
+            for t, df in (("A", a), ("B", b))
+        }
+        for t in ("A", "B"):
+            assert result.attribution[t].pnl == pytest.approx(expected_pnl[t], abs=0.01)
+        assert result.final_equity == pytest.approx(1_000.0 + sum(expected_pnl.values()), abs=0.01)
+
+    def test_position_limit(self):
+        frames = {t: make_ohlcv(60, seed=i) for i, t in enumerate("ABC")}
+        signals = {t: [_buy(df, 10, t)] for t, df in frames.items()}
+        result = simulate_portfolio(frames, signals, max_positions=2)
+        assert result.attribution["A"].trade_count == 1
+        assert result.attribution["B"].trade_count == 1
+        assert result.attribution["C"].trade_count == 0
+
+    def test_attribution_sums_to_total(self):
+        frames = {t: clean(make_ohlcv(300, seed=i)) for i, t in enumerate("ABCD")}
+        signals = {t: generate(df, t) for t, df in frames.items()}
+        result = simulate_portfolio(frames, signals, initial_capital=1_000_000.0, max_positions=3)
+        total_pnl = sum(a.pnl for a in result.attribution.values())
+        assert result.final_equity - 1_000_000.0 == pytest.approx(total_pnl, abs=0.1)
+        assert result.trade_count == sum(a.trade_count for a in result.attribution.values())
+
+    def test_equity_curve_on_union_of_dates(self):
+        a = make_ohlcv(40)
+        b = make_ohlcv(40).iloc[10:]
+        result = simulate_portfolio({"A": a, "B": b}, {})
+        assert len(result.equity_curve) == 40
+        assert result.total_return == 0.0
+
+
+class TestRunPortfolio:
+    def test_runs_from_provider(self, tmp_path):
+        for i, t in enumerate(["AAA", "BBB"]):
+            df = make_ohlcv(300, seed=i)
+            df.index.name = "Date"
+            df.to_csv(tmp_path / f"{t}.csv")
+        result = run_portfolio(
+            ["AAA", "BBB", "MISSING"], "2024-01-01", "2025-12-31",
+            provider=FileProvider(str(tmp_path)),
+        )
+        assert set(result.attribution) == {"AAA", "BBB"}
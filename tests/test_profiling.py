@@ -0,0 +1,153 @@
+"""프로파일링 세션 · API 프로파일 플래그 테스트"""
+from __future__ import annotations
+
+import pstats
+import threading
+
+import pytest
+
+import api.routes as routes
+from api.result_cache import ResultCache
+from app import create_app
+from data.processor import clean
+from data.providers import FileProvider
+from signals.generator import generate
+from tests.conftest import make_ohlcv
+from utils import profiling
+from utils.metrics import span
+from utils.profiling import ProfilerBusy, profile_session
+
+
+def _work() -> None:
+    generate(clean(make_ohlcv(300, seed=1)), "TEST")
+
+
+class TestProfileSession:
+    def test_writes_prof_and_summary(self, tmp_path):
+        with profile_session("unit", out_dir=str(tmp_path)) as session:
+            assert profiling.is_active()
+            _work()
+        assert not profiling.is_active()
+        report = session.report
+        assert report.prof_path.exists() and report.summary_path.exists()
+        assert report.summary_path.read_text(encoding="utf-8") == report.summary
+        # 표준 pstats 파일로 다시 읽을 수 있어야 합니다.
+        stats = pstats.Stats(str(report.prof_path))
+        assert any(fn[2] == "generate" for fn in stats.stats)
+
+    def test_summary_sections(self, tmp_path):
+        with profile_session("unit", out_dir=str(tmp_path)) as session:
+            _work()
+        summary = session.report.summary
+        assert "프로젝트 함수 상위" in summary
+        assert "signals/generator.py" in summary
+        assert "단계별" in summary and "할당 상위" in summary
+
+    def test_stage_memory(self, tmp_path):
+        with profile_session("unit", out_dir=str(tmp_path)) as session:
+            _work()
+        stages = session.report.stages
+        assert stages["indicators"].calls == 1
+        assert stages["indicators"].peak > 0
+        assert "clean" in stages and "signals" in stages
+
+    def test_nested_stage_keeps_inner_peak(self, tmp_path):
+        with profile_session("nested", out_dir=str(tmp_path)) as session:
+            with span("outer"):
+                with span("inner"):
+                    block = bytearray(4_000_000)
+                del block
+        stages = session.report.stages
+        assert stages["inner"].peak >= 4_000_000
+        assert stages["outer"].peak >= 4_000_000
+
+    def test_memory_off(self, tmp_path):
+        with profile_session("cpu", out_dir=str(tmp_path), memory=False) as session:
+            _work()
+        assert session.report.stages == {}
+        assert "할당 상위" not in session.report.summary
+
+    def test_report_written_on_error(self, tmp_path):
+        with pytest.raises(ValueError):
+            with profile_session("fail", out_dir=str(tmp_path)) as session:
+                raise ValueError("boom")
+        assert session.report.prof_path.exists()
+
+    def test_busy_without_wait(self, tmp_path):
+        entered, release = threading.Event(), threading.Event()
+
+        def hold() -> None:
+            with profile_session("hold", out_dir=str(tmp_path), memory=False):
+                entered.set()
+                release.wait(5)
+
+        worker = threading.Thread(target=hold)
+        worker.start()
+        try:
+            assert entered.wait(5)
+            assert not profiling.is_active()   # 다른 스레드의 세션
+            with pytest.raises(ProfilerBusy):
+                with profile_session("second", out_dir=str(tmp_path), wait=False):
+                    pass
+        finally:
+            release.set()
+            worker.join()
+
+
+@pytest.fixture
+def make_client(tmp_path, monkeypatch):
+    df = make_ohlcv(400, seed=3)
+    df.index.name = "Date"
+    df.to_csv(tmp_path / "TEST.csv")
+    monkeypatch.setattr("data.fetcher._provider", FileProvider(str(tmp_path)))
+    monkeypatch.setattr("api.routes._result_cache", ResultCache())
+
+    def make(enabled: bool):
+        app = create_app(profile_api=enabled)
+        app.config["PROFILE_DIR"] = str(tmp_path / "profiles")
+        return app.test_client()
+
+    return make
+
+
+class TestApiProfile:
+    def test_query_flag(self, make_client):
+        client = make_client(True)
+        response = client.get("/api/analyze?ticker=TEST&profile=1")
+        assert response.status_code == 200
+        name = response.headers["X-Profile"]
+        assert name.startswith("api-api.analyze-")
+        summary = client.get(f"/api/profile/{name}")
+        assert summary.status_code == 200
+        assert "프로파일: " + name in summary.get_data(as_text=True)
+        prof = client.get(f"/api/profile/{name}?format=prof")
+        assert prof.status_code == 200 and prof.data
+
+    def test_header_flag_bypasses_result_cache(self, make_client):
+        client = make_client(True)
+        client.get("/api/analyze?ticker=TEST")
+        hits = routes._result_cache.stats()["hits"]
+        response = client.get("/api/analyze?ticker=TEST", headers={"X-Profile": "1"})
+        assert "X-Profile" in response.headers
+        assert routes._result_cache.stats()["hits"] == hits
+        summary = client.get(f"/api/profile/{response.headers['X-Profile']}").get_data(as_text=True)
+        assert "indicators/" in summary
+
+    def test_disabled_by_default(self, make_client):
+        client = make_client(False)
+        response = client.get("/api/analyze?ticker=TEST&profile=1")
+        assert response.status_code == 200
+        assert "X-Profile" not in response.headers
+        assert client.get("/api/profile/anything").status_code == 404
+
+    def test_busy(self, make_client, tmp_path):
+        client = make_client(True)
+        with profile_session("hold", out_dir=str(tmp_path), memory=False):
+            response = client.get("/api/analyze?ticker=TEST&profile=1")
+        assert response.status_code == 200
+        assert response.headers["X-Profile"] == "busy"
+
+    def test_unknown_or_invalid_name(self, make_client):
+        client = make_client(True)
+        assert client.get("/api/profile/missing").status_code == 404
+        assert client.get("/api/profile/..%2Fconfig").status_code == 404
@@ -0,0 +1,154 @@
+"""data/providers.py 및 공급자 선택 단위 테스트"""
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+import pytest
+
+import data.fetcher as fetcher
+from data.fetcher import DataFetchError, fetch_multiple, fetch_ohlcv
+from data.providers import FileProvider
+from tests.conftest import make_ohlcv
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    df = make_ohlcv(300)
+    df.index.name = "Date"
+    df.to_csv(tmp_path / "AAPL.csv")
+    df.rename(columns=str.lower).to_csv(tmp_path / "005930.KS.csv")
+    return tmp_path
+
+
+class TestFileProvider:
+    def test_reads_csv_with_dtypes(self, data_dir):
+        df = FileProvider(str(data_dir)).download("AAPL", period="max")
+        assert list(df.columns) == ["Open", "High", "Low", "Close", "Volume"]
+        assert isinstance(df.index, pd.DatetimeIndex)
+        for col in ["Open", "High", "Low", "Close"]:
+            assert df[col].dtype == "float64"
+        assert len(df) == 300
+
+    def test_normalizes_column_names(self, data_dir):
+        df = FileProvider(str(data_dir)).download("005930.KS", period="max")
+        assert "Close" in df.columns
+
+    def test_period_relative_to_last_bar(self, data_dir):
+        df = FileProvider(str(data_dir)).download("AAPL", period="3mo")
+        last = df.index[-1]
+        assert df.index[0] >= last - pd.DateOffset(months=3)
+        assert len(df) < 300
+
+    def test_start_slices(self, data_dir):
+        full = FileProvider(str(data_dir)).download("AAPL", period="max")
+        df = FileProvider(str(data_dir)).download("AAPL", start=full.index[100])
+        assert df.index[0] == full.index[100]
+
+    def test_missing_file_raises(self, tmp_path):
+        with pytest.raises(DataFetchError):
+            FileProvider(str(tmp_path)).download("NONE", period="1y")
+
+
+class TestFetchWithProvider:
+    def test_fetch_ohlcv_uses_explicit_provider(self, data_dir):
+        df = fetch_ohlcv("AAPL", period="max", provider=FileProvider(str(data_dir)))
+        assert len(df) == 300
+
+    def test_missing_file_not_retried(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(fetcher.time, "sleep", lambda s: pytest.fail("재시도 발생"))
+        with pytest.raises(DataFetchError):
+            fetch_ohlcv("NONE", provider=FileProvider(str(tmp_path)))
+
+    def test_set_provider_applies_to_fetch_multiple(self, data_dir, monkeypatch):
+        monkeypatch.setattr(fetcher, "_provider", fetcher.get_provider())
+        fetcher.set_provider(FileProvider(str(data_dir)))
+        results = fetch_multiple(["AAPL", "NONE"])
+        assert list(results) == ["AAPL"]
+
+
+class FlakyProvider(FileProvider):
+    """첫 호출마다 예외를 던지고, 일괄 수집 호출 횟수를 기록합니다."""
+
+    def __init__(self, data_dir: str) -> None:
+        super().__init__(data_dir)
+        self.failed: set[str] = set()
+        self.bulk_calls: list[list[str]] = []
+
+    def download(self, ticker, period=None, start=None):
+        if ticker not in self.failed:
+            self.failed.add(ticker)
+            raise ConnectionError("일시 장애")
+        return super().download(ticker, period=period, start=start)
+
+    def download_many(self, tickers, period):
+        self.bulk_calls.append(list(tickers))
+        return {t: FileProvider.download(self, t, period=period) for t in tickers if t == "AAPL"}
+
+
+class TestFetchMultipleConcurrent:
+    def test_retries_each_ticker_with_backoff(self, data_dir, monkeypatch):
+        sleeps: list[float] = []
+        monkeypatch.setattr(fetcher.time, "sleep", sleeps.append)
+        provider = FlakyProvider(str(data_dir))
+        results = fetch_multiple(["AAPL", "005930.KS"], provider=provider, period="max", max_workers=2)
+        assert list(results) == ["AAPL", "005930.KS"]
+        assert len(sleeps) == 2
+        assert all(fetcher.RETRY_BACKOFF <= s <= 2 * fetcher.RETRY_BACKOFF for s in sleeps)
+
+    def test_preserves_input_order(self, data_dir):
+        tickers = ["005930.KS", "NONE", "AAPL"]
+        results = fetch_multiple(tickers, provider=FileProvider(str(data_dir)), max_workers=3)
+        assert list(results) == ["005930.KS", "AAPL"]
+
+    def test_bulk_mode_falls_back_for_missing(self, data_dir, monkeypatch):
+        monkeypatch.setattr(fetcher.time, "sleep", lambda s: None)
+        provider = FlakyProvider(str(data_dir))
+        results = fetch_multiple(["AAPL", "005930.KS"], provider=provider, period="max", bulk=True)
+        assert provider.bulk_calls == [["AAPL", "005930.KS"]]
+        assert "AAPL" not in provider.failed   # 일괄 수집으로 해결, 종목별 호출 없음
+        assert list(results) == ["AAPL", "005930.KS"]
+
+
+class SlowProvider(FileProvider):
+    """download 가 gate 가 열릴 때까지 대기하며 호출 횟수를 기록합니다."""
+
+    def __init__(self, data_dir: str) -> None:
+        super().__init__(data_dir)
+        self.calls: list[str] = []
+        self.gate = threading.Event()
+
+    def download(self, ticker, period=None, start=None):
+        self.calls.append(ticker)
+        self.gate.wait(5)
+        return super().download(ticker, period=period, start=start)
+
+
+class TestFetchCoalescing:
+    def test_concurrent_fetches_share_one_download(self, data_dir):
+        provider = SlowProvider(str(data_dir))
+        joined = fetcher._inflight.coalesced
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [pool.submit(fetch_ohlcv, "AAPL", "max", True, provider) for _ in range(4)]
+            while fetcher._inflight.coalesced - joined < 3:
+                threading.Event().wait(0.001)
+            provider.gate.set()
+            frames = [f.result() for f in futures]
+        assert provider.calls == ["AAPL"]
+        assert all(df is frames[0] for df in frames)
+
+    def test_on_fetched_fires_once_for_coalesced_calls(self, data_dir):
+        provider = SlowProvider(str(data_dir))
+        fetched: list[str] = []
+        provider.on_fetched = lambda ticker, period, df, elapsed: fetched.append(ticker)
+        joined = fetcher._inflight.coalesced
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            futures = [pool.submit(fetch_ohlcv, "AAPL", "max", True, provider) for _ in range(4)]
+            while fetcher._inflight.coalesced - joined < 3:
+                threading.Event().wait(0.001)
+            provider.gate.set()
+            for f in futures:
+                f.result()
+        assert fetched == ["AAPL"]
+
@@ -0,0 +1,120 @@
+"""data/replay.py 녹화/재생 공급자 단위 테스트"""
+from __future__ import annotations
+
+import pickle
+import time
+
+import pandas as pd
+import pytest
+
+from data.fetcher import DataFetchError, fetch_multiple, fetch_ohlcv
+from data.providers import FileProvider
+from data.replay import (
+    LATENCY_RECORDED,
+    RecordingProvider,
+    ReplayProvider,
+    load_response,
+    parse_latency,
+    save_response,
+)
+from tests.conftest import make_ohlcv
+
+
+@pytest.fixture
+def data_dir(tmp_path):
+    directory = tmp_path / "data"
+    directory.mkdir()
+    for i, t in enumerate(["AAA", "BBB"]):
+        df = make_ohlcv(300, seed=i)
+        df.index.name = "Date"
+        df.to_csv(directory / f"{t}.csv")
+    return directory
+
+
+@pytest.fixture
+def archive(tmp_path, data_dir):
+    path = tmp_path / "archive"
+    recorder = RecordingProvider(FileProvider(str(data_dir)), path)
+    fetch_ohlcv("AAA", period="1y", provider=recorder)
+    fetch_ohlcv("AAA", period="3mo", provider=recorder)
+    return path
+
+
+class TestArchive:
+    def test_round_trip_preserves_frame(self, tmp_path):
+        df = make_ohlcv(50)
+        df.index.name = "Date"
+        save_response(tmp_path, "005930.KS", "1y", df, 0.25)
+        loaded, elapsed = load_response(tmp_path / "005930.KS__1y.npz")
+        pd.testing.assert_frame_equal(loaded, df, check_freq=False)
+        assert elapsed == 0.25
+
+    def test_no_temp_files_left(self, archive):
+        assert sorted(p.name for p in archive.iterdir()) == ["AAA__1y.npz", "AAA__3mo.npz"]
+
+
+class TestRecordReplay:
+    def test_replay_matches_recording(self, archive, data_dir):
+        original = fetch_ohlcv("AAA", period="1y", provider=FileProvider(str(data_dir)))
+        replayed = fetch_ohlcv("AAA", period="1y", provider=ReplayProvider(archive))
+        pd.testing.assert_frame_equal(replayed, original, check_freq=False)
+
+    def test_unrecorded_period_cut_from_longest(self, archive, data_dir):
+        replay = ReplayProvider(archive)
+        df = replay.download("AAA", period="1mo")
+        expected = FileProvider(str(data_dir)).download("AAA", period="1mo")
+        assert df.index[0] == expected.index[0] and df.index[-1] == expected.index[-1]
+
+    def test_unknown_ticker_raises(self, archive):
+        with pytest.raises(DataFetchError):
+            fetch_ohlcv("ZZZ", provider=ReplayProvider(archive))
+
+    def test_missing_archive_raises(self, tmp_path):
+        with pytest.raises(DataFetchError):
+            ReplayProvider(tmp_path / "nope")
+
+    def test_bulk_fetch_recorded_and_replayed(self, tmp_path, data_dir):
+        path = tmp_path / "bulk"
+        fetch_multiple(["AAA", "BBB"], provider=RecordingProvider(FileProvider(str(data_dir)), path), bulk=True)
+        replayed = fetch_multiple(["AAA", "NOPE", "BBB"], provider=ReplayProvider(path), bulk=True)
+        assert list(replayed) == ["AAA", "BBB"]
+
+    def test_picklable_for_process_pool(self, archive):
+        replay = ReplayProvider(archive)
+        replay.download("AAA", period="1y")
+        restored = pickle.loads(pickle.dumps(replay))
+        assert restored._loaded == {} and len(restored.download("AAA", period="1y")) > 0
+
+
+class TestLatency:
+    def test_fixed_latency(self, archive):
+        replay = ReplayProvider(archive, latency=0.05)
+        started = time.perf_counter()
+        replay.download("AAA", period="1y")
+        assert time.perf_counter() - started >= 0.05
+
+    def test_recorded_latency(self, tmp_path):
+        save_response(tmp_path, "AAA", "1y", make_ohlcv(10), 0.05)
+        replay = ReplayProvider(tmp_path, latency=LATENCY_RECORDED)
+        started = time.perf_counter()
+        replay.download("AAA", period="1y")
+        assert time.perf_counter() - started >= 0.05
+
+    def test_parse_latency(self):
+        assert parse_latency(None) is None and parse_latency("") is None
+        assert parse_latency("recorded") == LATENCY_RECORDED
+        assert parse_latency("0.2") == 0.2
+
+
+class TestEntryPoints:
+    def test_create_app_replay_and_record(self, archive, tmp_path, monkeypatch):
+        import data.fetcher as fetcher
+        from app import create_app
+
+        monkeypatch.setattr(fetcher, "_provider", fetcher._provider)
+        monkeypatch.setattr("api.routes._result_cache", None)
+        client = create_app(replay_dir=str(archive), record_dir=str(tmp_path / "again")).test_client()
+        assert isinstance(fetcher.get_provider(), RecordingProvider)
+        assert isinstance(fetcher.get_provider().inner, ReplayProvider)
+        assert client.get("/api/analyze?ticker=AAA&period=1y").status_code == 200
+        assert (tmp_path / "again" / "AAA__1y.npz").exists()
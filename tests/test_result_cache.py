@@ -0,0 +1,98 @@
+"""api.result_cache / utils.market 단위 테스트"""
+from __future__ import annotations
+
+from datetime import datetime
+
+import api.result_cache as result_cache
+from api.result_cache import CachedResponse, ResultCache, session_ttl
+from config import RESULT_CACHE_TTL_CLOSED, RESULT_CACHE_TTL_OPEN
+from utils.market import is_market_open, seconds_until_open
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+
+class TestResultCache:
+    def test_hit_and_miss_counters(self):
+        cache = ResultCache(max_bytes=100)
+        assert cache.get("a") is None
+        cache.put("a", b"12345", ttl=60)
+        assert cache.get("a") == b"12345"
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["entries"], stats["bytes"]) == (1, 1, 1, 5)
+        assert stats["hit_rate"] == 0.5
+
+    def test_evicts_least_recently_used_by_bytes(self):
+        cache = ResultCache(max_bytes=10)
+        cache.put("a", b"aaaa", ttl=60)
+        cache.put("b", b"bbbb", ttl=60)
+        cache.get("a")                       # a 를 최근 사용으로
+        cache.put("c", b"cccc", ttl=60)      # 12바이트 → b 축출
+        assert cache.get("b") is None
+        assert cache.get("a") == b"aaaa" and cache.get("c") == b"cccc"
+        assert cache.stats()["evictions"] == 1
+        assert cache.stats()["bytes"] == 8
+
+    def test_oversized_body_not_stored(self):
+        cache = ResultCache(max_bytes=4)
+        cache.put("a", b"12345", ttl=60)
+        assert cache.stats()["entries"] == 0
+
+    def test_replace_updates_bytes(self):
+        cache = ResultCache(max_bytes=100)
+        cache.put("a", b"123", ttl=60)
+        cache.put("a", b"12345", ttl=60)
+        assert cache.stats()["bytes"] == 5
+
+    def test_explicit_size_for_non_bytes_values(self):
+        cache = ResultCache(max_bytes=10)
+        first = CachedResponse(body=b"123456", etag="a")
+        cache.put("a", first, ttl=60, size=first.nbytes)
+        cache.put("b", CachedResponse(body=b"12", etag="b", gzipped=b"123"), ttl=60, size=5)
+        assert cache.get("a") is None and cache.get("b").etag == "b"
+        assert cache.stats()["bytes"] == 5
+
+    def test_contains_does_not_touch_counters(self):
+        cache = ResultCache(max_bytes=100)
+        cache.put("a", b"x", ttl=60)
+        assert "a" in cache and "b" not in cache
+        assert cache.stats()["hits"] == cache.stats()["misses"] == 0
+
+    def test_ttl_expiry(self, monkeypatch):
+        clock = _Clock()
+        monkeypatch.setattr(result_cache.time, "monotonic", clock.monotonic)
+        cache = ResultCache(max_bytes=100)
+        cache.put("a", b"x", ttl=30)
+        clock.now += 29
+        assert cache.get("a") == b"x"
+        clock.now += 2
+        assert cache.get("a") is None
+        stats = cache.stats()
+        assert stats["expirations"] == 1 and stats["entries"] == 0 and stats["bytes"] == 0
+
+
+class TestSessionTtl:
+    # 2026-10-16 (금) 14:00 UTC = 뉴욕 10:00, 서울 23:00
+    FRIDAY_NY_OPEN = datetime(2026, 10, 16, 14, 0)
+
+    def test_market_open(self):
+        assert is_market_open("AAPL", self.FRIDAY_NY_OPEN)
+        assert not is_market_open("005930.KS", self.FRIDAY_NY_OPEN)
+
+    def test_weekend_closed(self):
+        assert not is_market_open("AAPL", datetime(2026, 10, 17, 15, 0))
+
+    def test_seconds_until_open_skips_weekend(self):
+        # 서울 금 23:00 → 월 09:00 = 58시간
+        assert seconds_until_open("005930.KS", self.FRIDAY_NY_OPEN) == 58 * 3600
+
+    def test_session_ttl(self):
+        assert session_ttl("AAPL", self.FRIDAY_NY_OPEN) == RESULT_CACHE_TTL_OPEN
+        assert session_ttl("005930.KS", self.FRIDAY_NY_OPEN) == RESULT_CACHE_TTL_CLOSED
+        # 뉴욕 09:00 — 개장 30분 전이면 그때 만료
+        assert session_ttl("AAPL", datetime(2026, 10, 16, 13, 0)) == min(1800, RESULT_CACHE_TTL_CLOSED)
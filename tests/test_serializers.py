@@ -0,0 +1,102 @@
+"""api.serializers 단위 테스트"""
+from __future__ import annotations
+
+import gzip
+import json
+
+import numpy as np
+import pytest
+
+import api.serializers as serializers
+from api.serializers import frame_to_payload, gzip_body, json_response
+from app import create_app
+from data.processor import clean
+from signals.generator import generate_with_indicators
+from tests.conftest import make_ohlcv
+
+
+@pytest.fixture
+def enriched():
+    df, _ = generate_with_indicators(clean(make_ohlcv(200, seed=5)), "TEST")
+    return df
+
+
+class TestFrameToPayload:
+    def test_nan_becomes_none(self, enriched):
+        payload = frame_to_payload(enriched)
+        first = payload["indicators"]["ma"][0]
+        assert first["ma5"] is None and first["ma60"] is None
+        assert payload["indicators"]["ma"][-1]["ma60"] is not None
+
+    def test_values_rounded_and_volume_int(self, enriched):
+        row = frame_to_payload(enriched)["ohlcv"][-1]
+        assert row["date"] == enriched.index[-1].strftime("%Y-%m-%d")
+        assert row["close"] == round(float(enriched["Close"].iloc[-1]), 4)
+        assert isinstance(row["volume"], int)
+
+    def test_rounding_matches_python_round(self):
+        df = make_ohlcv(3, seed=1)
+        df["Close"] = [372.06975, 1.00005, -0.00005]
+        closes = [row["close"] for row in frame_to_payload(df)["ohlcv"]]
+        assert closes == [372.0697, round(1.00005, 4), round(-0.00005, 4)]
+
+    def test_round_half_agrees_with_round_on_random_prices(self):
+        values = np.round(np.random.default_rng(3).uniform(1, 5000, 20000), 5)
+        values = np.append(values, [np.nan, np.inf])
+        got = serializers.round_half(values).tolist()
+        expected = [round(v, 4) for v in values.tolist()]
+        assert got[:-2] == expected[:-2]
+        assert np.isnan(got[-2]) and got[-1] == np.inf
+
+    def test_histogram_is_macd_minus_signal(self, enriched):
+        last = frame_to_payload(enriched)["indicators"]["macd"][-1]
+        assert last["histogram"] == round(last["macd"] - last["signal"], 4)
+
+    def test_columnar_matches_rows(self, enriched):
+        rows = frame_to_payload(enriched)
+        cols = frame_to_payload(enriched, columnar=True)
+        assert cols["dates"] == [r["date"] for r in rows["ohlcv"]]
+        assert cols["ohlcv"]["close"] == [r["close"] for r in rows["ohlcv"]]
+        assert cols["indicators"]["rsi"]["value"] == [r["value"] for r in rows["indicators"]["rsi"]]
+
+    def test_missing_column_is_null(self, enriched):
+        payload = frame_to_payload(enriched.drop(columns=["MA60"]), columnar=True)
+        assert payload["indicators"]["ma"]["ma60"] == [None] * len(enriched)
+
+    def test_nan_volume(self, enriched):
+        enriched = enriched.copy()
+        enriched.iloc[0, enriched.columns.get_loc("Volume")] = np.nan
+        assert frame_to_payload(enriched, columnar=True)["ohlcv"]["volume"][0] is None
+
+
+class TestJsonResponse:
+    @pytest.mark.parametrize("use_orjson", [False, True])
+    def test_encodes_payload(self, monkeypatch, use_orjson):
+        if use_orjson:
+            pytest.importorskip("orjson")
+        monkeypatch.setattr(serializers, "_USE_ORJSON", use_orjson)
+        with create_app().app_context():
+            response = json_response({"a": [1.5, None]}, status=201)
+        assert response.status_code == 201
+        assert response.mimetype == "application/json"
+        assert json.loads(response.get_data()) == {"a": [1.5, None]}
+
+
+class TestGzipBody:
+    def test_small_body_not_compressed(self):
+        assert gzip_body(b"{}") is None
+
+    def test_large_body_round_trips(self):
+        body = b'{"x":' + b"1" * 5000 + b"}"
+        zipped = gzip_body(body)
+        assert gzip.decompress(zipped) == body
+        assert gzip_body(body) == zipped   # mtime=0 → 결정적
+
+
+class TestEncodeBatch:
+    def test_splices_encoded_bodies(self):
+        payload = serializers.encode_batch({"period": "1y", "errors": {"X": "실패"}}, {"A": b'{"a":1}', "B": b"{}"})
+        assert json.loads(payload) == {"results": {"A": {"a": 1}, "B": {}}, "period": "1y", "errors": {"X": "실패"}}
+
+    def test_empty(self):
+        assert json.loads(serializers.encode_batch({}, {})) == {"results": {}}
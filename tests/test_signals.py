@@ -76,3 +76,34 @@ class TestPrintSignals:
         captured = capsys.readouterr()
         assert "BUY" in captured.out
         assert "48,000" in captured.out
+
+
+class TestGenerateVectorized:
+    def test_stops_match_get_stop_and_target(self):
+        from indicators.atr import get_stop_and_target
+        from indicators.engine import compute_indicators
+
+        df = clean(make_ohlcv(600, seed=3))
+        enriched = compute_indicators(df)
+        signals = generate(df, "TEST")
+        assert signals
+        for s in signals:
+            atr = float(enriched.loc[str(s.date), "ATR"])
+            assert (s.stop_loss, s.target) == get_stop_and_target(s.price, atr, s.signal.value)
+
+    def test_reason_lists_votes_in_order(self):
+        df = clean(make_ohlcv(600, seed=3))
+        order = ["MA", "RSI", "MACD", "BB", "스토캐스틱"]
+        for s in generate(df, "TEST"):
+            parts = [p.split(" ")[0] for p in s.reason.split(", ")]
+            assert parts == sorted(parts, key=order.index)
+
+    def test_generate_with_indicators_returns_enriched_frame(self):
+        from indicators.engine import DEFAULT_PARAMS
+        from signals.generator import generate_with_indicators
+
+        df = clean(make_ohlcv(600, seed=3))
+        enriched, signals = generate_with_indicators(df, "TEST")
+        assert len(enriched) == len(df)
+        assert set(DEFAULT_PARAMS.columns()) <= set(enriched.columns)
+        assert signals == generate(df, "TEST")
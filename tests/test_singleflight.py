@@ -0,0 +1,68 @@
+"""utils.singleflight 단위 테스트"""
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from utils.singleflight import SingleFlight
+
+
+def _run_concurrently(flight: SingleFlight, n: int, fn, key="k"):
+    """n 개 스레드가 fn 실행 중에 모두 합류하도록 한 뒤 결과(또는 예외)를 모읍니다."""
+    release = threading.Event()
+
+    def blocking():
+        release.wait(5)
+        return fn()
+
+    def call():
+        try:
+            return flight.do(key, blocking)
+        except Exception as exc:
+            return exc
+
+    with ThreadPoolExecutor(max_workers=n) as pool:
+        futures = [pool.submit(call) for _ in range(n)]
+        while flight.coalesced < n - 1:
+            threading.Event().wait(0.001)
+        release.set()
+        return [f.result() for f in futures]
+
+
+class TestSingleFlight:
+    def test_concurrent_calls_share_one_execution(self):
+        flight = SingleFlight()
+        runs = []
+        results = _run_concurrently(flight, 8, lambda: runs.append(1) or object())
+        assert len(runs) == 1
+        assert all(r is results[0] for r in results)
+        assert (flight.calls, flight.coalesced, flight.in_flight()) == (1, 7, 0)
+
+    def test_error_delivered_to_every_waiter(self):
+        flight = SingleFlight()
+
+        def fail():
+            raise ValueError("boom")
+
+        results = _run_concurrently(flight, 4, fail)
+        assert all(isinstance(r, ValueError) for r in results)
+        assert flight.in_flight() == 0
+
+    def test_sequential_calls_run_again(self):
+        flight = SingleFlight()
+        assert flight.do("k", lambda: 1) == 1
+        assert flight.do("k", lambda: 2) == 2
+        assert flight.calls == 2 and flight.coalesced == 0
+
+    def test_distinct_keys_independent(self):
+        flight = SingleFlight()
+        assert flight.do("a", lambda: "a") == "a"
+        assert flight.do("b", lambda: "b") == "b"
+
+    def test_error_not_sticky(self):
+        flight = SingleFlight()
+        with pytest.raises(KeyError):
+            flight.do("k", lambda: {}["x"])
+        assert flight.do("k", lambda: "ok") == "ok"
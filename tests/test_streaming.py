@@ -0,0 +1,85 @@
+"""indicators/streaming.py 단위 테스트"""
+from __future__ import annotations
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from indicators.engine import IndicatorParams, compute_indicators
+from indicators.streaming import IndicatorState, StreamingStochastic, _RollingExtreme
+from tests.conftest import make_ohlcv
+
+
+def _stream(df: pd.DataFrame, state: IndicatorState) -> pd.DataFrame:
+    rows = [
+        state.update(r.High, r.Low, r.Close, r.Volume)
+        for r in df.itertuples()
+    ]
+    return pd.DataFrame(rows, index=df.index)
+
+
+class TestIndicatorState:
+    @pytest.mark.parametrize("n", [30, 500])
+    def test_matches_batch(self, n):
+        df = make_ohlcv(n)
+        batch = compute_indicators(df)
+        streamed = _stream(df, IndicatorState())
+        for col in streamed.columns:
+            np.testing.assert_allclose(
+                streamed[col].to_numpy(), batch[col].to_numpy(),
+                rtol=1e-7, atol=1e-7, equal_nan=True, err_msg=col,
+            )
+
+    def test_matches_batch_with_flat_prices(self, golden_cross_df):
+        batch = compute_indicators(golden_cross_df)
+        streamed = _stream(golden_cross_df, IndicatorState())
+        for col in streamed.columns:
+            np.testing.assert_allclose(
+                streamed[col].to_numpy(), batch[col].to_numpy(),
+                rtol=1e-7, atol=1e-7, equal_nan=True, err_msg=col,
+            )
+
+    def test_custom_params(self, sample_df):
+        params = IndicatorParams(ma_windows=(3, 10), rsi_period=7)
+        streamed = _stream(sample_df, IndicatorState(params))
+        batch = compute_indicators(sample_df, params)
+        assert "MA10" in streamed.columns
+        np.testing.assert_allclose(
+            streamed["RSI"].to_numpy(), batch["RSI"].to_numpy(), rtol=1e-7, equal_nan=True,
+        )
+
+    def test_json_round_trip_resumes(self):
+        df = make_ohlcv(200)
+        full = _stream(df, IndicatorState())
+
+        state = IndicatorState.from_history(df.iloc[:120])
+        restored = IndicatorState.from_dict(json.loads(json.dumps(state.to_dict())))
+        assert restored.bars == 120
+        assert restored.last_date == df.index[119].strftime("%Y-%m-%d")
+        resumed = _stream(df.iloc[120:], restored)
+        for col in resumed.columns:
+            np.testing.assert_allclose(
+                resumed[col].to_numpy(), full[col].iloc[120:].to_numpy(),
+                rtol=1e-9, equal_nan=True, err_msg=col,
+            )
+
+
+class TestRollingExtreme:
+    def test_window_min_max(self):
+        values = [5.0, 3.0, 4.0, 1.0, 2.0, 6.0, 0.5]
+        lo, hi = _RollingExtreme(3, "min"), _RollingExtreme(3, "max")
+        mins = [lo.push(v) for v in values]
+        maxs = [hi.push(v) for v in values]
+        expected = pd.Series(values)
+        np.testing.assert_array_equal(mins[2:], expected.rolling(3).min().to_numpy()[2:])
+        np.testing.assert_array_equal(maxs[2:], expected.rolling(3).max().to_numpy()[2:])
+        assert np.isnan(mins[0])
+
+    def test_stochastic_state_serializable(self):
+        stoch = StreamingStochastic()
+        for v in range(20):
+            stoch.update(v + 1.0, v - 1.0, float(v))
+        restored = StreamingStochastic.from_dict(json.loads(json.dumps(stoch.to_dict())))
+        assert restored.update(21.0, 19.0, 20.0) == stoch.update(21.0, 19.0, 20.0)
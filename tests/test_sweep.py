@@ -0,0 +1,89 @@
+"""backtest/sweep.py 단위 테스트"""
+from __future__ import annotations
+
+import pytest
+
+from backtest.engine import simulate
+from backtest.sweep import build_grid, iter_sweep, parse_grid_arg, rank
+from data.processor import clean
+from indicators.engine import IndicatorParams
+from signals.generator import generate
+from tests.conftest import make_ohlcv
+
+
+class TestGrid:
+    def test_build_grid_product(self):
+        grid = build_grid({"rsi_period": [7, 14], "stop_mult": [1.0, 1.5, 2.0]})
+        assert len(grid) == 6
+        assert {"rsi_period": 7, "stop_mult": 2.0} in grid
+
+    def test_unknown_key_rejected(self):
+        with pytest.raises(ValueError):
+            build_grid({"nope": [1]})
+
+    def test_parse_grid_arg_types(self):
+        assert parse_grid_arg("rsi_period=7,14") == ("rsi_period", [7, 14])
+        assert parse_grid_arg("bb_std=1.5,2") == ("bb_std", [1.5, 2.0])
+        assert parse_grid_arg("ma_windows=5/20/60,10/30/60") == ("ma_windows", [(5, 20, 60), (10, 30, 60)])
+
+
+class TestIterSweep:
+    @pytest.fixture
+    def df(self):
+        return clean(make_ohlcv(400, seed=3))
+
+    def test_matches_single_backtest(self, df):
+        grid = build_grid({"rsi_period": [7, 14], "target_mult": [2.0, 3.0]})
+        results = list(iter_sweep(df, "TEST", grid, workers=1))
+        assert len(results) == 4
+        for r in results:
+            signals = generate(df, "TEST", IndicatorParams(rsi_period=r.params["rsi_period"]),
+                               target_mult=r.params["target_mult"])
+            expected = simulate(df, signals, "TEST")
+            assert r.total_return == expected.total_return
+            assert r.trade_count == expected.trade_count
+
+    def test_process_pool_matches_inline(self, df):
+        grid = build_grid({"rsi_period": [7, 14, 21], "stop_mult": [1.0, 2.0]})
+        inline = rank(list(iter_sweep(df, "TEST", grid, workers=1)))
+        pooled = rank(list(iter_sweep(df, "TEST", grid, workers=2)))
+        key = lambda r: (r.total_return, sorted(r.params.items()))
+        assert sorted(map(key, inline)) == sorted(map(key, pooled))
+
+    def test_rank_orders_by_return(self, df):
+        grid = build_grid({"stop_mult": [0.5, 1.5, 3.0]})
+        ranked = rank(list(iter_sweep(df, "TEST", grid, workers=1)))
+        returns = [r.total_return for r in ranked]
+        assert returns == sorted(returns, reverse=True)
+
+
+class TestSharedBlock:
+    def test_round_trip_preserves_frame(self):
+        import numpy as np
+        from backtest.sweep import _frame_from_block, _to_shared
+
+        df = clean(make_ohlcv(50))
+        shm, shape = _to_shared(df)
+        try:
+            restored = _frame_from_block(np.ndarray(shape, dtype=np.float64, buffer=shm.buf))
+            assert list(restored.index) == list(df.index)
+            assert (restored["Close"].to_numpy() == df["Close"].to_numpy()).all()
+        finally:
+            shm.close()
+            shm.unlink()
+
+    def test_attach_does_not_register_with_tracker(self, monkeypatch):
+        from multiprocessing import resource_tracker, shared_memory
+
+        from backtest.sweep import _attach
+
+        shm = shared_memory.SharedMemory(create=True, size=64)
+        registered = []
+        monkeypatch.setattr(resource_tracker, "register", lambda name, rtype: registered.append(name))
+        try:
+            attached = _attach(shm.name)
+            attached.close()
+            assert registered == []
+        finally:
+            shm.close()
+            shm.unlink()
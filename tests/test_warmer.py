@@ -0,0 +1,138 @@
+"""api.warmer 캐시 예열 스케줄러 단위 테스트"""
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+import api.routes as routes
+import api.warmer as warmer
+from api.result_cache import ResultCache
+from api.warmer import CacheWarmer
+from app import create_app
+from data.providers import FileProvider
+from indicators.engine import DEFAULT_PARAMS
+from tests.conftest import make_ohlcv
+
+
+@pytest.fixture
+def data(tmp_path, monkeypatch):
+    for i, t in enumerate(["AAA", "BBB"]):
+        make_ohlcv(300, seed=i).rename_axis("Date").to_csv(tmp_path / f"{t}.csv")
+    monkeypatch.setattr("data.fetcher._provider", FileProvider(str(tmp_path)))
+    cache = ResultCache()
+    monkeypatch.setattr(routes, "_result_cache", cache)
+    return cache
+
+
+class TestRunOnce:
+    def test_warms_frames_and_bodies(self, data):
+        record = CacheWarmer(lambda: ["AAA", "bbb", "NOPE"], jitter=0).run_once()
+        assert record["tickers"] == 3
+        assert set(record["timings"]) == {"AAA", "BBB", "NOPE"}
+        assert list(record["errors"]) == ["NOPE"]
+        for t in ["AAA", "BBB"]:
+            assert ("frame", t, "1y", DEFAULT_PARAMS) in data
+            assert (t, "1y", "rows", DEFAULT_PARAMS) in data
+
+    def test_request_after_warm_is_cache_hit(self, data, monkeypatch):
+        CacheWarmer(lambda: ["AAA"], jitter=0).run_once()
+        monkeypatch.setattr(routes, "_analyze_response", lambda *a: pytest.fail("재계산 발생"))
+        client = create_app(warm=False).test_client()
+        assert client.get("/api/analyze?ticker=AAA").status_code == 200
+
+    def test_refresh_replaces_cached_entry(self, data):
+        CacheWarmer(lambda: ["AAA"], jitter=0).run_once()
+        before = data.get(("frame", "AAA", "1y", DEFAULT_PARAMS))
+        CacheWarmer(lambda: ["AAA"], jitter=0).run_once()
+        assert data.get(("frame", "AAA", "1y", DEFAULT_PARAMS)) is not before
+
+    def test_forced_refresh_does_not_join_inflight(self, data):
+        class Value:
+            nbytes = 1
+
+            def __init__(self, label: str) -> None:
+                self.label = label
+
+        started, release = threading.Event(), threading.Event()
+
+        def slow_build() -> Value:
+            started.set()
+            release.wait(5)
+            return Value("old")
+
+        key = ("frame", "AAA", "1y", DEFAULT_PARAMS)
+        worker = threading.Thread(target=routes._memoize, args=(key, "AAA", slow_build))
+        worker.start()
+        try:
+            assert started.wait(5)
+            # 진행 중인 일반 계산에 합류하지 않고 새로 계산합니다.
+            fresh = routes._memoize(key, "AAA", lambda: Value("new"), force=True)
+            assert fresh.label == "new"
+        finally:
+            release.set()
+            worker.join()
+
+    def test_bounded_concurrency(self, data, monkeypatch):
+        active, peak = [0], [0]
+        lock = threading.Lock()
+
+        def fake_refresh(ticker, period, formats):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            threading.Event().wait(0.01)
+            with lock:
+                active[0] -= 1
+
+        monkeypatch.setattr(warmer, "refresh_ticker", fake_refresh)
+        CacheWarmer(lambda: [f"T{i}" for i in range(12)], workers=3, jitter=0).run_once()
+        assert peak[0] <= 3
+
+    def test_jitter_delays_start(self, data, monkeypatch):
+        delays = []
+        monkeypatch.setattr(warmer.random, "uniform", lambda a, b: delays.append((a, b)) or 0.0)
+        monkeypatch.setattr(warmer, "refresh_ticker", lambda *a: None)
+        CacheWarmer(lambda: ["A", "B"], jitter=2.0).run_once()
+        assert delays == [(0, 2.0), (0, 2.0)]
+
+
+class TestScheduler:
+    def test_start_stop_and_status(self, data, monkeypatch):
+        monkeypatch.setattr(warmer, "refresh_ticker", lambda *a: None)
+        w = CacheWarmer(lambda: ["AAA"], interval=3600, jitter=0)
+        w.start()
+        try:
+            while w.runs == 0:
+                threading.Event().wait(0.005)
+            status = w.status()
+            assert status["running"] and status["runs"] == 1
+            assert status["last_run"]["tickers"] == 1
+        finally:
+            w.stop(timeout=2)
+        assert not w.status()["running"]
+
+    def test_status_route(self, data, monkeypatch):
+        monkeypatch.setattr(warmer, "refresh_ticker", lambda *a: None)
+        monkeypatch.setattr(CacheWarmer, "start", lambda self: None)
+        app = create_app(warm=True)
+        w = app.extensions["cache_warmer"]
+        w.load_tickers, w.jitter = (lambda: ["AAA"]), 0
+        w.run_once()
+        body = app.test_client().get("/api/warm/status").get_json()
+        assert body["enabled"] and body["runs"] == 1
+        assert "duration" in body["last_run"]
+
+    def test_disabled_by_default(self, data):
+        body = create_app().test_client().get("/api/warm/status").get_json()
+        assert body == {"enabled": False}
+
+    def test_env_flag(self, monkeypatch):
+        from app import env_flag
+
+        monkeypatch.delenv("STOCK_CACHE_WARM", raising=False)
+        assert env_flag("STOCK_CACHE_WARM") is None   # config.WARM_ENABLED 를 따름
+        monkeypatch.setenv("STOCK_CACHE_WARM", "0")
+        assert env_flag("STOCK_CACHE_WARM") is False
+        monkeypatch.setenv("STOCK_CACHE_WARM", "1")
+        assert env_flag("STOCK_CACHE_WARM") is True
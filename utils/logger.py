@@ -1,9 +1,134 @@
+"""
+프로젝트 공용 로거 — 모든 모듈 로거가 로그 파일 하나당 비동기 핸들러 하나를 공유합니다.
+
+로그 호출은 메시지(msg % args)만 만들어 레코드를 큐에 넣고, 줄 포맷팅(시각·레벨, JSON)과
+파일 쓰기는 백그라운드 스레드(QueueListener) 하나가 처리합니다. 파일은 경로마다 한 번만
+열리고 한 스레드만 쓰므로 동시 작업의 로그 줄이 섞이지 않습니다. 콘솔 출력은 CLI 의 print 출력과 순서가
+뒤바뀌지 않도록 호출 스레드에서 바로 씁니다.
+
+LOG_JSON = True 이면 파일에 JSON-lines 형식(한 줄에 레코드 하나)으로 기록합니다.
+"""
+from __future__ import annotations
+
+import atexit
+import copy
+import json
 import logging
+import os
+import queue
 import sys
+import threading
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from typing import Optional
+
+from config import LOG_FILE, LOG_JSON, LOG_LEVEL
+
+_TEXT_FORMAT = logging.Formatter(
+    "%(asctime)s [%(levelname)s] %(name)s: %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
+
+
+class JsonFormatter(logging.Formatter):
+    """레코드 하나를 JSON 객체 한 줄로 만듭니다."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "process": record.process,
+            "thread": record.threadName,
+        }
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class AsyncHandler(QueueHandler):
+    """
+    레코드를 큐에 넣고 백그라운드 스레드에서 target 핸들러로 씁니다.
+
+    메시지는 호출 스레드에서 msg % args 로 합쳐 넣으므로, 인자로 넘긴 dict·DataFrame 을
+    호출 뒤에 바꿔도 기록되는 값은 호출 시점 그대로이고 __str__ 예외도 호출 측에서
+    처리됩니다. 꺼진 레벨의 호출은 합치기 전에 걸러지므로 호출 측은 f-string 대신
+    logger.debug("%s ...", value) 처럼 인자를 넘깁니다.
+    fork 로 만든 자식 프로세스에는 리스너 스레드가 없으므로 target 에 직접 씁니다.
+    """
+
+    def __init__(self, target: logging.Handler) -> None:
+        super().__init__(queue.SimpleQueue())
+        self.target = target
+        self._pid = os.getpid()
+        self._listener: Optional[QueueListener] = QueueListener(self.queue, target, respect_handler_level=True)
+        self._listener.start()
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 다른 핸들러(콘솔)도 같은 레코드를 쓰므로 복사본의 메시지만 확정합니다.
+        # 예외 정보는 그대로 두어 리스너 스레드의 포매터(텍스트/JSON)가 씁니다.
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
 
+    def emit(self, record: logging.LogRecord) -> None:
+        if os.getpid() != self._pid or self._listener is None:
+            self.target.handle(record)
+        else:
+            super().emit(record)
 
-def get_logger(name: str, log_file: str = "signals.log", level: str = "INFO") -> logging.Logger:
+    def close(self) -> None:
+        """남은 레코드를 모두 쓰고 리스너를 멈춥니다."""
+        listener, self._listener = self._listener, None
+        if listener is not None and os.getpid() == self._pid:
+            listener.stop()
+        self.target.close()
+        super().close()
+
+
+_lock = threading.Lock()
+_console: Optional[logging.Handler] = None
+_file_handlers: dict[tuple[str, bool], AsyncHandler] = {}
+
+
+def _shared_handlers(log_file: str, json_lines: bool) -> tuple[logging.Handler, AsyncHandler]:
+    """콘솔 핸들러와 (파일 경로, 형식)별 비동기 파일 핸들러를 한 번만 만듭니다."""
+    global _console
+    with _lock:
+        if _console is None:
+            _console = logging.StreamHandler(sys.stdout)
+            _console.setFormatter(_TEXT_FORMAT)
+        log_path = Path(log_file).resolve()
+        key = (str(log_path), json_lines)
+        handler = _file_handlers.get(key)
+        if handler is None:
+            log_path.parent.mkdir(parents=True, exist_ok=True)
+            target = logging.FileHandler(log_path, encoding="utf-8")
+            target.setFormatter(JsonFormatter() if json_lines else _TEXT_FORMAT)
+            handler = _file_handlers[key] = AsyncHandler(target)
+        return _console, handler
+
+
+def shutdown_logging() -> None:
+    """모든 비동기 핸들러의 남은 로그를 기록하고 멈춥니다 (종료 시 자동 호출)."""
+    with _lock:
+        handlers = list(_file_handlers.values())
+    for handler in handlers:
+        handler.close()
+
+
+atexit.register(shutdown_logging)
+
+
+def get_logger(
+    name: str,
+    log_file: str = LOG_FILE,
+    level: str = LOG_LEVEL,
+    json_lines: bool = LOG_JSON,
+) -> logging.Logger:
     """프로젝트 전역 로거를 반환합니다."""
     logger = logging.getLogger(name)
 
@@ -11,22 +136,8 @@ def get_logger(name: str, log_file: str = "signals.log", level: str = "INFO") ->
         return logger
 
     logger.setLevel(getattr(logging, level.upper(), logging.INFO))
-
-    fmt = logging.Formatter(
-        "%(asctime)s [%(levelname)s] %(name)s: %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
-
-    # 콘솔 핸들러
-    console = logging.StreamHandler(sys.stdout)
-    console.setFormatter(fmt)
+    console, file_handler = _shared_handlers(log_file, json_lines)
     logger.addHandler(console)
-
-    # 파일 핸들러
-    log_path = Path(log_file)
-    log_path.parent.mkdir(parents=True, exist_ok=True)
-    file_handler = logging.FileHandler(log_path, encoding="utf-8")
-    file_handler.setFormatter(fmt)
     logger.addHandler(file_handler)
 
     return logger
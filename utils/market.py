@@ -0,0 +1,66 @@
+"""거래소 정규장 시간 판별 (공휴일은 고려하지 않음)."""
+from __future__ import annotations
+
+from datetime import datetime, time, timedelta
+from typing import Optional
+
+import pandas as pd
+
+# 종목 코드 접미사 → (시간대, 개장, 마감). 접미사가 없으면 미국 시장.
+_SESSIONS: dict[str, tuple[str, time, time]] = {
+    ".KS": ("Asia/Seoul", time(9, 0), time(15, 30)),
+    ".KQ": ("Asia/Seoul", time(9, 0), time(15, 30)),
+    ".T": ("Asia/Tokyo", time(9, 0), time(15, 0)),
+}
+_US_SESSION = ("America/New_York", time(9, 30), time(16, 0))
+
+
+def _session(ticker: str) -> tuple[str, time, time]:
+    for suffix, session in _SESSIONS.items():
+        if ticker.upper().endswith(suffix):
+            return session
+    return _US_SESSION
+
+
+def _local_now(tz: str, now: Optional[datetime]) -> pd.Timestamp:
+    ts = pd.Timestamp.now(tz="UTC") if now is None else pd.Timestamp(now)
+    if ts.tzinfo is None:
+        ts = ts.tz_localize("UTC")
+    return ts.tz_convert(tz)
+
+
+def is_market_open(ticker: str, now: Optional[datetime] = None) -> bool:
+    """종목이 상장된 거래소가 지금 정규장 중인지 반환합니다 (now 는 UTC 기준)."""
+    tz, open_at, close_at = _session(ticker)
+    local = _local_now(tz, now)
+    return local.weekday() < 5 and open_at <= local.time() < close_at
+
+
+def seconds_until_open(ticker: str, now: Optional[datetime] = None) -> float:
+    """다음 정규장 개장까지 남은 초. 장중이면 0."""
+    if is_market_open(ticker, now):
+        return 0.0
+    tz, open_at, _ = _session(ticker)
+    local = _local_now(tz, now)
+    for offset in range(8):
+        day = (local + timedelta(days=offset)).normalize()
+        if day.weekday() >= 5:
+            continue
+        opening = day.replace(hour=open_at.hour, minute=open_at.minute)
+        if opening > local:
+            return (opening - local).total_seconds()
+    return 0.0
+
+
+def last_close(ticker: str, now: Optional[datetime] = None) -> pd.Timestamp:
+    """직전 정규장 마감 시각 (UTC). 장중이면 전 거래일 마감."""
+    tz, _, close_at = _session(ticker)
+    local = _local_now(tz, now)
+    for offset in range(8):
+        day = (local - timedelta(days=offset)).normalize()
+        if day.weekday() >= 5:
+            continue
+        closing = day.replace(hour=close_at.hour, minute=close_at.minute)
+        if closing <= local:
+            return closing.tz_convert("UTC")
+    return local.tz_convert("UTC")
@@ -0,0 +1,211 @@
+"""
+파이프라인 단계별 소요 시간 계측 — 단계·종목별 히스토그램과 Prometheus 텍스트 출력.
+
+span("fetch", ticker) 로 감싼 구간의 소요 시간을 고정 버킷 히스토그램에 누적합니다.
+기록은 perf_counter 두 번과 잠금 한 번이 전부이고, 텍스트 변환·요약은 조회할 때만
+수행하므로 아무도 수집하지 않으면 비용이 거의 없습니다.
+
+종목을 인자로 받지 않는 단계(clean, indicators 등)는 current_ticker(ticker) 로
+설정한 현재 종목을 사용합니다. 프로세스 풀 워커의 기록은 drain() → merge() 로
+부모 프로세스에 합칩니다.
+"""
+from __future__ import annotations
+
+import bisect
+import contextvars
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Callable, ContextManager, Iterator, Optional
+
+from config import METRICS_ENABLED, METRICS_MAX_TICKERS
+
+BUCKETS: tuple[float, ...] = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+_OTHER = "_other"
+
+_current_ticker: contextvars.ContextVar[str] = contextvars.ContextVar("metrics_ticker", default="")
+# 프로파일링 중 단계별 메모리 측정 등, span 마다 함께 실행할 컨텍스트 (없으면 None)
+_stage_observer: Optional[Callable[[str], ContextManager[None]]] = None
+
+
+class Histogram:
+    """누적 버킷 히스토그램 (마지막 칸은 +Inf)."""
+
+    __slots__ = ("counts", "sum", "count", "max", "errors")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.sum = 0.0
+        self.count = 0
+        self.max = 0.0
+        self.errors = 0
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect.bisect_left(BUCKETS, seconds)] += 1
+        self.sum += seconds
+        self.count += 1
+        if seconds > self.max:
+            self.max = seconds
+
+    def merge(self, other: Histogram) -> None:
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.sum += other.sum
+        self.count += other.count
+        self.max = max(self.max, other.max)
+        self.errors += other.errors
+
+    def quantile(self, q: float) -> float:
+        """버킷 경계 사이를 선형 보간한 분위수 추정값."""
+        if self.count == 0:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if n and seen + n >= rank:
+                lower = BUCKETS[i - 1] if i > 0 else 0.0
+                upper = BUCKETS[i] if i < len(BUCKETS) else self.max
+                return min(lower + (upper - lower) * (rank - seen) / n, self.max)
+            seen += n
+        return self.max
+
+
+class MetricsRegistry:
+    """(단계, 종목) → Histogram. 종목 라벨 수는 max_tickers 로 제한합니다."""
+
+    def __init__(self, max_tickers: int = METRICS_MAX_TICKERS) -> None:
+        self.max_tickers = max_tickers
+        self._hists: dict[tuple[str, str], Histogram] = {}
+        self._tickers: set[str] = set()
+        self._lock = threading.Lock()
+
+    def _hist(self, stage: str, ticker: str) -> Histogram:
+        if ticker and ticker not in self._tickers:
+            if len(self._tickers) >= self.max_tickers:
+                ticker = _OTHER
+            else:
+                self._tickers.add(ticker)
+        key = (stage, ticker)
+        hist = self._hists.get(key)
+        if hist is None:
+            hist = self._hists[key] = Histogram()
+        return hist
+
+    def observe(self, stage: str, seconds: float, ticker: Optional[str] = None, error: bool = False) -> None:
+        ticker = _current_ticker.get() if ticker is None else ticker
+        with self._lock:
+            hist = self._hist(stage, ticker)
+            hist.observe(seconds)
+            if error:
+                hist.errors += 1
+
+    @contextmanager
+    def span(self, stage: str, ticker: Optional[str] = None) -> Iterator[None]:
+        """구간 소요 시간을 기록합니다. 예외가 나도 기록하고 errors 를 올린 뒤 다시 던집니다."""
+        with _stage_observer(stage) if _stage_observer is not None else nullcontext():
+            if not METRICS_ENABLED:
+                yield
+                return
+            started = time.perf_counter()
+            try:
+                yield
+            except BaseException:
+                self.observe(stage, time.perf_counter() - started, ticker, error=True)
+                raise
+            self.observe(stage, time.perf_counter() - started, ticker)
+
+    # ─── 집계 / 출력 ───────────────────────────────────────────────────────
+
+    def by_stage(self) -> dict[str, Histogram]:
+        """종목을 합친 단계별 히스토그램 (처음 기록된 순서)."""
+        merged: dict[str, Histogram] = {}
+        with self._lock:
+            for (stage, _), hist in self._hists.items():
+                merged.setdefault(stage, Histogram()).merge(hist)
+        return merged
+
+    def render_prometheus(self, prefix: str = "stock") -> str:
+        """Prometheus 텍스트 노출 형식 (단계·종목 라벨)."""
+        name = f"{prefix}_stage_duration_seconds"
+        lines = [
+            f"# HELP {name} Pipeline stage latency in seconds.",
+            f"# TYPE {name} histogram",
+        ]
+        errors = [
+            f"# HELP {prefix}_stage_errors_total Pipeline stage failures.",
+            f"# TYPE {prefix}_stage_errors_total counter",
+        ]
+        with self._lock:
+            items = sorted(self._hists.items())
+            snapshot = [(k, list(h.counts), h.sum, h.count, h.errors) for k, h in items]
+        for (stage, ticker), counts, total, count, failed in snapshot:
+            labels = f'stage="{stage}",ticker="{_escape(ticker)}"'
+            cumulative = 0
+            for bound, n in zip(BUCKETS, counts):
+                cumulative += n
+                lines.append(f'{name}_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f'{name}_bucket{{{labels},le="+Inf"}} {count}')
+            lines.append(f"{name}_sum{{{labels}}} {total:.6f}")
+            lines.append(f"{name}_count{{{labels}}} {count}")
+            errors.append(f"{prefix}_stage_errors_total{{{labels}}} {failed}")
+        return "\n".join(lines + errors) + "\n"
+
+    def format_summary(self) -> str:
+        """CLI 종료 시 출력할 단계별 요약표."""
+        stages = self.by_stage()
+        if not stages:
+            return "  (기록된 구간 없음)"
+        lines = [f"  {'단계':<12} {'횟수':>6} {'합계(s)':>9} {'평균(ms)':>9} {'p50(ms)':>9} {'p95(ms)':>9} {'최대(ms)':>9}"]
+        for stage, h in stages.items():
+            lines.append(
+                f"  {stage:<12} {h.count:>6} {h.sum:>9.3f} {h.sum / h.count * 1000:>9.1f} "
+                f"{h.quantile(0.5) * 1000:>9.1f} {h.quantile(0.95) * 1000:>9.1f} {h.max * 1000:>9.1f}"
+            )
+        return "\n".join(lines)
+
+    # ─── 프로세스 간 병합 ──────────────────────────────────────────────────
+
+    def drain(self) -> dict[tuple[str, str], Histogram]:
+        """기록을 꺼내고 비웁니다 (워커 → 부모 전달용, pickle 가능)."""
+        with self._lock:
+            hists, self._hists = self._hists, {}
+            self._tickers = set()
+        return hists
+
+    def merge(self, hists: dict[tuple[str, str], Histogram]) -> None:
+        with self._lock:
+            for (stage, ticker), hist in hists.items():
+                self._hist(stage, ticker).merge(hist)
+
+    def reset(self) -> None:
+        self.drain()
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+@contextmanager
+def current_ticker(ticker: str) -> Iterator[None]:
+    """이 블록 안의 span 이 종목 인자를 생략하면 ticker 로 기록합니다."""
+    token = _current_ticker.set(ticker)
+    try:
+        yield
+    finally:
+        _current_ticker.reset(token)
+
+
+def set_stage_observer(observer: Optional[Callable[[str], ContextManager[None]]]) -> None:
+    """모든 span 을 observer(stage) 컨텍스트로 감쌉니다. None 이면 해제."""
+    global _stage_observer
+    _stage_observer = observer
+
+
+REGISTRY = MetricsRegistry()
+span = REGISTRY.span
+
+
+def reset_worker() -> None:
+    """프로세스 풀 initializer — fork 로 물려받은 부모 기록을 비웁니다."""
+    REGISTRY.reset()
@@ -0,0 +1,249 @@
+"""
+실행 한 번(CLI) 또는 요청 한 번(API)의 CPU 프로파일과 단계별 메모리 스냅샷.
+
+profile_session() 블록 동안 cProfile(호출 스레드)과 tracemalloc 을 켜고, 끝나면
+  - {이름}.prof : 표준 pstats 파일 (snakeviz, `python -m pstats` 등으로 열기)
+  - {이름}.txt  : 프로젝트 함수(data/, indicators/, signals/, backtest/) 상위 목록,
+                  가장 오래 걸린 개별 함수(pandas 등 포함), metrics span 단계별 메모리
+                  최대 증가량, 프로젝트 코드 줄 기준 할당 상위 목록
+을 PROFILE_DIR 에 씁니다. 프로파일링 비용이 크므로 세션은 프로세스당 한 번에 하나만 엽니다.
+"""
+from __future__ import annotations
+
+import cProfile
+import io
+import pstats
+import re
+import threading
+import time
+import tracemalloc
+from collections import defaultdict
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator, Optional
+
+from config import PROFILE_DIR, PROFILE_TOP, PROFILE_TRACE_FRAMES
+from utils import metrics
+
+_ROOT = Path(__file__).resolve().parents[1]
+PROJECT_PACKAGES: tuple[str, ...] = ("data", "indicators", "signals", "backtest")
+_PROJECT_PREFIXES = tuple((_ROOT / pkg).as_posix() + "/" for pkg in PROJECT_PACKAGES)
+
+_session_lock = threading.Lock()
+_active_thread: Optional[int] = None   # 세션을 연 스레드
+
+
+class ProfilerBusy(RuntimeError):
+    """다른 프로파일링 세션이 이미 진행 중"""
+
+
+def is_active() -> bool:
+    """현재 스레드에서 프로파일링 세션이 진행 중인지."""
+    return _active_thread is not None and _active_thread == threading.get_ident()
+
+
+def _is_project(filename: str) -> bool:
+    return filename.replace("\\", "/").startswith(_PROJECT_PREFIXES)
+
+
+def _short(filename: str) -> str:
+    try:
+        return str(Path(filename).resolve().relative_to(_ROOT))
+    except ValueError:
+        parts = Path(filename).parts
+        return "/".join(parts[-2:])
+
+
+@dataclass
+class StageMemory:
+    calls: int = 0
+    peak: int = 0   # 단계 시작 대비 추적 메모리 최대 증가량 (바이트, 호출 중 최댓값)
+    net: int = 0    # 단계가 끝난 뒤 남은 증가량 합계 (바이트)
+
+
+@dataclass
+class ProfileSession:
+    label: str
+    report: Optional[ProfileReport] = None   # 블록이 끝난 뒤 채워짐
+
+
+@dataclass
+class ProfileReport:
+    name: str
+    wall: float
+    prof_path: Path
+    summary_path: Path
+    summary: str
+    stages: dict[str, StageMemory] = field(default_factory=dict)
+
+
+class _StageTracker:
+    """metrics span 마다 tracemalloc 증가량을 단계별로 모읍니다 (세션 스레드만)."""
+
+    def __init__(self, thread_id: int) -> None:
+        self.thread_id = thread_id
+        self.stages: dict[str, StageMemory] = defaultdict(StageMemory)
+        self.peak = 0   # reset_peak 으로 지워지기 전의 전체 최댓값
+        self._open: list[int] = []   # 열린 단계마다 안쪽 단계에서 본 최댓값
+
+    @contextmanager
+    def __call__(self, stage: str) -> Iterator[None]:
+        if threading.get_ident() != self.thread_id or not tracemalloc.is_tracing():
+            yield
+            return
+        start, _ = tracemalloc.get_traced_memory()
+        if hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+        self._open.append(0)
+        try:
+            yield
+        finally:
+            current, peak = tracemalloc.get_traced_memory()
+            # 안쪽 단계가 reset_peak 으로 지운 최댓값을 바깥 단계에도 반영합니다.
+            peak = max(peak, self._open.pop())
+            if self._open:
+                self._open[-1] = max(self._open[-1], peak)
+            self.peak = max(self.peak, peak)
+            entry = self.stages[stage]
+            entry.calls += 1
+            entry.peak = max(entry.peak, peak - start)
+            entry.net += current - start
+
+
+# ─── 요약 ──────────────────────────────────────────────────────────────────
+
+def _fmt_bytes(n: float) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if abs(n) < 1024 or unit == "GB":
+            return f"{n:,.0f}{unit}" if unit == "B" else f"{n:,.1f}{unit}"
+        n /= 1024
+    return f"{n:,.1f}GB"
+
+
+def _function_rows(stats: pstats.Stats, project_only: bool, key: int, top: int) -> list[str]:
+    # stats.stats: {(파일, 줄, 함수): (원시 호출 수, 전체 호출 수, 자체 시간, 누적 시간, 호출자)}
+    entries = [
+        (func, values) for func, values in stats.stats.items()
+        if not project_only or _is_project(func[0])
+    ]
+    entries.sort(key=lambda item: item[1][key], reverse=True)
+    rows = []
+    for (filename, line, name), (_, calls, tottime, cumtime, _) in entries[:top]:
+        location = f" ({_short(filename)}:{line})" if line else ""
+        rows.append(f"  {calls:>8} {tottime:>9.3f} {cumtime:>9.3f}  {name}{location}")
+    return rows
+
+
+def _allocation_rows(snapshot: tracemalloc.Snapshot, top: int) -> list[str]:
+    """할당을 그 할당을 일으킨 가장 안쪽 프로젝트 코드 줄로 묶어 크기순으로."""
+    grouped: dict[tuple[str, int], list[int]] = defaultdict(lambda: [0, 0])
+    for stat in snapshot.statistics("traceback"):
+        frame = next((f for f in reversed(stat.traceback) if _is_project(f.filename)), None)
+        if frame is None:
+            continue
+        entry = grouped[(frame.filename, frame.lineno)]
+        entry[0] += stat.size
+        entry[1] += stat.count
+    ranked = sorted(grouped.items(), key=lambda item: item[1][0], reverse=True)[:top]
+    return [f"  {_fmt_bytes(size):>10} {count:>8}  {_short(fn)}:{line}" for (fn, line), (size, count) in ranked]
+
+
+def summarize(
+    name: str,
+    wall: float,
+    stats: pstats.Stats,
+    snapshot: Optional[tracemalloc.Snapshot],
+    peak: int,
+    stages: dict[str, StageMemory],
+    top: int = PROFILE_TOP,
+) -> str:
+    header = f"  {'호출':>8} {'자체(s)':>9} {'누적(s)':>9}  함수"
+    lines = [
+        f"프로파일: {name}  (경과 {wall:.3f}s, 추적 메모리 최대 {_fmt_bytes(peak)})",
+        "",
+        f"[CPU — 프로젝트 함수 상위 {top} (누적 시간)]",
+        header,
+        *_function_rows(stats, project_only=True, key=3, top=top),
+        "",
+        f"[CPU — 자체 시간 상위 {top} (pandas·numpy 포함)]",
+        header,
+        *_function_rows(stats, project_only=False, key=2, top=top),
+    ]
+    if stages:
+        lines += ["", "[메모리 — 단계별 (시작 대비 증가량)]", f"  {'단계':<12} {'호출':>6} {'최대':>10} {'잔여':>10}"]
+        lines += [
+            f"  {stage:<12} {m.calls:>6} {_fmt_bytes(m.peak):>10} {_fmt_bytes(m.net):>10}"
+            for stage, m in stages.items()
+        ]
+    if snapshot is not None:
+        lines += ["", f"[메모리 — 할당 상위 {top} (프로젝트 코드 줄 기준, 종료 시점 잔존)]", f"  {'크기':>10} {'블록':>8}  위치"]
+        lines += _allocation_rows(snapshot, top) or ["  (프로젝트 코드에서 남은 할당 없음)"]
+    return "\n".join(lines) + "\n"
+
+
+# ─── 세션 ──────────────────────────────────────────────────────────────────
+
+@contextmanager
+def profile_session(
+    label: str,
+    out_dir: str = PROFILE_DIR,
+    memory: bool = True,
+    wait: bool = True,
+) -> Iterator[ProfileSession]:
+    """
+    블록 실행을 프로파일링하고, 끝나면 session.report 에 결과를 채웁니다.
+
+    wait=False 이면 다른 세션이 진행 중일 때 기다리지 않고 ProfilerBusy 를 던집니다.
+    """
+    if not _session_lock.acquire(blocking=wait):
+        raise ProfilerBusy("다른 프로파일링 세션이 진행 중입니다")
+    global _active_thread
+    session = ProfileSession(label)
+    tracker = _StageTracker(threading.get_ident())
+    started_tracing = memory and not tracemalloc.is_tracing()
+    _active_thread = tracker.thread_id
+    try:
+        if started_tracing:
+            tracemalloc.start(PROFILE_TRACE_FRAMES)
+        if memory:
+            metrics.set_stage_observer(tracker)
+        profiler = cProfile.Profile()
+        started = time.perf_counter()
+        profiler.enable()
+        try:
+            yield session
+        finally:
+            profiler.disable()
+            wall = time.perf_counter() - started
+            metrics.set_stage_observer(None)
+            snapshot = tracemalloc.take_snapshot() if memory else None
+            peak = max(tracemalloc.get_traced_memory()[1], tracker.peak) if memory else 0
+            if started_tracing:
+                tracemalloc.stop()
+            session.report = _write_report(label, out_dir, wall, profiler, snapshot, peak, dict(tracker.stages))
+    finally:
+        _active_thread = None
+        _session_lock.release()
+
+
+def _write_report(
+    label: str,
+    out_dir: str,
+    wall: float,
+    profiler: cProfile.Profile,
+    snapshot: Optional[tracemalloc.Snapshot],
+    peak: int,
+    stages: dict[str, StageMemory],
+) -> ProfileReport:
+    name = f"{re.sub(r'[^0-9A-Za-z._-]', '_', label)}-{datetime.now().strftime('%Y%m%dT%H%M%S%f')}"
+    directory = Path(out_dir)
+    directory.mkdir(parents=True, exist_ok=True)
+    prof_path = directory / f"{name}.prof"
+    summary_path = directory / f"{name}.txt"
+    profiler.dump_stats(str(prof_path))
+    stats = pstats.Stats(profiler, stream=io.StringIO())
+    summary = summarize(name, wall, stats, snapshot, peak, stages)
+    summary_path.write_text(summary, encoding="utf-8")
+    return ProfileReport(name, wall, prof_path, summary_path, summary, stages)
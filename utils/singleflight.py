@@ -0,0 +1,64 @@
+"""
+Single-flight 요청 병합 — 같은 키의 동시 호출을 진행 중인 한 번의 계산으로 합칩니다.
+
+먼저 도착한 스레드(leader)만 함수를 실행하고, 그 사이 같은 키로 들어온 스레드는
+결과를 기다렸다가 같은 값(또는 같은 예외)을 받습니다. 계산이 끝나면 키는 즉시
+해제되므로 결과를 보관하지 않습니다 (캐시는 호출 측의 몫).
+"""
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Hashable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """키별 진행 중 계산을 공유합니다 (스레드 안전)."""
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, _Call] = {}
+        self._lock = threading.Lock()
+        self.calls = 0        # 실제 실행 횟수
+        self.coalesced = 0    # 진행 중 계산에 합류한 횟수
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """key 로 진행 중인 계산이 있으면 그 결과를 기다리고, 없으면 fn() 을 실행합니다."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.calls += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls)